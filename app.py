@@ -1,32 +1,72 @@
 #!/usr/bin/env python3
 
+import os
+
+# Skip stack-trace capture on every construct/token during synth; must be set
+# before aws_cdk (and the jsii runtime) is loaded.
+os.environ.setdefault("CDK_DISABLE_STACK_TRACE", "1")
+
 import aws_cdk as cdk
 
-from infrastructure.stacks.knowlio_stack import KnowlioStack
-from infrastructure.stacks.knowlio_dynamodb_tables_stack import DynamoDBStack
-from infrastructure.stacks.auth_stack import AuthStack
-from infrastructure.stacks.opensearch_serverless_stack import OpenSearchServerlessStack
+# No CDKMetadata/analytics resources in the templates: smaller templates and
+# less serialization work per construct during synth
+app = cdk.App(analytics_reporting=False)
+
+# Common environment for all stacks, built once and shared by reference.
+# Account/region live in cdk.json context so they can be changed (or
+# overridden with -c) without editing this file.
+ENV = cdk.Environment(
+    account=app.node.try_get_context("knowlio:account"),
+    region=app.node.try_get_context("knowlio:region"),
+)
+
+# Stacks share values through SSM parameters in the same ENV, so CDK's
+# cross-region reference machinery stays off.
+CROSS_REGION_REFERENCES = False
 
-app = cdk.App()
+# Optional comma-separated subset of stacks to build, e.g.
+# `cdk synth -c knowlio:stacks=AuthStack`. Independent stacks can then be
+# synthesized in separate processes in parallel (see `make synth-parallel`).
+# KnowlioStack reads its inputs from SSM, so it can be built on its own.
+# Each stack module is imported only when its stack is selected, so a subset
+# synth doesn't load the construct libraries of the other stacks.
+_selected_stacks = app.node.try_get_context("knowlio:stacks")
+SELECTED_STACKS = set(_selected_stacks.split(",")) if _selected_stacks else None
+
+
+def _is_selected(*stack_names: str) -> bool:
+    return SELECTED_STACKS is None or any(name in SELECTED_STACKS for name in stack_names)
 
-# Common environment for all stacks
-env = cdk.Environment(account='916863633553', region='us-west-2')
 
 # Deploy DynamoDBStack
-DynamoDBStack(app, "DynamoDBStack", env=env)
+dynamodb_stack = None
+if _is_selected("DynamoDBStack"):
+    from infrastructure.stacks.knowlio_dynamodb_tables_stack import DynamoDBStack
+    dynamodb_stack = DynamoDBStack(app, "DynamoDBStack", env=ENV, cross_region_references=CROSS_REGION_REFERENCES)
 
 # Deploy OpenSearchServerlessStack
-opensearch_serverless_stack = OpenSearchServerlessStack(app, "OpenSearchServerlessStack", env=env)
+opensearch_serverless_stack = None
+if _is_selected("OpenSearchServerlessStack"):
+    from infrastructure.stacks.opensearch_serverless_stack import OpenSearchServerlessStack
+    opensearch_serverless_stack = OpenSearchServerlessStack(app, "OpenSearchServerlessStack", env=ENV, cross_region_references=CROSS_REGION_REFERENCES)
 
 # Deploy AuthStack
 # Note: Set GOOGLE_OAUTH_CLIENT_ID and GOOGLE_OAUTH_CLIENT_SECRET environment variables before deployment
-auth_stack = AuthStack(app, "AuthStack", env=env)
-
-# Deploy KnowlioStack with reference to AuthStack for Cognito integration
-# and OpenSearchServerlessStack for search capabilities
-KnowlioStack(app, "KnowlioStack",
-    auth_stack=auth_stack,  # Pass auth_stack for Cognito integration
-    opensearch_stack=opensearch_serverless_stack,  # Pass opensearch_stack for search capabilities
-    env=env)
+auth_stack = None
+if _is_selected("AuthStack"):
+    from infrastructure.stacks.auth_stack import AuthStack
+    auth_stack = AuthStack(app, "AuthStack", env=ENV, cross_region_references=CROSS_REGION_REFERENCES)
+
+# Deploy KnowlioStack. It reads OpenSearch values from SSM parameters published
+# by OpenSearchServerlessStack and its Lambdas write the DynamoDBStack tables
+# by name; the dependencies below only order deployment.
+if _is_selected("KnowlioStack"):
+    from infrastructure.stacks.knowlio_stack import KnowlioStack
+    knowlio_stack = KnowlioStack(app, "KnowlioStack",
+        env=ENV,
+        cross_region_references=CROSS_REGION_REFERENCES)
+    for producer_stack in (dynamodb_stack, opensearch_serverless_stack, auth_stack):
+        if producer_stack is not None:
+            knowlio_stack.add_dependency(producer_stack)
 
 app.synth()
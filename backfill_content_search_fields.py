@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+One-time backfill of the search fields on content items written before
+ContentHelper started maintaining them: the lowercased title_lc/tags_lc copies
+and the content_tags inverted index rows.
+
+Tag rows are keyed by the lowercased tag (as in tags_lc); rows left keyed by a
+tag's original casing are deleted.
+
+Safe to re-run: only items still missing title_lc are updated, and tag rows are
+plain puts keyed by (tag, content_id).
+Usage: python backfill_content_search_fields.py [table_name] [tags_table_name]
+"""
+
+import sys
+
+import boto3
+from boto3.dynamodb.conditions import Attr
+
+DEFAULT_TABLE_NAME = "content"
+DEFAULT_TAGS_TABLE_NAME = "content_tags"
+
+
+def backfill(table_name: str = DEFAULT_TABLE_NAME) -> int:
+    table = boto3.resource("dynamodb").Table(table_name)
+    scan_kwargs = {
+        "ProjectionExpression": "content_id, title, tags",
+        "FilterExpression": Attr("title_lc").not_exists(),
+    }
+    updated = 0
+
+    while True:
+        response = table.scan(**scan_kwargs)
+        for item in response.get("Items", []):
+            table.update_item(
+                Key={"content_id": item["content_id"]},
+                UpdateExpression="SET title_lc = :title_lc, tags_lc = :tags_lc",
+                ExpressionAttributeValues={
+                    ":title_lc": str(item.get("title", "")).lower(),
+                    ":tags_lc": [str(tag).lower() for tag in item.get("tags", [])],
+                },
+            )
+            updated += 1
+
+        if "LastEvaluatedKey" not in response:
+            return updated
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def backfill_tag_index(table_name: str = DEFAULT_TABLE_NAME, tags_table_name: str = DEFAULT_TAGS_TABLE_NAME) -> int:
+    dynamodb = boto3.resource("dynamodb")
+    table = dynamodb.Table(table_name)
+    scan_kwargs = {"ProjectionExpression": "content_id, tags"}
+    written = 0
+
+    with dynamodb.Table(tags_table_name).batch_writer() as batch:
+        while True:
+            response = table.scan(**scan_kwargs)
+            for item in response.get("Items", []):
+                tags = item.get("tags", [])
+                tags = {tag.lower() for tag in (tags if isinstance(tags, list) else [tags]) if isinstance(tag, str) and tag}
+                for tag in tags:
+                    batch.put_item(Item={"tag": tag, "content_id": item["content_id"]})
+                    written += 1
+
+            if "LastEvaluatedKey" not in response:
+                return written
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+def delete_mixed_case_tag_rows(tags_table_name: str = DEFAULT_TAGS_TABLE_NAME) -> int:
+    table = boto3.resource("dynamodb").Table(tags_table_name)
+    # Rows hold only their (tag, content_id) key, so there is nothing to project away
+    scan_kwargs = {}
+    deleted = 0
+
+    with table.batch_writer() as batch:
+        while True:
+            response = table.scan(**scan_kwargs)
+            for row in response.get("Items", []):
+                if row["tag"] != row["tag"].lower():
+                    batch.delete_item(Key={"tag": row["tag"], "content_id": row["content_id"]})
+                    deleted += 1
+
+            if "LastEvaluatedKey" not in response:
+                return deleted
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+if __name__ == "__main__":
+    table_name = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TABLE_NAME
+    tags_table_name = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_TAGS_TABLE_NAME
+    print(f"Backfilled {backfill(table_name)} items in {table_name}")
+    print(f"Wrote {backfill_tag_index(table_name, tags_table_name)} tag rows to {tags_table_name}")
+    print(f"Deleted {delete_mixed_case_tag_rows(tags_table_name)} mixed-case tag rows from {tags_table_name}")
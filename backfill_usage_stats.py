@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+One-time backfill of the usage_stats report counters from the logs already in
+usage_logs_v2 (run migrate_usage_logs.py first). Until it completes, usage
+reports keep counting the logs themselves, since the counters only cover logs
+written after they were added.
+
+Safe to re-run, and to run while logs are being written: each log is counted
+once, so logs the stream consumer already counted are skipped.
+Usage: python backfill_usage_stats.py [usage_logs_table_name]
+"""
+
+import sys
+from pathlib import Path
+
+import boto3
+
+DEFAULT_TABLE_NAME = "usage_logs_v2"
+REPO_ROOT = Path(__file__).resolve().parent
+
+
+def backfill(table_name: str = DEFAULT_TABLE_NAME) -> int:
+    from helpers.app_logic_helpers.usage_stats_helper import UsageStatsHelper
+
+    stats = UsageStatsHelper()
+    table = boto3.resource("dynamodb").Table(table_name)
+    scan_kwargs = {}
+    counted = 0
+
+    while True:
+        response = table.scan(**scan_kwargs)
+        counted += sum(stats.record_log(log) for log in response.get("Items", []))
+
+        if "LastEvaluatedKey" not in response:
+            stats.mark_backfilled()
+            return counted
+        scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+if __name__ == "__main__":
+    table_name = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_TABLE_NAME
+    sys.path.insert(0, str(REPO_ROOT / "src"))
+    print(f"Counted {backfill(table_name)} logs from {table_name} into usage_stats")
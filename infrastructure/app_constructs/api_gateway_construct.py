@@ -8,11 +8,19 @@ from aws_cdk import (
     aws_lambda as lambda_,
 )
 from constructs import Construct
-from typing import List, Dict, Optional
+from typing import Dict, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+# CORS headers every Lambda-backed method declares in its 200 response
+CORS_METHOD_RESPONSE_PARAMETERS = {
+    "method.response.header.Access-Control-Allow-Origin": True,
+    "method.response.header.Access-Control-Allow-Headers": True,
+    "method.response.header.Access-Control-Allow-Methods": True,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ApiGatewayProps:
     """Configuration properties for API Gateway"""
     api_name: str
@@ -20,24 +28,26 @@ class ApiGatewayProps:
     stage_name: str = "prod"
     throttling_rate_limit: int = 1000
     throttling_burst_limit: int = 2000
-    cors_allow_origins: List[str] = None
-    cors_allow_methods: List[str] = None
-    cors_allow_headers: List[str] = None
+    cors_allow_origins: Tuple[str, ...] = ("*",)
+    cors_allow_methods: Tuple[str, ...] = ("GET", "POST", "PUT", "DELETE", "OPTIONS")
+    cors_allow_headers: Tuple[str, ...] = (
+        "Content-Type",
+        "X-Amz-Date",
+        "Authorization",
+        "X-Api-Key",
+        "X-Amz-Security-Token",
+    )
     cors_allow_credentials: bool = True
 
-    def __post_init__(self):
-        if self.cors_allow_origins is None:
-            self.cors_allow_origins = ["*"]
-        if self.cors_allow_methods is None:
-            self.cors_allow_methods = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
-        if self.cors_allow_headers is None:
-            self.cors_allow_headers = [
-                "Content-Type",
-                "X-Amz-Date",
-                "Authorization", 
-                "X-Api-Key",
-                "X-Amz-Security-Token",
-            ]
+    @property
+    def cors_allow_headers_value(self) -> str:
+        """Allowed headers as the comma-separated value echoed in responses"""
+        return ','.join(self.cors_allow_headers)
+
+    @property
+    def cors_allow_methods_value(self) -> str:
+        """Allowed methods as the comma-separated value echoed in responses"""
+        return ','.join(self.cors_allow_methods)
 
 
 @dataclass
@@ -52,24 +62,39 @@ class ApiGatewayConstruct(Construct):
     """
     Generic API Gateway construct that creates a REST API with Lambda Proxy Integration.
     Business logic should be provided externally.
+    
+    Every route is proxied to a single routing Lambda, which dispatches internally
+    on the request path/method. Keeping one function behind the whole API shares
+    warm containers (and any provisioned concurrency) across all endpoints.
     """
     
     def __init__(
         self, 
         scope: Construct, 
         construct_id: str, 
-        lambda_function: lambda_.Function,
+        routing_lambda: lambda_.IFunction,
         props: ApiGatewayProps,
-        routes: List[RouteDefinition] = None
+        routes: Optional[Sequence[RouteDefinition]] = None
     ) -> None:
         super().__init__(scope, construct_id)
         
-        self.lambda_function = lambda_function
+        self.lambda_function = routing_lambda
         self.props = props
         
+        # Method responses shared by every route; built once and reused by reference
+        self._method_responses = [
+            apigateway.MethodResponse(
+                status_code="200",
+                response_parameters=CORS_METHOD_RESPONSE_PARAMETERS
+            )
+        ]
+        
         # Create the REST API
         self.api = self._create_rest_api()
         
+        # Resources created so far, shared by add_route and add_custom_integration
+        self._resource_trie: Dict[str, Tuple[apigateway.Resource, Dict]] = {}
+        
         # Create Lambda integration
         self.lambda_integration = self._create_lambda_integration()
         
@@ -109,50 +134,21 @@ class ApiGatewayConstruct(Construct):
                     status_code="200",
                     response_parameters={
                         "method.response.header.Access-Control-Allow-Origin": "'*'",
-                        "method.response.header.Access-Control-Allow-Headers": f"'{','.join(self.props.cors_allow_headers)}'",
-                        "method.response.header.Access-Control-Allow-Methods": f"'{','.join(self.props.cors_allow_methods)}'"
+                        "method.response.header.Access-Control-Allow-Headers": f"'{self.props.cors_allow_headers_value}'",
+                        "method.response.header.Access-Control-Allow-Methods": f"'{self.props.cors_allow_methods_value}'"
                     }
                 )
             ]
         )
     
-    def add_routes(self, routes: List[RouteDefinition]) -> None:
+    def add_routes(self, routes: Sequence[RouteDefinition]) -> None:
         """Add multiple routes to the API"""
-        resource_cache = {}
-        
         for route in routes:
-            self.add_route(route, resource_cache)
+            self.add_route(route)
     
-    def add_route(self, route: RouteDefinition, resource_cache: Dict = None) -> apigateway.Resource:
+    def add_route(self, route: RouteDefinition) -> apigateway.Resource:
         """Add a single route to the API"""
-        if resource_cache is None:
-            resource_cache = {}
-        
-        # Build the resource hierarchy
-        current_resource = self.api.root
-        current_path = ""
-        
-        path_segments = route.path.split('/')
-        
-        for segment in path_segments:
-            if current_path:
-                current_path += f"/{segment}"
-            else:
-                current_path = segment
-            
-            # Check if we already have this resource
-            if current_path not in resource_cache:
-                # Create new resource
-                resource_cache[current_path] = current_resource.add_resource(
-                    segment,
-                    default_cors_preflight_options=apigateway.CorsOptions(
-                        allow_origins=self.props.cors_allow_origins,
-                        allow_methods=self.props.cors_allow_methods,
-                        allow_headers=self.props.cors_allow_headers
-                    )
-                )
-            
-            current_resource = resource_cache[current_path]
+        current_resource = self._build_resource_for_path(route.path)
         
         # Add the HTTP method to the final resource
         # Note: We've simplified the system by optimizing routes in knowlio_api_config.py
@@ -160,16 +156,7 @@ class ApiGatewayConstruct(Construct):
         current_resource.add_method(
             route.method,
             self.lambda_integration,
-            method_responses=[
-                apigateway.MethodResponse(
-                    status_code="200",
-                    response_parameters={
-                        "method.response.header.Access-Control-Allow-Origin": True,
-                        "method.response.header.Access-Control-Allow-Headers": True,
-                        "method.response.header.Access-Control-Allow-Methods": True,
-                    }
-                )
-            ]
+            method_responses=self._method_responses
         )
         
         return current_resource
@@ -181,17 +168,29 @@ class ApiGatewayConstruct(Construct):
         integration: apigateway.Integration
     ) -> apigateway.Resource:
         """Add a route with a custom integration (not Lambda)"""
+        if isinstance(integration, apigateway.LambdaIntegration):
+            raise ValueError(
+                "Lambda-backed routes must go through the routing Lambda; "
+                "use add_route instead of add_custom_integration"
+            )
         route = RouteDefinition(method=method, path=path)
         resource = self._build_resource_for_path(route.path)
         resource.add_method(method, integration)
         return resource
     
     def _build_resource_for_path(self, path: str) -> apigateway.Resource:
-        """Build resource hierarchy for a given path"""
+        """Build resource hierarchy for a given path, reusing resources already created"""
+        # Walk the resource hierarchy as a trie: each level maps a path segment
+        # to a (resource, children) pair, so shared prefixes are created once
         current_resource = self.api.root
-        path_segments = path.split('/')
+        children = self._resource_trie
         
-        for segment in path_segments:
-            current_resource = current_resource.add_resource(segment)
+        for segment in path.split('/'):
+            if segment not in children:
+                # Create new resource; CORS preflight options are inherited
+                # from the REST API root rather than re-specified per resource
+                children[segment] = (current_resource.add_resource(segment), {})
+            
+            current_resource, children = children[segment]
         
         return current_resource
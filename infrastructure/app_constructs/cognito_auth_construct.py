@@ -1,15 +1,25 @@
 """Cognito Authentication Construct for Knowlio"""
 
+import functools
 import os
 from constructs import Construct
 from aws_cdk import (
-    aws_cognito as cognito,
     RemovalPolicy,
     Stack,
     SecretValue
 )
 from infrastructure.config.knowlio_auth_config import AuthConfig
 
+# Google OAuth credentials are read from the environment once, at import
+_GOOGLE_CLIENT_ID = os.environ.get(AuthConfig.GOOGLE_IDP["client_id_env_var"])
+_GOOGLE_CLIENT_SECRET = os.environ.get(AuthConfig.GOOGLE_IDP["client_secret_env_var"])
+
+
+@functools.lru_cache(maxsize=8)
+def _normalize_domain_prefix(resource_prefix: str, base: str) -> str:
+    """Build a Cognito domain prefix: lowercase, with hyphens instead of underscores"""
+    return f"{resource_prefix}{base}".replace('_', '-').lower()
+
 
 class CognitoAuthConstruct(Construct):
     """Construct for creating Cognito authentication resources"""
@@ -18,6 +28,10 @@ class CognitoAuthConstruct(Construct):
                  google_client_id: str = None, google_client_secret: str = None):
         super().__init__(scope, id)
         
+        # Imported here so apps/stacks that never build auth resources don't
+        # load the Cognito jsii bindings
+        from aws_cdk import aws_cognito as cognito
+        
         self.resource_prefix = resource_prefix
         
         # Create Cognito User Pool
@@ -51,8 +65,8 @@ class CognitoAuthConstruct(Construct):
         )
         
         # Get Google OAuth credentials from environment variables or parameters
-        client_id = google_client_id or os.environ.get(AuthConfig.GOOGLE_IDP["client_id_env_var"])
-        client_secret = google_client_secret or os.environ.get(AuthConfig.GOOGLE_IDP["client_secret_env_var"])
+        client_id = google_client_id or _GOOGLE_CLIENT_ID
+        client_secret = google_client_secret or _GOOGLE_CLIENT_SECRET
         
         if not client_id or not client_secret:
             raise ValueError(
@@ -66,7 +80,7 @@ class CognitoAuthConstruct(Construct):
             client_id=client_id,
             client_secret_value=SecretValue.unsafe_plain_text(client_secret),  # Wrap in SecretValue
             user_pool=self.user_pool,
-            scopes=AuthConfig.GOOGLE_IDP["scopes"],
+            scopes=list(AuthConfig.GOOGLE_IDP["scopes"]),
             attribute_mapping=cognito.AttributeMapping(
                 email=cognito.ProviderAttribute.GOOGLE_EMAIL,
                 given_name=cognito.ProviderAttribute.GOOGLE_GIVEN_NAME,
@@ -77,9 +91,7 @@ class CognitoAuthConstruct(Construct):
         
         # Create Cognito Domain
         # Ensure domain prefix is lowercase and only contains valid characters
-        domain_prefix = f"{resource_prefix}{AuthConfig.COGNITO_DOMAIN['domain_prefix']}"
-        # Replace underscores with hyphens and convert to lowercase
-        domain_prefix = domain_prefix.replace('_', '-').lower()
+        domain_prefix = _normalize_domain_prefix(resource_prefix, AuthConfig.COGNITO_DOMAIN['domain_prefix'])
         
         self.cognito_domain = self.user_pool.add_domain(
             "CognitoDomain",
@@ -88,6 +100,10 @@ class CognitoAuthConstruct(Construct):
             )
         )
         
+        # Hosted UI host name, shared by the login/logout URL helpers
+        self._auth_domain = (f"{self.cognito_domain.domain_name}.auth."
+                             f"{Stack.of(self).region}.amazoncognito.com")
+        
         # Create User Pool App Client
         self.user_pool_client = self.user_pool.add_client(
             "UserPoolClient",
@@ -107,8 +123,8 @@ class CognitoAuthConstruct(Construct):
                     cognito.OAuthScope.EMAIL,
                     cognito.OAuthScope.PROFILE
                 ],
-                callback_urls=AuthConfig.APP_CLIENT["oauth"]["callback_urls"],
-                logout_urls=AuthConfig.APP_CLIENT["oauth"]["logout_urls"]
+                callback_urls=list(AuthConfig.APP_CLIENT["oauth"]["callback_urls"]),
+                logout_urls=list(AuthConfig.APP_CLIENT["oauth"]["logout_urls"])
             ),
             supported_identity_providers=[
                 cognito.UserPoolClientIdentityProvider.GOOGLE,
@@ -121,20 +137,16 @@ class CognitoAuthConstruct(Construct):
         
     def get_login_url(self) -> str:
         """Get the full OAuth login URL for the Cognito hosted UI"""
-        region = Stack.of(self).region
-        domain = f"{self.cognito_domain.domain_name}.auth.{region}.amazoncognito.com"
         client_id = self.user_pool_client.user_pool_client_id
         redirect_uri = AuthConfig.APP_CLIENT["oauth"]["callback_urls"][0]
         
-        return (f"https://{domain}/oauth2/authorize?"
+        return (f"https://{self._auth_domain}/oauth2/authorize?"
                 f"client_id={client_id}&response_type=code&"
                 f"scope=openid+email+profile&redirect_uri={redirect_uri}")
     
     def get_logout_url(self) -> str:
         """Get the logout URL for the Cognito hosted UI"""
-        region = Stack.of(self).region
-        domain = f"{self.cognito_domain.domain_name}.auth.{region}.amazoncognito.com"
         client_id = self.user_pool_client.user_pool_client_id
         logout_uri = AuthConfig.APP_CLIENT["oauth"]["logout_urls"][0]
         
-        return f"https://{domain}/logout?client_id={client_id}&logout_uri={logout_uri}"
+        return f"https://{self._auth_domain}/logout?client_id={client_id}&logout_uri={logout_uri}"
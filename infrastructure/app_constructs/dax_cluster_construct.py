@@ -0,0 +1,105 @@
+from constructs import Construct
+from aws_cdk import aws_dax as dax, aws_ec2 as ec2, aws_iam as iam
+from typing import Optional, Sequence
+
+from infrastructure.app_constructs.iam_role_construct import IamRole
+
+# Port DAX listens on for unencrypted client connections
+DAX_PORT = 8111
+
+
+class DaxClusterProps:
+    def __init__(
+        self,
+        cluster_name: str,
+        vpc: ec2.IVpc,
+        table_arns: Sequence[str],
+        node_type: str = "dax.t3.small",
+        replication_factor: int = 1,  # Use 3+ nodes across AZs for prod
+        record_ttl_millis: int = 300000,  # Item cache TTL
+        query_ttl_millis: int = 10000,  # Query/scan results aren't invalidated by writes, keep short
+        subnet_type: ec2.SubnetType = ec2.SubnetType.PRIVATE_WITH_EGRESS,
+        description: Optional[str] = None,
+    ):
+        self.cluster_name = cluster_name
+        self.vpc = vpc
+        self.table_arns = list(table_arns)  # Tables (and their indexes) the cluster may cache
+        self.node_type = node_type
+        self.replication_factor = replication_factor
+        self.record_ttl_millis = record_ttl_millis
+        self.query_ttl_millis = query_ttl_millis
+        self.subnet_type = subnet_type
+        self.description = description
+
+
+class DaxClusterConstruct(Construct):
+    """DAX cluster (with its subnet group, parameter group, service role and security group)"""
+
+    def __init__(self, scope: Construct, id: str, props: DaxClusterProps) -> None:
+        super().__init__(scope, id)
+
+        # DAX reads and writes DynamoDB on the caller's behalf through this role
+        service_role = IamRole(
+            self, "ServiceRole",
+            assumed_by=iam.ServicePrincipal("dax.amazonaws.com"),
+            description="Role for DAX to access DynamoDB"
+        ).role
+        service_role.add_to_policy(iam.PolicyStatement(
+            actions=[
+                "dynamodb:GetItem",
+                "dynamodb:PutItem",
+                "dynamodb:UpdateItem",
+                "dynamodb:DeleteItem",
+                "dynamodb:Query",
+                "dynamodb:Scan",
+                "dynamodb:BatchGetItem",
+                "dynamodb:BatchWriteItem",
+                "dynamodb:ConditionCheckItem",
+                "dynamodb:DescribeTable",
+            ],
+            resources=props.table_arns + [f"{table_arn}/index/*" for table_arn in props.table_arns]
+        ))
+
+        self.security_group = ec2.SecurityGroup(
+            self, "SecurityGroup",
+            vpc=props.vpc,
+            description=f"Client access to the {props.cluster_name} DAX cluster",
+        )
+
+        subnet_group = dax.CfnSubnetGroup(
+            self, "SubnetGroup",
+            subnet_group_name=f"{props.cluster_name}-subnets",
+            subnet_ids=props.vpc.select_subnets(subnet_type=props.subnet_type).subnet_ids,
+        )
+
+        parameter_group = dax.CfnParameterGroup(
+            self, "ParameterGroup",
+            parameter_group_name=f"{props.cluster_name}-params",
+            parameter_name_values={
+                "record-ttl-millis": str(props.record_ttl_millis),
+                "query-ttl-millis": str(props.query_ttl_millis),
+            },
+        )
+
+        self.cluster = dax.CfnCluster(
+            self, "Cluster",
+            cluster_name=props.cluster_name,
+            description=props.description,
+            iam_role_arn=service_role.role_arn,
+            node_type=props.node_type,
+            replication_factor=props.replication_factor,
+            subnet_group_name=subnet_group.ref,
+            parameter_group_name=parameter_group.ref,
+            security_group_ids=[self.security_group.security_group_id],
+            sse_specification=dax.CfnCluster.SSESpecificationProperty(sse_enabled=True),
+        )
+        self.cluster.add_dependency(subnet_group)
+        self.cluster.add_dependency(parameter_group)
+        self.cluster.node.add_dependency(service_role)
+
+        self.cluster_arn = self.cluster.attr_arn
+        self.discovery_endpoint_url = self.cluster.attr_cluster_discovery_endpoint_url
+
+    def allow_client(self, client: ec2.IConnectable) -> None:
+        """Open the DAX port to a client (e.g. a VPC-attached Lambda)"""
+        self.security_group.connections.allow_from(client, ec2.Port.tcp(DAX_PORT), "DAX client access")
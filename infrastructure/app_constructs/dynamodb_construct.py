@@ -19,6 +19,11 @@ class DynamoDBTableProps:
         sort_key_type: Optional[dynamodb.AttributeType] = None,
         billing_mode: dynamodb.BillingMode = dynamodb.BillingMode.PAY_PER_REQUEST,
         removal_policy: RemovalPolicy = RemovalPolicy.RETAIN,  # Use RETAIN for prod
+        point_in_time_recovery: bool = False,  # Off by default to keep dev table creation fast
+        deletion_protection: bool = False,
+        contributor_insights: bool = False,
+        encryption: dynamodb.TableEncryption = dynamodb.TableEncryption.AWS_OWNED,  # No KMS calls or charges
+        table_class: dynamodb.TableClass = dynamodb.TableClass.STANDARD,
     ):
         self.table_name = table_name
         self.partition_key_name = partition_key_name
@@ -27,6 +32,11 @@ class DynamoDBTableProps:
         self.sort_key_type = sort_key_type
         self.billing_mode = billing_mode
         self.removal_policy = removal_policy
+        self.point_in_time_recovery = point_in_time_recovery
+        self.deletion_protection = deletion_protection
+        self.contributor_insights = contributor_insights
+        self.encryption = encryption
+        self.table_class = table_class
 
 
 class DynamoDBTableConstruct(Construct):
@@ -41,6 +51,13 @@ class DynamoDBTableConstruct(Construct):
             "table_name": props.table_name,
             "billing_mode": props.billing_mode,
             "removal_policy": props.removal_policy,
+            "point_in_time_recovery_specification": dynamodb.PointInTimeRecoverySpecification(
+                point_in_time_recovery_enabled=props.point_in_time_recovery,
+            ),
+            "deletion_protection": props.deletion_protection,
+            "contributor_insights_enabled": props.contributor_insights,
+            "encryption": props.encryption,
+            "table_class": props.table_class,
         }
 
         if props.sort_key_name and props.sort_key_type:
@@ -19,7 +19,8 @@ class IamRole(Construct):
             self, "IamRole",
             assumed_by=assumed_by,
             role_name=role_name,
-            managed_policies=managed_policies or [],
-            inline_policies=inline_policies or {},
+            # iam.Role treats None as "no policies", so don't allocate empty defaults
+            managed_policies=managed_policies,
+            inline_policies=inline_policies,
             description=description,
         )
\ No newline at end of file
@@ -1,7 +1,8 @@
 from constructs import Construct
-from aws_cdk import aws_lambda as _lambda, Duration
+from aws_cdk import aws_lambda as _lambda, AssetHashType, BundlingOptions, Duration, Size
+from aws_cdk import aws_ec2 as ec2
 from aws_cdk import aws_iam as iam
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 
 class LambdaFunctionConstructProps:
     def __init__(
@@ -12,9 +13,17 @@ class LambdaFunctionConstructProps:
         function_name: Optional[str] = None,
         environment: Optional[Dict[str, str]] = None,
         timeout_seconds: Optional[int] = 900,  # 15 minutes default
-        memory_size_mb: Optional[int] = 128,
+        memory_size_mb: Optional[int] = 512,
+        ephemeral_storage_mb: Optional[int] = 512,  # /tmp size
         runtime: Optional[_lambda.Runtime] = None,
+        architecture: Optional[_lambda.Architecture] = None,
+        bundling: Optional[BundlingOptions] = None,
         lambda_role: Optional[iam.IRole] = None,
+        provisioned_concurrency: Optional[int] = None,
+        snap_start: bool = False,
+        vpc: Optional[ec2.IVpc] = None,
+        vpc_subnets: Optional[ec2.SubnetSelection] = None,
+        security_groups: Optional[List[ec2.ISecurityGroup]] = None,
     ):
         self.id = id
         self.handler = handler
@@ -23,8 +32,16 @@ class LambdaFunctionConstructProps:
         self.environment = environment or {}
         self.timeout_seconds = timeout_seconds
         self.memory_size_mb = memory_size_mb
+        self.ephemeral_storage_mb = ephemeral_storage_mb
         self.runtime = runtime or _lambda.Runtime.PYTHON_3_11
+        self.architecture = architecture or _lambda.Architecture.ARM_64  # Graviton
+        self.bundling = bundling
         self.lambda_role = lambda_role
+        self.provisioned_concurrency = provisioned_concurrency
+        self.snap_start = snap_start  # Only honoured by runtimes that support SnapStart
+        self.vpc = vpc
+        self.vpc_subnets = vpc_subnets
+        self.security_groups = security_groups
 
 class LambdaConstruct(Construct):
     def __init__(self, scope: Construct, id: str, props: LambdaFunctionConstructProps):
@@ -33,11 +50,43 @@ class LambdaConstruct(Construct):
         self.lambda_function = _lambda.Function(
             self, props.id,
             runtime=props.runtime,
+            architecture=props.architecture,
             handler=props.handler,
-            code=_lambda.Code.from_asset(props.code_path),
+            code=self._create_code(props),
             timeout=Duration.seconds(props.timeout_seconds),
             memory_size=props.memory_size_mb,
+            ephemeral_storage_size=Size.mebibytes(props.ephemeral_storage_mb),
             environment=props.environment,
             role=props.lambda_role,
             function_name=props.function_name,
+            snap_start=_lambda.SnapStartConf.ON_PUBLISHED_VERSIONS if props.snap_start else None,
+            vpc=props.vpc,
+            vpc_subnets=props.vpc_subnets,
+            security_groups=props.security_groups,
+        )
+
+        # Provisioned concurrency and SnapStart only apply to published versions,
+        # so front those with a "live" alias; callers should invoke the alias
+        # rather than $LATEST to hit the warmed instances.
+        self.alias = None
+        if props.provisioned_concurrency or props.snap_start:
+            self.alias = _lambda.Alias(
+                self, "Live",
+                alias_name="live",
+                version=self.lambda_function.current_version,
+                provisioned_concurrent_executions=props.provisioned_concurrency,
+            )
+
+    @staticmethod
+    def _create_code(props: LambdaFunctionConstructProps) -> _lambda.Code:
+        """Asset code for the function, optionally bundled (e.g. with pip dependencies);
+        bundled assets are keyed on their output hash"""
+        if props.bundling is None:
+            return _lambda.Code.from_asset(props.code_path)
+        # Hashing the bundler output lets repeated synths reuse the cached asset
+        # whenever the bundle itself hasn't changed
+        return _lambda.Code.from_asset(
+            props.code_path,
+            asset_hash_type=AssetHashType.OUTPUT,
+            bundling=props.bundling,
         )
\ No newline at end of file
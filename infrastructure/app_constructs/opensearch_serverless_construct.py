@@ -1,8 +1,9 @@
 """OpenSearch Serverless Construct for Knowlio"""
 
+import hashlib
+import json
+
 from aws_cdk import (
-    aws_opensearchserverless as opensearchserverless,
-    aws_iam as iam,
     RemovalPolicy,
     CfnOutput,
     Stack,
@@ -12,6 +13,11 @@ from constructs import Construct
 from typing import Optional, List
 
 
+def _compact_json(document) -> str:
+    """Serialize a policy document without insignificant whitespace"""
+    return json.dumps(document, separators=(",", ":"))
+
+
 class OpenSearchServerlessProps:
     def __init__(
         self,
@@ -30,6 +36,10 @@ class OpenSearchServerlessConstruct(Construct):
     def __init__(self, scope: Construct, id: str, props: OpenSearchServerlessProps):
         super().__init__(scope, id)
 
+        # Imported here so stacks that never build a collection don't load the
+        # OpenSearch Serverless jsii bindings
+        from aws_cdk import aws_opensearchserverless as opensearchserverless
+
         # Ensure collection name is lowercase and has no underscores for DNS compatibility
         collection_name = props.collection_name.lower().replace('_', '-')
         
@@ -46,8 +56,10 @@ class OpenSearchServerlessConstruct(Construct):
         # Generate short policy names - must be under 32 chars and match pattern ^[a-z][a-z0-9-]{2,31}$
         # Use a prefix and a hash of the collection name to ensure uniqueness while staying short
         prefix = "kn"
-        name_hash = abs(hash(collection_name)) % 10000  # Get a short numeric hash
+        # hash() is salted per process, so use a stable digest to keep names identical across synths
+        name_hash = int(hashlib.blake2b(collection_name.encode(), digest_size=2).hexdigest(), 16) % 10000
         policy_base = f"{prefix}-{name_hash}"
+        collection_resource = [f"collection/{collection_name}"]
         
         # Create encryption policy (required)
         encryption_policy = opensearchserverless.CfnSecurityPolicy(
@@ -55,7 +67,10 @@ class OpenSearchServerlessConstruct(Construct):
             "EncryptionPolicy",
             name=f"{policy_base}-enc",  # Short name: prefix + hash + type
             type="encryption",
-            policy=f'{{"Rules":[{{"ResourceType":"collection","Resource":["collection/{collection_name}"]}}],"AWSOwnedKey":true}}',
+            policy=_compact_json({
+                "Rules": [{"ResourceType": "collection", "Resource": collection_resource}],
+                "AWSOwnedKey": True,
+            }),
             description="Default encryption policy using AWS owned keys"
         )
         
@@ -65,7 +80,13 @@ class OpenSearchServerlessConstruct(Construct):
             "NetworkPolicy",
             name=f"{policy_base}-net",  # Short name: prefix + hash + type
             type="network",
-            policy=f'[{{"Rules":[{{"ResourceType":"dashboard","Resource":["collection/{collection_name}"]}},{{"ResourceType":"collection","Resource":["collection/{collection_name}"]}}],"AllowFromPublic":true}}]',
+            policy=_compact_json([{
+                "Rules": [
+                    {"ResourceType": "dashboard", "Resource": collection_resource},
+                    {"ResourceType": "collection", "Resource": collection_resource},
+                ],
+                "AllowFromPublic": True,
+            }]),
             description="Network policy allowing public access for development"
         )
         
@@ -77,7 +98,11 @@ class OpenSearchServerlessConstruct(Construct):
             "DataAccessPolicy",
             name=f"{policy_base}-data",  # Short name: prefix + hash + type
             type="data",
-            policy=f'[{{"Description":"Access for Lambda role","Rules":[{{"ResourceType":"collection","Resource":["collection/{collection_name}"],"Permission":["aoss:*"]}}],"Principal":["arn:aws:iam::{account_id}:root"]}}]',
+            policy=_compact_json([{
+                "Description": "Access for Lambda role",
+                "Rules": [{"ResourceType": "collection", "Resource": collection_resource, "Permission": ["aoss:*"]}],
+                "Principal": [f"arn:aws:iam::{account_id}:root"],
+            }]),
             description="Data access policy for Lambda execution role"
         )
         
@@ -3,9 +3,99 @@ Knowlio-specific API Gateway configuration.
 Business logic for setting up the Knowlio REST API using the generic API Gateway construct.
 """
 
-from typing import List
+import functools
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Dict, List, Tuple
 from infrastructure.app_constructs.api_gateway_construct import ApiGatewayProps, RouteDefinition
-from infrastructure.config.api_routes import KnowlioApiRoutes
+
+# The route table is imported where it is used, so reading the gateway props
+# alone does not load it
+if TYPE_CHECKING:
+    from src.config.api_routes import ApiRoute
+
+# Path bases served through a greedy {proxy+} resource, in emission order
+GREEDY_PATH_BASES = ("users", "content", "licenses", "analytics", "books", "uploads")
+GREEDY_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH")
+
+# Membership set, per-method bit flags and {proxy+} resource paths, built once
+# rather than per route. Bit i stands for GREEDY_METHODS[i].
+_GREEDY_PATH_BASE_SET = frozenset(GREEDY_PATH_BASES)
+_GREEDY_METHOD_BITS = {method: 1 << index for index, method in enumerate(GREEDY_METHODS)}
+_GREEDY_PROXY_PATHS = {path_base: f"{path_base}/{{proxy+}}" for path_base in GREEDY_PATH_BASES}
+
+
+@functools.lru_cache(maxsize=1)
+def _build_route_definitions() -> Tuple[RouteDefinition, ...]:
+    """Collect the methods used under each path base in a single pass and emit definitions."""
+    from src.config.api_routes import KnowlioApiRoutes
+    
+    # Group common routes by method to reduce IAM policy size
+    # Use method-based grouping instead of path wildcards since API Gateway doesn't allow * in paths
+    base_method_bits: Dict[str, int] = defaultdict(int)
+    uncovered: List["ApiRoute"] = []
+    for route in KnowlioApiRoutes.get_all_routes():
+        path_base = route.path_segments[0]
+        method_bit = _GREEDY_METHOD_BITS.get(route.method)
+        if len(route.path_segments) > 1 and path_base in _GREEDY_PATH_BASE_SET and method_bit:
+            base_method_bits[path_base] |= method_bit
+        else:
+            uncovered.append(route)
+    
+    # Greedy routes first: API Gateway allows {proxy+} for greedy path parameters.
+    # Only the methods actually used under each base are visited, lowest bit first
+    route_definitions = []
+    for path_base in GREEDY_PATH_BASES:
+        bits = base_method_bits.get(path_base, 0)
+        while bits:
+            lowest_bit = bits & -bits
+            bits ^= lowest_bit
+            method = GREEDY_METHODS[lowest_bit.bit_length() - 1]
+            route_definitions.append(RouteDefinition(
+                method=method,
+                path=_GREEDY_PROXY_PATHS[path_base],
+                description=f"{method} requests for {path_base}"
+            ))
+    
+    # Then any routes that weren't covered by greedy paths
+    seen = set()
+    for route in uncovered:
+        route_key = (route.method, route.path)
+        if route_key not in seen:
+            seen.add(route_key)
+            route_definitions.append(RouteDefinition(
+                method=route.method,
+                path=route.path,
+                description=route.description
+            ))
+    
+    return tuple(route_definitions)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_route_indexes() -> Tuple[Dict[str, List[Dict[str, str]]], Counter, Counter]:
+    """Build the category listing and method/processor counts in one pass."""
+    from src.config.api_routes import KnowlioApiRoutes
+    
+    routes = KnowlioApiRoutes.get_all_routes()
+    
+    by_category: Dict[str, List[Dict[str, str]]] = {
+        "user": [],
+        "content": [],
+        "license": [],
+        "analytics": []
+    }
+    for route in routes:
+        if route.processor_name in by_category:
+            by_category[route.processor_name].append({
+                "method": route.method,
+                "path": route.path,
+                "action": route.action,
+                "description": route.description
+            })
+    
+    methods = Counter(route.method for route in routes)
+    processors = Counter(route.processor_name for route in routes)
+    return by_category, methods, processors
 
 
 class KnowlioApiConfig:
@@ -24,94 +114,26 @@ class KnowlioApiConfig:
         )
     
     @staticmethod
-    def get_route_definitions() -> List[RouteDefinition]:
+    def get_route_definitions() -> Tuple[RouteDefinition, ...]:
         """Convert KnowlioApiRoutes to generic RouteDefinition format."""
-        knowlio_routes = KnowlioApiRoutes.get_all_routes()
-        
-        # Group common routes by method to reduce IAM policy size
-        # Use method-based grouping instead of path wildcards since API Gateway doesn't allow * in paths
-        route_definitions = []
-        processed_paths = set()
-        
-        # First pass: Add routes with greedy path parameters where possible
-        # API Gateway allows {proxy+} for greedy path parameters
-        for path_base in ["users", "content", "licenses", "analytics", "books", "uploads"]:
-            # Add base path with greedy parameter for each HTTP method
-            for method in ["GET", "POST", "PUT", "DELETE", "PATCH"]:
-                # Check if any route matches this pattern
-                has_matching_routes = False
-                for route in knowlio_routes:
-                    if route.path.startswith(f"{path_base}/") and route.method == method:
-                        has_matching_routes = True
-                        break
-                
-                if has_matching_routes:
-                    # Add a greedy route for this base path and method
-                    route_def = RouteDefinition(
-                        method=method,
-                        # Use API Gateway's greedy path parameter syntax
-                        path=f"{path_base}/{{proxy+}}",
-                        description=f"{method} requests for {path_base}"
-                    )
-                    route_definitions.append(route_def)
-                    # Mark all matching routes as processed
-                    for route in knowlio_routes:
-                        if route.path.startswith(f"{path_base}/") and route.method == method:
-                            processed_paths.add(f"{route.method}:{route.path}")
-        
-        # Second pass: Add any routes that weren't covered by greedy paths
-        for route in knowlio_routes:
-            route_key = f"{route.method}:{route.path}"
-            if route_key not in processed_paths:
-                route_def = RouteDefinition(
-                    method=route.method,
-                    path=route.path,
-                    description=route.description
-                )
-                route_definitions.append(route_def)
-                processed_paths.add(route_key)
-        
-        return route_definitions
+        # The route table is static, so the definitions are built once and shared
+        return _build_route_definitions()
     
     @staticmethod
     def get_routes_by_category():
         """Get routes organized by category for documentation/debugging"""
-        all_routes = KnowlioApiRoutes.get_all_routes()
-        
-        categories = {
-            "user": [],
-            "content": [],
-            "license": [],
-            "analytics": []
-        }
-        
-        for route in all_routes:
-            if route.processor_name in categories:
-                categories[route.processor_name].append({
-                    "method": route.method,
-                    "path": route.path,
-                    "action": route.action,
-                    "description": route.description
-                })
-        
-        return categories
+        by_category, _, _ = _build_route_indexes()
+        return {category: list(routes) for category, routes in by_category.items()}
     
     @staticmethod
     def get_api_summary():
         """Get a summary of the API for logging/documentation"""
-        routes = KnowlioApiRoutes.get_all_routes()
+        from src.config.api_routes import KnowlioApiRoutes
         
-        summary = {
-            "total_routes": len(routes),
-            "methods": {},
-            "processors": {},
-        }
-        
-        for route in routes:
-            # Count methods
-            summary["methods"][route.method] = summary["methods"].get(route.method, 0) + 1
-            
-            # Count processors
-            summary["processors"][route.processor_name] = summary["processors"].get(route.processor_name, 0) + 1
+        _, methods, processors = _build_route_indexes()
         
-        return summary
+        return {
+            "total_routes": len(KnowlioApiRoutes.get_all_routes()),
+            "methods": dict(methods),
+            "processors": dict(processors),
+        }
@@ -1,8 +1,15 @@
 """Authentication Stack for Knowlio using AWS Cognito"""
 
-from aws_cdk import Stack, CfnOutput
+from aws_cdk import Stack, CfnOutput, aws_ssm as ssm
 from constructs import Construct
 from infrastructure.app_constructs.cognito_auth_construct import CognitoAuthConstruct
+from infrastructure.config.knowlio_auth_config import AuthConfig
+
+# SSM parameters consumers read instead of CloudFormation exports, so this
+# stack can be updated or replaced without Fn::ImportValue locks
+USER_POOL_ID_PARAMETER = "/knowlio/auth/user-pool-id"
+USER_POOL_CLIENT_ID_PARAMETER = "/knowlio/auth/user-pool-client-id"
+COGNITO_DOMAIN_PARAMETER = "/knowlio/auth/cognito-domain"
 
 
 class AuthStack(Stack):
@@ -23,70 +30,33 @@ class AuthStack(Stack):
         self.cognito_domain = auth_construct.cognito_domain
         self.google_provider = auth_construct.google_provider
         
-        # Stack outputs
-        CfnOutput(
-            self, "UserPoolId",
-            value=self.user_pool.user_pool_id,
-            description="The ID of the Cognito User Pool",
-            export_name=f"{self.stack_name}-UserPoolId"
-        )
-        
-        CfnOutput(
-            self, "UserPoolClientId",
-            value=self.user_pool_client.user_pool_client_id,
-            description="The ID of the Cognito User Pool Client",
-            export_name=f"{self.stack_name}-UserPoolClientId"
-        )
-        
-        CfnOutput(
-            self, "CognitoDomain",
-            value=self.cognito_domain.domain_name,
-            description="The Cognito domain for the hosted UI",
-            export_name=f"{self.stack_name}-CognitoDomain"
-        )
-        
-        # Import the config to access the URLs
-        from infrastructure.config.knowlio_auth_config import AuthConfig
-        
-        CfnOutput(
-            self, "CallbackUrls",
-            value=",".join(AuthConfig.APP_CLIENT["oauth"]["callback_urls"]),
-            description="The callback URLs for OAuth flows",
-            export_name=f"{self.stack_name}-CallbackUrls"
-        )
-        
-        CfnOutput(
-            self, "LogoutUrls",
-            value=",".join(AuthConfig.APP_CLIENT["oauth"]["logout_urls"]),
-            description="The logout URLs for OAuth flows",
-            export_name=f"{self.stack_name}-LogoutUrls"
-        )
-        
-        CfnOutput(
-            self, "AuthDomainUrl",
-            value=f"https://{self.cognito_domain.domain_name}.auth.{self.region}.amazoncognito.com",
-            description="The full URL for the Cognito hosted UI",
-            export_name=f"{self.stack_name}-AuthDomainUrl"
-        )
-        
-        CfnOutput(
-            self, "GoogleIdpName",
-            value=self.google_provider.provider_name,
-            description="The name of the Google identity provider",
-            export_name=f"{self.stack_name}-GoogleIdpName"
-        )
-        
-        # Output the login and logout URLs
-        CfnOutput(
-            self, "LoginUrl",
-            value=auth_construct.get_login_url(),
-            description="The OAuth login URL for the Cognito hosted UI",
-            export_name=f"{self.stack_name}-LoginUrl"
-        )
-        
-        CfnOutput(
-            self, "LogoutUrl",
-            value=auth_construct.get_logout_url(),
-            description="The logout URL for the Cognito hosted UI",
-            export_name=f"{self.stack_name}-LogoutUrl"
-        )
+        # Pin exports for these values so stacks that import them keep a stable
+        # export name, even while no stack in this app references them
+        self.export_value(self.user_pool.user_pool_id)
+        self.export_value(self.user_pool_client.user_pool_client_id)
+        self.export_value(self.cognito_domain.domain_name)
+        
+        # Publish values for other stacks through SSM Parameter Store
+        ssm_parameters = [
+            ("UserPoolIdParam", USER_POOL_ID_PARAMETER, self.user_pool.user_pool_id),
+            ("UserPoolClientIdParam", USER_POOL_CLIENT_ID_PARAMETER, self.user_pool_client.user_pool_client_id),
+            ("CognitoDomainParam", COGNITO_DOMAIN_PARAMETER, self.cognito_domain.domain_name),
+        ]
+        for parameter_id, parameter_name, value in ssm_parameters:
+            ssm.StringParameter(self, parameter_id, parameter_name=parameter_name, string_value=value)
+        
+        # Stack outputs (not exported; see SSM parameters above)
+        outputs = [
+            ("UserPoolId", self.user_pool.user_pool_id, "The ID of the Cognito User Pool"),
+            ("UserPoolClientId", self.user_pool_client.user_pool_client_id, "The ID of the Cognito User Pool Client"),
+            ("CognitoDomain", self.cognito_domain.domain_name, "The Cognito domain for the hosted UI"),
+            ("CallbackUrls", ",".join(AuthConfig.APP_CLIENT["oauth"]["callback_urls"]), "The callback URLs for OAuth flows"),
+            ("LogoutUrls", ",".join(AuthConfig.APP_CLIENT["oauth"]["logout_urls"]), "The logout URLs for OAuth flows"),
+            ("AuthDomainUrl", f"https://{self.cognito_domain.domain_name}.auth.{self.region}.amazoncognito.com",
+             "The full URL for the Cognito hosted UI"),
+            ("GoogleIdpName", self.google_provider.provider_name, "The name of the Google identity provider"),
+            ("LoginUrl", auth_construct.get_login_url(), "The OAuth login URL for the Cognito hosted UI"),
+            ("LogoutUrl", auth_construct.get_logout_url(), "The logout URL for the Cognito hosted UI"),
+        ]
+        for output_id, value, description in outputs:
+            CfnOutput(self, output_id, value=value, description=description)
@@ -1,9 +1,92 @@
+from typing import Dict, Optional, Tuple
+
 from aws_cdk import Stack
 from constructs import Construct
 from aws_cdk import aws_dynamodb as dynamodb
 
 from infrastructure.app_constructs.dynamodb_construct import DynamoDBTableConstruct, DynamoDBTableProps
 
+# Fixed table names, also used by KnowlioStack to scope the Lambda's IAM policy
+USERS_TABLE_NAME = "users"
+CONTENT_TABLE_NAME = "content"
+CONTENT_TAGS_TABLE_NAME = "content_tags"
+LICENSES_TABLE_NAME = "licenses"
+# usage_logs_v2 replaces the original usage_logs table (keyed on log_id alone):
+# a fixed-name table can't be replaced in place, so the sharded key schema is
+# deployed as a new table and copied into by migrate_usage_logs.py
+USAGE_LOGS_TABLE_NAME = "usage_logs_v2"
+USAGE_STATS_TABLE_NAME = "usage_stats"
+KNOWLIO_TABLE_NAMES = (
+    USERS_TABLE_NAME, CONTENT_TABLE_NAME, CONTENT_TAGS_TABLE_NAME, LICENSES_TABLE_NAME,
+    USAGE_LOGS_TABLE_NAME, USAGE_STATS_TABLE_NAME,
+)
+
+# usage_logs_v2 writes are spread over this many partition keys (shard_pk)
+USAGE_LOG_SHARDS_CONTEXT_KEY = "knowlio:usage_log_shards"
+DEFAULT_USAGE_LOG_SHARDS = 10
+MAX_USAGE_LOG_SHARDS = 20
+
+
+def get_usage_log_shard_count(scope: Construct) -> int:
+    """Read the usage_logs shard count from CDK context (cdk.json or -c)"""
+    value = scope.node.try_get_context(USAGE_LOG_SHARDS_CONTEXT_KEY)
+    shard_count = int(value) if value is not None else DEFAULT_USAGE_LOG_SHARDS
+    if not 1 <= shard_count <= MAX_USAGE_LOG_SHARDS:
+        raise ValueError(
+            f"{USAGE_LOG_SHARDS_CONTEXT_KEY} must be between 1 and {MAX_USAGE_LOG_SHARDS}, got {shard_count}"
+        )
+    return shard_count
+
+
+# GSI changes to the users, content and licenses tables are rolled out in steps:
+# CloudFormation creates or deletes at most one GSI per table in a stack update,
+# and re-keying or re-projecting a GSI is a delete followed by a create. Stacks
+# deployed before these changes go through each step in turn
+# (`cdk deploy -c knowlio:gsi_rollout_step=1`, then 2, ...); new stacks and
+# stacks that finished the rollout use the last step (the default).
+GSI_ROLLOUT_STEP_CONTEXT_KEY = "knowlio:gsi_rollout_step"
+GSI_ROLLOUT_STEPS = 5
+
+
+def get_gsi_rollout_step(scope: Construct) -> int:
+    """Read the GSI rollout step from CDK context (cdk.json or -c)"""
+    value = scope.node.try_get_context(GSI_ROLLOUT_STEP_CONTEXT_KEY)
+    rollout_step = int(value) if value is not None else GSI_ROLLOUT_STEPS
+    if not 0 <= rollout_step <= GSI_ROLLOUT_STEPS:
+        raise ValueError(
+            f"{GSI_ROLLOUT_STEP_CONTEXT_KEY} must be between 0 and {GSI_ROLLOUT_STEPS}, got {rollout_step}"
+        )
+    return rollout_step
+
+
+def _gsi(partition_key: str, sort_key: Optional[str] = None,
+         projection_type: dynamodb.ProjectionType = dynamodb.ProjectionType.KEYS_ONLY) -> Dict:
+    """add_global_secondary_index arguments for a GSI with string keys"""
+    gsi = {
+        "partition_key": dynamodb.Attribute(name=partition_key, type=dynamodb.AttributeType.STRING),
+        "projection_type": projection_type,
+    }
+    if sort_key:
+        gsi["sort_key"] = dynamodb.Attribute(name=sort_key, type=dynamodb.AttributeType.STRING)
+    return gsi
+
+
+def add_rolled_out_gsis(table: dynamodb.Table, original_gsis: Dict[str, Dict],
+                        rollout: Tuple[Tuple[str, Optional[Dict]], ...], rollout_step: int) -> None:
+    """
+    Add a table's GSIs as of rollout_step: the GSIs it was first deployed with,
+    changed by the first rollout_step entries of rollout, each of which creates
+    (GSI arguments) or deletes (None) one index
+    """
+    gsis = dict(original_gsis)
+    for index_name, gsi in rollout[:rollout_step]:
+        if gsi is None:
+            del gsis[index_name]
+        else:
+            gsis[index_name] = gsi
+    for index_name, gsi in gsis.items():
+        table.add_global_secondary_index(index_name=index_name, **gsi)
+
 
 class DynamoDBStack(Stack):
     def __init__(self, scope: Construct, id: str, **kwargs):
@@ -11,7 +94,7 @@ class DynamoDBStack(Stack):
 
         # Users Table with GSIs for role-based and email-based queries
         user_table_props = DynamoDBTableProps(
-            table_name="users",
+            table_name=USERS_TABLE_NAME,
             partition_key_name="user_id",
             partition_key_type=dynamodb.AttributeType.STRING
         )
@@ -21,25 +104,35 @@ class DynamoDBStack(Stack):
             user_table_props
         )
         
-        # Add GSI for querying users by role
-        user_table.table.add_global_secondary_index(
-            index_name="role-index",
-            partition_key=dynamodb.Attribute(name="role", type=dynamodb.AttributeType.STRING),
-            projection_type=dynamodb.ProjectionType.ALL
-        )
+        gsi_rollout_step = get_gsi_rollout_step(self)
         
-        # Add GSI for querying users by email
-        user_table.table.add_global_secondary_index(
-            index_name="email-index",
-            partition_key=dynamodb.Attribute(name="email", type=dynamodb.AttributeType.STRING),
-            projection_type=dynamodb.ProjectionType.ALL
+        # GSIs on users/content project keys only, so base-table writes are not
+        # copied in full into every index; DynamoDBHelper fetches the items
+        # behind index hits from the base table.
+        
+        # GSIs for querying users by role and by email (first deployed projecting ALL)
+        add_rolled_out_gsis(
+            user_table.table,
+            original_gsis={
+                "role-index": _gsi("role", projection_type=dynamodb.ProjectionType.ALL),
+                "email-index": _gsi("email", projection_type=dynamodb.ProjectionType.ALL),
+            },
+            rollout=(
+                ("role-index", None),
+                ("role-index", _gsi("role")),
+                ("email-index", None),
+                ("email-index", _gsi("email")),
+            ),
+            rollout_step=gsi_rollout_step
         )
 
         # Content Table with GSIs for efficient queries
         content_table_props = DynamoDBTableProps(
-            table_name="content",
+            table_name=CONTENT_TABLE_NAME,
             partition_key_name="content_id",
-            partition_key_type=dynamodb.AttributeType.STRING
+            partition_key_type=dynamodb.AttributeType.STRING,
+            # Bursty writes (uploads, status updates): stay on-demand so capacity follows traffic
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST
         )
         
         content_table = DynamoDBTableConstruct(
@@ -47,48 +140,128 @@ class DynamoDBStack(Stack):
             content_table_props
         )
         
-        # Add GSI for querying content by publisher_id
-        content_table.table.add_global_secondary_index(
-            index_name="publisher_id-index",
-            partition_key=dynamodb.Attribute(name="publisher_id", type=dynamodb.AttributeType.STRING),
-            projection_type=dynamodb.ProjectionType.ALL
+        # GSIs for querying content by publisher_id, sorted by creation time
+        # (ISO-8601 strings sort lexically) so date windows are key conditions,
+        # and by type, sorted by status. The type index replaces separate type and
+        # status indexes: status has only a handful of values, so its own index
+        # would concentrate writes on a few partitions. Status-only lookups fall
+        # back to a filtered scan.
+        add_rolled_out_gsis(
+            content_table.table,
+            original_gsis={
+                "publisher_id-index": _gsi("publisher_id", projection_type=dynamodb.ProjectionType.ALL),
+                "type-index": _gsi("type", projection_type=dynamodb.ProjectionType.ALL),
+                "status-index": _gsi("status", projection_type=dynamodb.ProjectionType.ALL),
+            },
+            rollout=(
+                ("status-index", None),
+                ("publisher_id-index", None),
+                ("publisher_id-index", _gsi("publisher_id", "created_at")),
+                ("type-index", None),
+                ("type-index", _gsi("type", "status")),
+            ),
+            rollout_step=gsi_rollout_step
         )
-        
-        # Add GSI for querying content by type
-        content_table.table.add_global_secondary_index(
-            index_name="type-index",
-            partition_key=dynamodb.Attribute(name="type", type=dynamodb.AttributeType.STRING),
-            projection_type=dynamodb.ProjectionType.ALL
-        )
-        
-        # Add GSI for querying content by status
-        content_table.table.add_global_secondary_index(
-            index_name="status-index",
-            partition_key=dynamodb.Attribute(name="status", type=dynamodb.AttributeType.STRING),
-            projection_type=dynamodb.ProjectionType.ALL
+
+        # Content Tags Table
+        # Inverted index of content tags: one (tag, content_id) row per tag, kept
+        # in step by ContentHelper, so tag searches query a tag's partition
+        # instead of scanning the content table.
+        content_tags_table = DynamoDBTableConstruct(
+            self, "ContentTagsTable",
+            DynamoDBTableProps(
+                table_name=CONTENT_TAGS_TABLE_NAME,
+                partition_key_name="tag",
+                partition_key_type=dynamodb.AttributeType.STRING,
+                sort_key_name="content_id",
+                sort_key_type=dynamodb.AttributeType.STRING,
+                # Written alongside content: stay on-demand like the content table
+                billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST
+            )
         )
 
         # License Table
         license_table = DynamoDBTableConstruct(
             self, "LicenseTable",
             DynamoDBTableProps(
-                table_name="licenses",
+                table_name=LICENSES_TABLE_NAME,
                 partition_key_name="license_id",
                 partition_key_type=dynamodb.AttributeType.STRING
             )
         )
+        
+        # Licenses are listed per content item and per consumer. These GSIs keep
+        # each listing to a single Query on one partition instead of a full scan,
+        # sorted by created_at so date windows are key conditions.
+        # License items are small and written rarely, so they are projected in full.
+        add_rolled_out_gsis(
+            license_table.table,
+            original_gsis={},
+            rollout=(
+                ("content_id-index", _gsi("content_id", "created_at", dynamodb.ProjectionType.ALL)),
+                ("consumer_id-index", _gsi("consumer_id", "created_at", dynamodb.ProjectionType.ALL)),
+            ),
+            rollout_step=gsi_rollout_step
+        )
 
         # Usage Logs Table
+        # Append-only telemetry: writes are spread across shard_pk values
+        # ("USAGE#0".."USAGE#<n-1>") so they don't all land on one partition.
+        # Readers fan out over the shards (see AnalyticsHelper).
+        self.usage_log_shard_count = get_usage_log_shard_count(self)
         usage_logs_table = DynamoDBTableConstruct(
             self, "UsageLogsTable",
             DynamoDBTableProps(
-                table_name="usage_logs",
-                partition_key_name="log_id",
-                partition_key_type=dynamodb.AttributeType.STRING
+                table_name=USAGE_LOGS_TABLE_NAME,
+                partition_key_name="shard_pk",
+                partition_key_type=dynamodb.AttributeType.STRING,
+                sort_key_name="log_id",
+                sort_key_type=dynamodb.AttributeType.STRING,
+                # Write-spiky telemetry: stay on-demand so capacity follows traffic
+                billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST
+            )
+        )
+        
+        # Add GSI for exports over a date range: one access_time-bounded query per shard
+        usage_logs_table.table.add_global_secondary_index(
+            index_name="access_time-index",
+            partition_key=dynamodb.Attribute(name="shard_pk", type=dynamodb.AttributeType.STRING),
+            sort_key=dynamodb.Attribute(name="access_time", type=dynamodb.AttributeType.STRING),
+            projection_type=dynamodb.ProjectionType.ALL
+        )
+
+        # Add GSIs for the per-content and per-consumer usage reports: one query
+        # per report instead of a filtered scan, returned in access_time order
+        # so the most recent logs are the last ones read
+        for report_key in ("content_id", "consumer_id"):
+            usage_logs_table.table.add_global_secondary_index(
+                index_name=f"{report_key}-index",
+                partition_key=dynamodb.Attribute(name=report_key, type=dynamodb.AttributeType.STRING),
+                sort_key=dynamodb.Attribute(name="access_time", type=dynamodb.AttributeType.STRING),
+                projection_type=dynamodb.ProjectionType.ALL
+            )
+
+        # Usage Stats Table
+        # Usage report counters per content item / consumer ("content_id#<id>",
+        # "consumer_id#<id>"), added to as logs are written. Sort key "TOTALS" holds
+        # the counters; "MEMBER#<id>" items mark IDs already counted as unique and
+        # "LOG#<log_id>" items mark logs already counted.
+        usage_stats_table = DynamoDBTableConstruct(
+            self, "UsageStatsTable",
+            DynamoDBTableProps(
+                table_name=USAGE_STATS_TABLE_NAME,
+                partition_key_name="stats_key",
+                partition_key_type=dynamodb.AttributeType.STRING,
+                sort_key_name="stats_sk",
+                sort_key_type=dynamodb.AttributeType.STRING,
+                # Written with every usage log batch: stay on-demand like usage_logs
+                billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST
             )
         )
 
         self.user_table = user_table.table
         self.content_table = content_table.table
+        self.content_tags_table = content_tags_table.table
         self.license_table = license_table.table
         self.usage_logs_table = usage_logs_table.table
+        self.usage_stats_table = usage_stats_table.table
@@ -1,34 +1,63 @@
-from aws_cdk import Stack, aws_iam as iam, CfnOutput, aws_cognito as cognito, Fn, RemovalPolicy
+from aws_cdk import Stack, aws_iam as iam, CfnOutput, aws_ssm as ssm, aws_ec2 as ec2
+from aws_cdk import aws_lambda as _lambda, BundlingOptions, Duration
+from aws_cdk import aws_kinesis as kinesis, aws_lambda_event_sources as lambda_event_sources, aws_sqs as sqs
 from constructs import Construct
+from typing import Optional
 
 from infrastructure.app_constructs.iam_role_construct import IamRole
 from infrastructure.app_constructs.lambda_construct import LambdaFunctionConstructProps, LambdaConstruct
 from infrastructure.app_constructs.api_gateway_construct import ApiGatewayConstruct
+from infrastructure.app_constructs.dax_cluster_construct import DaxClusterConstruct, DaxClusterProps
 from infrastructure.config.knowlio_api_config import KnowlioApiConfig
+from infrastructure.stacks.knowlio_dynamodb_tables_stack import (
+    CONTENT_TAGS_TABLE_NAME,
+    KNOWLIO_TABLE_NAMES,
+    USAGE_LOGS_TABLE_NAME,
+    USAGE_STATS_TABLE_NAME,
+    get_usage_log_shard_count,
+)
+from infrastructure.stacks.opensearch_serverless_stack import (
+    OPENSEARCH_COLLECTION_ARN_PARAMETER,
+    OPENSEARCH_COLLECTION_NAME_PARAMETER,
+    OPENSEARCH_ENDPOINT_PARAMETER,
+)
+
+# Buckets the Lambda reads and writes (see S3UploadProcessor and AnalyticsHelper)
+LAMBDA_S3_BUCKETS = ("knowlio-content-bucket", "knowlio-exports")
+
+LAMBDA_RUNTIME = _lambda.Runtime.PYTHON_3_11
+LAMBDA_ARCHITECTURE = _lambda.Architecture.ARM_64  # Graviton
+
+
+def _lambda_bundling() -> BundlingOptions:
+    """Install src/requirements.txt into the asset, building wheels for the Lambda's architecture"""
+    return BundlingOptions(
+        image=LAMBDA_RUNTIME.bundling_image,
+        platform=LAMBDA_ARCHITECTURE.docker_platform,
+        command=[
+            "bash", "-c",
+            "pip install --no-cache-dir -r requirements.txt -t /asset-output && cp -au . /asset-output",
+        ],
+    )
 
 
 class KnowlioStack(Stack):
     """
-    Main Knowlio application stack containing Lambda and API Gateway
-    that references other stacks like Auth and OpenSearch Serverless.
+    Main Knowlio application stack containing Lambda and API Gateway.
+    Values from other stacks (e.g. OpenSearch Serverless) are read from SSM
+    Parameter Store at deploy time rather than through CloudFormation exports.
     """
     
-    def __init__(self, scope: Construct, construct_id: str, auth_stack=None, opensearch_stack=None, **kwargs):
+    def __init__(self, scope: Construct, construct_id: str, **kwargs):
         """
-        Initialize the KnowlioStack with references to external stacks
+        Initialize the KnowlioStack
         
         Args:
             scope: Parent construct scope
             construct_id: Construct ID
-            auth_stack: Optional reference to the AuthStack
-            opensearch_stack: Required reference to the OpenSearchServerlessStack
             **kwargs: Additional keyword arguments for the Stack
         """
         super().__init__(scope, construct_id, **kwargs)
-        
-        # Verify opensearch_stack is provided
-        if not opensearch_stack:
-            raise ValueError("opensearch_stack parameter is required")
 
         # Create IAM Role for Lambda
         lambda_role = IamRole(
@@ -36,17 +65,60 @@ class KnowlioStack(Stack):
             assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
             managed_policies=[
                 iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSLambdaBasicExecutionRole"),
-                iam.ManagedPolicy.from_aws_managed_policy_name("AmazonDynamoDBFullAccess"),  # Or restrict more later
-                iam.ManagedPolicy.from_aws_managed_policy_name("CloudWatchFullAccess"),
-                iam.ManagedPolicy.from_aws_managed_policy_name("AmazonS3FullAccess"),  # For analytics exports
             ],
-            description="Role for Lambda to access DynamoDB, CloudWatch, S3 and Lambda invoke"
+            description="Role for Lambda to access DynamoDB, CloudWatch Logs and S3"
         ).role
         
-        # Use the opensearch_stack resources instead of creating our own
-        opensearch_collection_arn = opensearch_stack.collection_arn
-        opensearch_collection_endpoint = opensearch_stack.collection_endpoint
-        opensearch_collection_name = opensearch_stack.collection_name
+        # DynamoDB access limited to the Knowlio tables and their indexes. Table
+        # names are fixed, so ARNs are built here without referencing DynamoDBStack.
+        table_arns = [
+            self.format_arn(service="dynamodb", resource="table", resource_name=table_name)
+            for table_name in KNOWLIO_TABLE_NAMES
+        ]
+        lambda_role.add_to_policy(iam.PolicyStatement(
+            actions=[
+                "dynamodb:GetItem",
+                "dynamodb:PutItem",
+                "dynamodb:UpdateItem",
+                "dynamodb:Query",
+                "dynamodb:Scan",
+                "dynamodb:BatchGetItem",
+                "dynamodb:DescribeTable",
+            ],
+            resources=table_arns + [f"{table_arn}/index/*" for table_arn in table_arns]
+        ))
+        
+        # ContentHelper adds and removes content_tags rows in batches
+        lambda_role.add_to_policy(iam.PolicyStatement(
+            actions=["dynamodb:BatchWriteItem"],
+            resources=[self.format_arn(service="dynamodb", resource="table", resource_name=CONTENT_TAGS_TABLE_NAME)]
+        ))
+        
+        # S3 access limited to the upload and analytics export buckets. Presigned
+        # URLs are signed with this role, so it needs the object actions they grant.
+        bucket_arns = [f"arn:{self.partition}:s3:::{bucket_name}" for bucket_name in LAMBDA_S3_BUCKETS]
+        lambda_role.add_to_policy(iam.PolicyStatement(
+            actions=[
+                "s3:GetObject",
+                "s3:PutObject",
+                "s3:AbortMultipartUpload",
+                "s3:ListMultipartUploadParts",
+            ],
+            resources=[f"{bucket_arn}/*" for bucket_arn in bucket_arns]
+        ))
+        lambda_role.add_to_policy(iam.PolicyStatement(
+            actions=["s3:ListBucket"],
+            resources=bucket_arns
+        ))
+        
+        # Use the OpenSearchServerlessStack resources instead of creating our own,
+        # resolved from SSM at deploy time (no Fn::ImportValue dependency)
+        opensearch_collection_arn = ssm.StringParameter.value_for_string_parameter(
+            self, OPENSEARCH_COLLECTION_ARN_PARAMETER)
+        opensearch_collection_endpoint = ssm.StringParameter.value_for_string_parameter(
+            self, OPENSEARCH_ENDPOINT_PARAMETER)
+        opensearch_collection_name = ssm.StringParameter.value_for_string_parameter(
+            self, OPENSEARCH_COLLECTION_NAME_PARAMETER)
         
         # Update Lambda role permissions to access OpenSearch Serverless
         opensearch_policy = iam.PolicyStatement(
@@ -67,15 +139,94 @@ class KnowlioStack(Stack):
             "OPENSEARCH_REGION": self.region,
             "OPENSEARCH_SERVERLESS": "true"  # Flag to indicate we're using serverless
         }
+        
+        # Docker-based; skip with `-c knowlio:bundle_lambda=false` for a quick local synth
+        lambda_bundling = None if str(self.node.try_get_context("knowlio:bundle_lambda")).lower() == "false" else _lambda_bundling()
 
-        # Create Lambda using LambdaConstruct with OpenSearch environment variables
+        # Must match the shard count the usage_logs table was deployed with
+        lambda_env = {
+            **opensearch_env,
+            "USAGE_LOG_SHARDS": str(get_usage_log_shard_count(self)),
+            # Structured JSON log lines (see LoggerHelper), queryable by field in Logs Insights
+            "LOG_FORMAT": "json",
+        }
+
+        # Access logs go onto a Kinesis stream and are batch-written to usage_logs
+        # by a separate consumer, so content reads don't wait on a DynamoDB write
+        # Two shards, so a failing batch holds back only half of the writes;
+        # records are kept for a week so failed batches can be replayed
+        usage_log_stream = kinesis.Stream(
+            self, "UsageLogStream",
+            shard_count=2,
+            retention_period=Duration.days(7)
+        )
+        usage_log_stream.grant_write(lambda_role)
+        lambda_env["USAGE_LOG_STREAM"] = usage_log_stream.stream_name
+        self._create_usage_log_writer(usage_log_stream, lambda_env["USAGE_LOG_SHARDS"], lambda_bundling)
+
+        # Optional DAX read cache in front of DynamoDB (`-c knowlio:dax_enabled=true`).
+        # DAX is only reachable inside a VPC, so enabling it also moves the Lambda
+        # into private subnets with NAT egress for S3, OpenSearch and Google Books.
+        vpc_props = {}
+        dax_cluster = None
+        if str(self.node.try_get_context("knowlio:dax_enabled")).lower() == "true":
+            vpc = ec2.Vpc(
+                self, "LambdaVpc",
+                max_azs=2,
+                nat_gateways=1,
+                subnet_configuration=[
+                    ec2.SubnetConfiguration(name="public", subnet_type=ec2.SubnetType.PUBLIC),
+                    ec2.SubnetConfiguration(name="private", subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
+                ]
+            )
+            dax_cluster = DaxClusterConstruct(
+                self, "DaxCluster",
+                DaxClusterProps(
+                    cluster_name="knowlio-dax",
+                    vpc=vpc,
+                    table_arns=table_arns,
+                    description="Knowlio DynamoDB read cache",
+                )
+            )
+            lambda_security_group = ec2.SecurityGroup(
+                self, "LambdaSecurityGroup",
+                vpc=vpc,
+                description="Knowlio Lambda"
+            )
+            dax_cluster.allow_client(lambda_security_group)
+            
+            lambda_role.add_managed_policy(
+                iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSLambdaVPCAccessExecutionRole")
+            )
+            lambda_role.add_to_policy(iam.PolicyStatement(
+                actions=["dax:*"],
+                resources=[dax_cluster.cluster_arn]
+            ))
+            
+            lambda_env["DAX_ENDPOINT"] = dax_cluster.discovery_endpoint_url
+            vpc_props = {
+                "vpc": vpc,
+                "vpc_subnets": ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
+                "security_groups": [lambda_security_group],
+            }
+
+        # Create Lambda using LambdaConstruct with OpenSearch and DynamoDB environment variables
         lambda_props = LambdaFunctionConstructProps(
             id="SyncHandler",
             handler="handlers.api_gateway_handler.lambda_handler",
             code_path="src",
             timeout_seconds=900,  # 15 minutes
+            # 1 GB gets a proportionally larger CPU share, which shortens cold starts
+            memory_size_mb=1024,
+            ephemeral_storage_mb=512,
+            runtime=LAMBDA_RUNTIME,
+            architecture=LAMBDA_ARCHITECTURE,
+            bundling=lambda_bundling,
             lambda_role=lambda_role,
-            environment=opensearch_env
+            environment=lambda_env,
+            # Pre-initialized instances behind the "live" alias that API Gateway invokes
+            provisioned_concurrency=int(self.node.try_get_context("knowlio:provisioned_concurrency") or 0) or None,
+            **vpc_props
         )
 
         lambda_fn = LambdaConstruct(self, "SyncHandlerConstruct", lambda_props)
@@ -87,7 +238,8 @@ class KnowlioStack(Stack):
         # Create API Gateway with generic construct
         api_gateway = ApiGatewayConstruct(
             self, "KnowlioApiGateway",
-            lambda_function=lambda_fn.lambda_function,
+            # Target the warmed alias when one is configured, otherwise $LATEST
+            routing_lambda=lambda_fn.alias or lambda_fn.lambda_function,
             props=api_props,
             routes=api_routes
         )
@@ -104,3 +256,55 @@ class KnowlioStack(Stack):
         self.lambda_function = lambda_fn.lambda_function
         self.api_gateway = api_gateway.api
         self.api_url = api_gateway.api_url
+
+    def _create_usage_log_writer(self, usage_log_stream: kinesis.IStream, usage_log_shards: str,
+                                 bundling: Optional[BundlingOptions]) -> LambdaConstruct:
+        """Consumer Lambda that drains the usage log stream into the usage_logs table"""
+        writer_role = IamRole(
+            self, "UsageLogWriterRole",
+            assumed_by=iam.ServicePrincipal("lambda.amazonaws.com"),
+            managed_policies=[
+                iam.ManagedPolicy.from_aws_managed_policy_name("service-role/AWSLambdaBasicExecutionRole"),
+            ],
+            description="Role for the usage log stream consumer to write usage_logs"
+        ).role
+        writer_role.add_to_policy(iam.PolicyStatement(
+            actions=["dynamodb:BatchWriteItem", "dynamodb:PutItem"],
+            resources=[self.format_arn(service="dynamodb", resource="table", resource_name=USAGE_LOGS_TABLE_NAME)]
+        ))
+        # Report counters are added to as each batch is written (see UsageStatsHelper)
+        writer_role.add_to_policy(iam.PolicyStatement(
+            actions=["dynamodb:PutItem", "dynamodb:UpdateItem", "dynamodb:DescribeTable"],
+            resources=[self.format_arn(service="dynamodb", resource="table", resource_name=USAGE_STATS_TABLE_NAME)]
+        ))
+
+        # Same asset as the API Lambda: the shared helpers use bundled packages (orjson)
+        writer = LambdaConstruct(self, "UsageLogWriterConstruct", LambdaFunctionConstructProps(
+            id="UsageLogWriter",
+            handler="handlers.usage_log_stream_handler.lambda_handler",
+            code_path="src",
+            timeout_seconds=60,
+            memory_size_mb=256,
+            runtime=LAMBDA_RUNTIME,
+            architecture=LAMBDA_ARCHITECTURE,
+            bundling=bundling,
+            lambda_role=writer_role,
+            environment={"USAGE_LOG_SHARDS": usage_log_shards, "LOG_FORMAT": "json"},
+        ))
+        # Batches still failing after the retries are recorded here (shard and
+        # sequence number range) instead of being dropped, to be replayed from the stream
+        failed_batches = sqs.Queue(
+            self, "UsageLogWriterFailedBatches",
+            retention_period=Duration.days(14)
+        )
+        writer.lambda_function.add_event_source(lambda_event_sources.KinesisEventSource(
+            usage_log_stream,
+            starting_position=_lambda.StartingPosition.TRIM_HORIZON,
+            batch_size=100,
+            max_batching_window=Duration.seconds(5),
+            retry_attempts=3,
+            bisect_batch_on_error=True,
+            report_batch_item_failures=True,
+            on_failure=lambda_event_sources.SqsDlq(failed_batches),
+        ))
+        return writer
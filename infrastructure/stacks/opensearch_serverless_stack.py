@@ -10,6 +10,7 @@ from aws_cdk import (
     CfnOutput,
     RemovalPolicy,
     aws_iam as iam,
+    aws_ssm as ssm,
 )
 from constructs import Construct
 
@@ -18,6 +19,12 @@ from infrastructure.app_constructs.opensearch_serverless_construct import (
     OpenSearchServerlessProps
 )
 
+# SSM parameters consumers read instead of CloudFormation exports, so this
+# stack can be updated or replaced without Fn::ImportValue locks
+OPENSEARCH_ENDPOINT_PARAMETER = "/knowlio/opensearch/endpoint"
+OPENSEARCH_COLLECTION_NAME_PARAMETER = "/knowlio/opensearch/collection-name"
+OPENSEARCH_COLLECTION_ARN_PARAMETER = "/knowlio/opensearch/collection-arn"
+
 
 class OpenSearchServerlessStack(Stack):
     """CDK Stack for OpenSearch Serverless resources."""
@@ -35,33 +42,56 @@ class OpenSearchServerlessStack(Stack):
         # Create the OpenSearch Serverless Construct
         self.opensearch = OpenSearchServerlessConstruct(self, "OpenSearchServerless", opensearch_props)
         
-        # Add outputs for important resources
+        # Keep the exports CDK generated when KnowlioStack referenced this stack by
+        # object, so this stack can deploy while a KnowlioStack still importing them
+        # exists. Fn::ImportValue consumers can keep using them; new ones should
+        # read the SSM parameters below.
+        self.export_value(self.opensearch.collection_arn)
+        self.export_value(self.opensearch.collection_endpoint)
+        self.export_value(self.opensearch.collection_name)
+        
+        # Publish values for other stacks through SSM Parameter Store
+        ssm.StringParameter(
+            self, "OpenSearchEndpointParam",
+            parameter_name=OPENSEARCH_ENDPOINT_PARAMETER,
+            string_value=self.opensearch.collection_endpoint
+        )
+        
+        ssm.StringParameter(
+            self, "OpenSearchCollectionNameParam",
+            parameter_name=OPENSEARCH_COLLECTION_NAME_PARAMETER,
+            string_value=self.opensearch.collection_name
+        )
+        
+        ssm.StringParameter(
+            self, "OpenSearchCollectionArnParam",
+            parameter_name=OPENSEARCH_COLLECTION_ARN_PARAMETER,
+            string_value=self.opensearch.collection_arn
+        )
+        
+        # Add outputs for important resources (not exported; see SSM parameters above)
         CfnOutput(
             self, "OpenSearchEndpoint",
             value=self.opensearch.collection_endpoint,
-            description="OpenSearch Serverless Collection Endpoint",
-            export_name="OpenSearchServerlessEndpoint"
+            description="OpenSearch Serverless Collection Endpoint"
         )
         
         CfnOutput(
             self, "OpenSearchDashboardUrl",
             value=f"https://{self.opensearch.collection_endpoint}/_dashboards/",
-            description="OpenSearch Serverless Dashboard URL",
-            export_name="OpenSearchServerlessDashboardUrl"
+            description="OpenSearch Serverless Dashboard URL"
         )
         
         CfnOutput(
             self, "OpenSearchCollectionName",
             value=self.opensearch.collection_name,
-            description="OpenSearch Serverless Collection Name",
-            export_name="OpenSearchServerlessCollectionName"
+            description="OpenSearch Serverless Collection Name"
         )
         
         CfnOutput(
             self, "OpenSearchCollectionArn",
             value=self.opensearch.collection_arn,
-            description="OpenSearch Serverless Collection ARN",
-            export_name="OpenSearchServerlessCollectionArn"
+            description="OpenSearch Serverless Collection ARN"
         )
     
     @property
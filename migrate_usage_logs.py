@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+One-time copy of usage logs from the original usage_logs table (keyed on
+log_id alone) into the write-sharded usage_logs_v2 table, setting each log's
+shard_pk the same way AnalyticsHelper does for new logs.
+
+The shard count must match the one usage_logs_v2 was deployed with; it is read
+from the knowlio:usage_log_shards context in cdk.json unless given explicitly.
+
+Safe to re-run: logs are plain puts keyed by (shard_pk, log_id).
+Usage: python migrate_usage_logs.py [source_table] [target_table] [shard_count]
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import boto3
+
+DEFAULT_SOURCE_TABLE_NAME = "usage_logs"
+DEFAULT_TARGET_TABLE_NAME = "usage_logs_v2"
+REPO_ROOT = Path(__file__).resolve().parent
+
+
+def deployed_shard_count() -> str:
+    context = json.loads((REPO_ROOT / "cdk.json").read_text())["context"]
+    return str(context.get("knowlio:usage_log_shards", 10))
+
+
+def migrate(source_table_name: str = DEFAULT_SOURCE_TABLE_NAME,
+            target_table_name: str = DEFAULT_TARGET_TABLE_NAME) -> int:
+    # Imported here so USAGE_LOG_SHARDS is set before the helper reads it
+    from helpers.app_logic_helpers.analytics_helper import usage_log_shard_key
+
+    dynamodb = boto3.resource("dynamodb")
+    source_table = dynamodb.Table(source_table_name)
+    scan_kwargs = {}
+    copied = 0
+
+    with dynamodb.Table(target_table_name).batch_writer() as batch:
+        while True:
+            response = source_table.scan(**scan_kwargs)
+            for log in response.get("Items", []):
+                batch.put_item(Item={**log, "shard_pk": usage_log_shard_key(log["log_id"])})
+                copied += 1
+
+            if "LastEvaluatedKey" not in response:
+                return copied
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+
+
+if __name__ == "__main__":
+    source_table_name = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_SOURCE_TABLE_NAME
+    target_table_name = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_TARGET_TABLE_NAME
+    os.environ["USAGE_LOG_SHARDS"] = sys.argv[3] if len(sys.argv) > 3 else deployed_shard_count()
+    sys.path.insert(0, str(REPO_ROOT / "src"))
+    print(f"Copied {migrate(source_table_name, target_table_name)} logs from {source_table_name} to {target_table_name}")
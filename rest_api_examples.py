@@ -4,115 +4,157 @@ REST API Examples for Knowlio API Gateway
 Demonstrates all available REST endpoints with example requests and responses
 """
 
-import json
-import requests
+import asyncio
+import sys
+import httpx
 from typing import Dict, Any
 
 # Base URL will be output from CDK deployment
 # Replace with your actual API Gateway URL after deployment
 BASE_URL = "https://your-api-id.execute-api.us-west-2.amazonaws.com/prod"
 
+# Connection pool / retry settings for KnowlioApiClient. Fan-out in the
+# integration tests is capped at the keep-alive pool size so concurrent
+# calls reuse pooled connections instead of opening new ones.
+MAX_CONCURRENT_REQUESTS = 32
+POOL_IDLE_TIMEOUT_SECONDS = 60.0
+MAX_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.2
+RETRY_STATUS_CODES = frozenset({502, 503, 504})
+
 class KnowlioApiClient:
-    """Client for interacting with Knowlio REST API"""
+    """
+    Async client for interacting with Knowlio REST API.
+    Independent calls can be issued together with asyncio.gather over one
+    pooled (HTTP/2) connection, so a batch costs about one round trip.
+    """
     
     def __init__(self, base_url: str):
         self.base_url = base_url.rstrip('/')
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json',
-            'Accept': 'application/json'
-        })
+        # Pooled keep-alive connections, kept open long enough to be reused
+        # across bursts of calls instead of paying a new TCP+TLS handshake.
+        # The transport retries failed connection attempts; retryable gateway
+        # statuses are retried in _make_request.
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=MAX_CONCURRENT_REQUESTS,
+                max_connections=64,
+                keepalive_expiry=POOL_IDLE_TIMEOUT_SECONDS
+            ),
+            retries=MAX_RETRIES
+        )
+        self._aclient = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers={
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            },
+            transport=transport
+        )
+    
+    async def __aenter__(self) -> "KnowlioApiClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
     
-    def _make_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Dict[str, Any]:
+    async def aclose(self) -> None:
+        """Close the underlying connection pool"""
+        await self._aclient.aclose()
+    
+    async def _make_request(self, method: str, endpoint: str, data: Dict = None, params: Dict = None) -> Dict[str, Any]:
         """Make HTTP request to the API"""
-        url = f"{self.base_url}/{endpoint.lstrip('/')}"
-        
         try:
-            response = self.session.request(
-                method=method,
-                url=url,
-                json=data,
-                params=params
-            )
+            for attempt in range(MAX_RETRIES + 1):
+                response = await self._aclient.request(
+                    method,
+                    f"/{endpoint.lstrip('/')}",
+                    json=data,
+                    params=params
+                )
+                if response.status_code not in RETRY_STATUS_CODES or attempt == MAX_RETRIES:
+                    break
+                await asyncio.sleep(RETRY_BACKOFF_FACTOR * (2 ** attempt))
             response.raise_for_status()
             return response.json()
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"Request failed: {e}")
-            if hasattr(e, 'response') and e.response is not None:
+            if isinstance(e, httpx.HTTPStatusError):
                 print(f"Response: {e.response.text}")
             raise
 
     # User Management APIs
-    def register_user(self, user_data: Dict) -> Dict[str, Any]:
+    async def register_user(self, user_data: Dict) -> Dict[str, Any]:
         """POST /users/register"""
-        return self._make_request('POST', '/users/register', data=user_data)
+        return await self._make_request('POST', '/users/register', data=user_data)
     
-    def get_user_profile(self, user_id: str) -> Dict[str, Any]:
+    async def get_user_profile(self, user_id: str) -> Dict[str, Any]:
         """GET /users/{user_id}"""
-        return self._make_request('GET', f'/users/{user_id}')
+        return await self._make_request('GET', f'/users/{user_id}')
     
-    def update_user_profile(self, user_id: str, updates: Dict) -> Dict[str, Any]:
+    async def update_user_profile(self, user_id: str, updates: Dict) -> Dict[str, Any]:
         """PUT /users/{user_id}"""
-        return self._make_request('PUT', f'/users/{user_id}', data=updates)
+        return await self._make_request('PUT', f'/users/{user_id}', data=updates)
     
-    def list_users_by_role(self, role: str) -> Dict[str, Any]:
+    async def list_users_by_role(self, role: str) -> Dict[str, Any]:
         """GET /users?role={role}"""
-        return self._make_request('GET', '/users', params={'role': role})
+        return await self._make_request('GET', '/users', params={'role': role})
 
     # Content Management APIs
-    def upload_content_metadata(self, content_data: Dict) -> Dict[str, Any]:
+    async def upload_content_metadata(self, content_data: Dict) -> Dict[str, Any]:
         """POST /content/metadata"""
-        return self._make_request('POST', '/content/metadata', data=content_data)
+        return await self._make_request('POST', '/content/metadata', data=content_data)
     
-    def get_content_details(self, content_id: str) -> Dict[str, Any]:
+    async def get_content_details(self, content_id: str) -> Dict[str, Any]:
         """GET /content/{content_id}"""
-        return self._make_request('GET', f'/content/{content_id}')
+        return await self._make_request('GET', f'/content/{content_id}')
     
-    def update_content_metadata(self, content_id: str, updates: Dict) -> Dict[str, Any]:
+    async def update_content_metadata(self, content_id: str, updates: Dict) -> Dict[str, Any]:
         """PUT /content/{content_id}"""
-        return self._make_request('PUT', f'/content/{content_id}', data=updates)
+        return await self._make_request('PUT', f'/content/{content_id}', data=updates)
     
-    def list_content_by_publisher(self, publisher_id: str) -> Dict[str, Any]:
+    async def list_content_by_publisher(self, publisher_id: str) -> Dict[str, Any]:
         """GET /content?publisher_id={publisher_id}"""
-        return self._make_request('GET', '/content', params={'publisher_id': publisher_id})
+        return await self._make_request('GET', '/content', params={'publisher_id': publisher_id})
     
-    def archive_content(self, content_id: str) -> Dict[str, Any]:
+    async def archive_content(self, content_id: str) -> Dict[str, Any]:
         """POST /content/{content_id}/archive"""
-        return self._make_request('POST', f'/content/{content_id}/archive')
+        return await self._make_request('POST', f'/content/{content_id}/archive')
 
     # License Management APIs
-    def create_license(self, license_data: Dict) -> Dict[str, Any]:
+    async def create_license(self, license_data: Dict) -> Dict[str, Any]:
         """POST /licenses"""
-        return self._make_request('POST', '/licenses', data=license_data)
+        return await self._make_request('POST', '/licenses', data=license_data)
     
-    def get_license(self, license_id: str) -> Dict[str, Any]:
+    async def get_license(self, license_id: str) -> Dict[str, Any]:
         """GET /licenses/{license_id}"""
-        return self._make_request('GET', f'/licenses/{license_id}')
+        return await self._make_request('GET', f'/licenses/{license_id}')
     
-    def list_licenses_by_consumer(self, consumer_id: str) -> Dict[str, Any]:
+    async def list_licenses_by_consumer(self, consumer_id: str) -> Dict[str, Any]:
         """GET /licenses?consumer_id={consumer_id}"""
-        return self._make_request('GET', '/licenses', params={'consumer_id': consumer_id})
+        return await self._make_request('GET', '/licenses', params={'consumer_id': consumer_id})
     
-    def list_licenses_by_content(self, content_id: str) -> Dict[str, Any]:
+    async def list_licenses_by_content(self, content_id: str) -> Dict[str, Any]:
         """GET /licenses/content/{content_id}"""
-        return self._make_request('GET', f'/licenses/content/{content_id}')
+        return await self._make_request('GET', f'/licenses/content/{content_id}')
     
-    def revoke_license(self, license_id: str) -> Dict[str, Any]:
+    async def revoke_license(self, license_id: str) -> Dict[str, Any]:
         """POST /licenses/{license_id}/revoke"""
-        return self._make_request('POST', f'/licenses/{license_id}/revoke')
+        return await self._make_request('POST', f'/licenses/{license_id}/revoke')
 
     # Analytics APIs
-    def log_content_access(self, access_data: Dict) -> Dict[str, Any]:
+    async def log_content_access(self, access_data: Dict) -> Dict[str, Any]:
         """POST /analytics/access"""
-        return self._make_request('POST', '/analytics/access', data=access_data)
+        return await self._make_request('POST', '/analytics/access', data=access_data)
     
-    def get_usage_report_by_content(self, content_id: str) -> Dict[str, Any]:
+    async def get_usage_report_by_content(self, content_id: str) -> Dict[str, Any]:
         """GET /analytics/content/{content_id}"""
-        return self._make_request('GET', f'/analytics/content/{content_id}')
+        return await self._make_request('GET', f'/analytics/content/{content_id}')
     
-    def get_usage_report_by_consumer(self, consumer_id: str) -> Dict[str, Any]:
+    async def get_usage_report_by_consumer(self, consumer_id: str) -> Dict[str, Any]:
         """GET /analytics/consumer/{consumer_id}"""
-        return self._make_request('GET', f'/analytics/consumer/{consumer_id}')
+        return await self._make_request('GET', f'/analytics/consumer/{consumer_id}')
 
 
 def print_example_requests():
@@ -271,35 +313,33 @@ def print_example_requests():
         }
     ]
     
-    print("=" * 80)
-    print("KNOWLIO REST API EXAMPLES")
-    print("=" * 80)
-    print("\nReplace $BASE_URL with your actual API Gateway URL from CDK output")
-    print("Example: export BASE_URL=https://abcd1234.execute-api.us-west-2.amazonaws.com/prod")
+    # Built as one string and written once rather than a print() per line
+    out = [
+        "=" * 80,
+        "KNOWLIO REST API EXAMPLES",
+        "=" * 80,
+        "\nReplace $BASE_URL with your actual API Gateway URL from CDK output",
+        "Example: export BASE_URL=https://abcd1234.execute-api.us-west-2.amazonaws.com/prod",
+    ]
     
     for category in examples:
-        print(f"\n{'=' * 60}")
-        print(f"{category['title'].upper()}")
-        print('=' * 60)
+        out.append(f"\n{'=' * 60}")
+        out.append(category['title'].upper())
+        out.append('=' * 60)
         
         for i, request in enumerate(category['requests'], 1):
-            print(f"\n{i}. {request['description']}")
-            print("-" * 40)
-            print(request['curl'])
-            print()
-
-
-def run_integration_tests():
-    """Run integration tests against the API (update BASE_URL first)"""
-    
-    print("Integration Tests")
-    print("=" * 50)
-    print(f"Testing against: {BASE_URL}")
-    print("Make sure to update BASE_URL with your actual API Gateway URL")
+            out.append(f"\n{i}. {request['description']}")
+            out.append("-" * 40)
+            out.append(request['curl'])
+            out.append("")
     
-    client = KnowlioApiClient(BASE_URL)
+    out.append("")
+    sys.stdout.write("\n".join(out))
+
+async def _run_integration_tests():
+    """Integration test body; independent calls are issued concurrently"""
     
-    try:
+    async with KnowlioApiClient(BASE_URL) as client:
         # Test user registration
         print("\n1. Testing user registration...")
         user_data = {
@@ -307,23 +347,51 @@ def run_integration_tests():
             "email": "test@example.com",
             "role": "PUBLISHER"
         }
-        result = client.register_user(user_data)
+        result = await client.register_user(user_data)
         print(f"✓ User registered: {result}")
         user_id = result.get('user_id')
         
         if user_id:
-            # Test get user profile
-            print(f"\n2. Testing get user profile...")
-            profile = client.get_user_profile(user_id)
-            print(f"✓ User profile: {profile}")
-        
+            # Reads that only depend on the registered user, as (name, call, args)
+            independent_calls = [
+                ("User profile", client.get_user_profile, (user_id,)),
+                ("Publishers", client.list_users_by_role, (user_data["role"],)),
+                ("Publisher content", client.list_content_by_publisher, (user_id,)),
+                ("Licenses by consumer", client.list_licenses_by_consumer, (user_id,)),
+                ("Usage report by consumer", client.get_usage_report_by_consumer, (user_id,)),
+            ]
+            print(f"\n2. Testing {len(independent_calls)} independent reads concurrently...")
+            await _run_concurrently(independent_calls)
+
+
+async def _run_concurrently(calls):
+    """Issue independent client calls together, reporting each as it completes"""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    
+    async def run(name, method, args):
+        async with semaphore:
+            return name, await method(*args)
+    
+    for completed in asyncio.as_completed([run(*call) for call in calls]):
+        name, result = await completed
+        print(f"✓ {name}: {result}")
+
+def run_integration_tests():
+    """Run integration tests against the API (update BASE_URL first)"""
+    
+    print("Integration Tests")
+    print("=" * 50)
+    print(f"Testing against: {BASE_URL}")
+    print("Make sure to update BASE_URL with your actual API Gateway URL")
+    
+    try:
+        asyncio.run(_run_integration_tests())
         print("\n✓ Integration tests completed successfully!")
         
     except Exception as e:
         print(f"\n✗ Integration test failed: {e}")
         print("Make sure your API is deployed and BASE_URL is correct")
 
-
 if __name__ == "__main__":
     print_example_requests()
     
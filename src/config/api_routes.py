@@ -0,0 +1,186 @@
+"""
+API Gateway route configuration for Knowlio REST API.
+Defines all processor actions as REST API endpoints with their HTTP methods and paths.
+"""
+
+import sys
+from collections import defaultdict
+from typing import List, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class ApiRoute:
+    """Configuration for a single API route"""
+    method: str
+    path: str
+    processor_name: str
+    action: str
+    description: str
+    path_parameters: Optional[Tuple[str, ...]] = None
+    query_parameters: Optional[Tuple[str, ...]] = None
+    path_segments: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+    path_parameter_names: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Segments repeat across routes and are compared on every lookup;
+        # interning shares their storage and lets equality short-circuit on identity
+        object.__setattr__(self, "path", sys.intern(self.path))
+        object.__setattr__(self, "path_segments", tuple(sys.intern(segment) for segment in self.path.split('/')))
+        # Names of the {param} segments in path order, so matches bind values without re-parsing the path
+        object.__setattr__(self, "path_parameter_names", tuple(
+            segment[1:-1] for segment in self.path_segments if segment.startswith('{') and segment.endswith('}')
+        ))
+
+
+# All API routes for the Knowlio system as positional rows:
+# (method, path, processor_name, action, description[, path_parameters[, query_parameters]])
+_ROUTE_TABLE: Tuple[tuple, ...] = (
+    # User Management Routes
+    ("POST", "users/register", "user", "register_user", "Register a new user"),
+    ("GET", "users/{user_id}", "user", "get_user_profile", "Get user profile by ID", ("user_id",)),
+    ("PUT", "users/{user_id}", "user", "update_user_profile", "Update user profile", ("user_id",)),
+    ("GET", "users", "user", "list_users_by_role", "List users by role with pagination", None, ("role", "limit", "pagination_token")),
+    ("POST", "users/search", "user", "search_users", "Search users with flexible criteria"),
+    ("PATCH", "users/{user_id}/admin", "user", "admin_update_user", "Admin-only generic field update", ("user_id",)),
+    # Content Management Routes
+    ("POST", "content/metadata", "content", "upload_content_metadata", "Upload content metadata"),
+    ("GET", "content/{content_id}", "content", "get_content_details", "Get content details by ID", ("content_id",)),
+    ("PUT", "content/{content_id}", "content", "update_content_metadata", "Update content metadata", ("content_id",)),
+    ("PATCH", "content/{content_id}/attribute/{attribute}", "content", "update_content_attribute", "Update a single content attribute", ("content_id", "attribute")),
+    ("GET", "content", "content", "list_content_by_publisher", "List content by publisher with pagination", None, ("publisher_id", "limit", "pagination_token", "created_after", "created_before")),
+    ("POST", "content/search", "content", "search_content", "Search content with flexible parameters and pagination"),
+    ("POST", "content/{content_id}/archive", "content", "archive_content", "Archive content", ("content_id",)),
+    ("GET", "content/query/{attribute}/{value}", "content", "query_by_attribute", "Query content by any attribute", ("attribute", "value"), ("limit", "pagination_token")),
+    # License Management Routes
+    ("POST", "licenses", "license", "create_license", "Create a new license"),
+    ("GET", "licenses/{license_id}", "license", "get_license", "Get license by ID", ("license_id",)),
+    ("GET", "licenses", "license", "list_licenses_by_consumer", "List licenses by consumer", None, ("consumer_id", "created_after", "created_before")),
+    ("GET", "licenses/content/{content_id}", "license", "list_licenses_by_content", "List licenses by content", ("content_id",), ("created_after", "created_before")),
+    ("POST", "licenses/{license_id}/revoke", "license", "revoke_license", "Revoke a license", ("license_id",)),
+    # Analytics Routes
+    ("POST", "analytics/access", "analytics", "log_content_access", "Log content access"),
+    ("GET", "analytics/content/{content_id}", "analytics", "get_usage_report_by_content", "Get usage report by content", ("content_id",)),
+    ("GET", "analytics/consumer/{consumer_id}", "analytics", "get_usage_report_by_consumer", "Get usage report by consumer", ("consumer_id",)),
+    # Google Books API Routes
+    ("GET", "books", "google_books", "get_book_details_many", "Get complete book details for several ISBNs", None, ("isbns",)),
+    ("GET", "books/{isbn}", "google_books", "get_book_details", "Get complete book details by ISBN", ("isbn",)),
+    ("GET", "books/{isbn}/filtered", "google_books", "get_book_details_filtered", "Get filtered book details by ISBN", ("isbn",), ("fields",)),
+    ("GET", "books/author/{author_name}", "google_books", "get_books_by_author", "Get all books by a specific author", ("author_name",), ("max_results",)),
+    ("GET", "books/author/{author_name}/filtered", "google_books", "get_books_by_author_filtered", "Get filtered book details for all books by a specific author", ("author_name",), ("fields", "max_results")),
+    # S3 Upload Routes
+    ("POST", "uploads/url", "s3_upload", "generate_presigned_upload_url", "Generate a presigned URL for direct file upload to S3"),
+    ("GET", "uploads/download/{key}", "s3_upload", "generate_presigned_download_url", "Generate a presigned URL for file download from S3", ("key",)),
+    # S3 Multipart Upload Routes
+    ("POST", "uploads/multipart/init", "s3_upload", "initiate_multipart_upload", "Initiate a multipart upload process"),
+    ("POST", "uploads/multipart/part-url", "s3_upload", "generate_presigned_part_upload_url", "Generate a presigned URL for uploading a specific part"),
+    ("POST", "uploads/multipart/complete", "s3_upload", "complete_multipart_upload", "Complete a multipart upload after all parts have been uploaded"),
+    ("DELETE", "uploads/multipart/abort", "s3_upload", "abort_multipart_upload", "Abort a multipart upload and remove any uploaded parts"),
+    ("GET", "uploads/multipart/parts", "s3_upload", "list_parts", "List all parts that have been uploaded for a specific multipart upload"),
+)
+
+# Built once at import; positional construction avoids per-route kwarg packing
+_ALL_ROUTES: Tuple[ApiRoute, ...] = tuple(ApiRoute(*row) for row in _ROUTE_TABLE)
+
+
+def _index_by_processor(routes: Tuple[ApiRoute, ...]) -> Dict[str, Tuple[ApiRoute, ...]]:
+    """Group routes by the processor that handles them"""
+    by_processor = defaultdict(list)
+    for route in routes:
+        by_processor[route.processor_name].append(route)
+    return {processor_name: tuple(group) for processor_name, group in by_processor.items()}
+
+
+# Lookup indexes over _ALL_ROUTES, also built once at import
+_BY_METHOD_PATH: Dict[Tuple[str, str], ApiRoute] = {(route.method, route.path): route for route in _ALL_ROUTES}
+_BY_PROCESSOR: Dict[str, Tuple[ApiRoute, ...]] = _index_by_processor(_ALL_ROUTES)
+
+
+class _RouteTrieNode:
+    """One path segment in the route trie"""
+    __slots__ = ("children", "dynamic", "routes")
+
+    def __init__(self):
+        self.children: Dict[str, "_RouteTrieNode"] = {}  # literal segment -> node
+        self.dynamic: Optional["_RouteTrieNode"] = None  # node for a {param} segment
+        self.routes: Dict[str, ApiRoute] = {}  # HTTP method -> route ending here
+
+
+class KnowlioApiRouteTrie:
+    """
+    Segment trie over route paths for request-time resolution.
+    Lookup cost depends on path depth, not on the number of routes. Literal
+    segments take precedence over {param} segments, falling back when the
+    literal branch has no route for the requested method.
+    """
+
+    def __init__(self, routes: Tuple[ApiRoute, ...]):
+        self._root = _RouteTrieNode()
+        for route in routes:
+            self._insert(route)
+
+    def _insert(self, route: ApiRoute) -> None:
+        node = self._root
+        for segment in route.path_segments:
+            if segment.startswith('{') and segment.endswith('}'):
+                if node.dynamic is None:
+                    node.dynamic = _RouteTrieNode()
+                node = node.dynamic
+            else:
+                node = node.children.setdefault(segment, _RouteTrieNode())
+        node.routes.setdefault(route.method, route)
+
+    def resolve(self, method: str, path: str) -> Optional[Tuple[ApiRoute, Dict[str, str]]]:
+        """Find the route for a request, along with its extracted path parameters"""
+        values: List[str] = []
+        route = self._match(self._root, path.split('/'), 0, method, values)
+        if route is None:
+            return None
+        return route, dict(zip(route.path_parameter_names, values))
+
+    def _match(self, node: _RouteTrieNode, segments: List[str], index: int,
+               method: str, values: List[str]) -> Optional[ApiRoute]:
+        if index == len(segments):
+            return node.routes.get(method)
+
+        child = node.children.get(segments[index])
+        if child is not None:
+            route = self._match(child, segments, index + 1, method, values)
+            if route is not None:
+                return route
+
+        if node.dynamic is not None:
+            values.append(segments[index])
+            route = self._match(node.dynamic, segments, index + 1, method, values)
+            if route is not None:
+                return route
+            values.pop()
+
+        return None
+
+
+_ROUTE_TRIE = KnowlioApiRouteTrie(_ALL_ROUTES)
+
+
+class KnowlioApiRoutes:
+    """Central configuration for all Knowlio API routes"""
+    
+    @staticmethod
+    def get_all_routes() -> Tuple[ApiRoute, ...]:
+        """Return all API routes for the Knowlio system"""
+        return _ALL_ROUTES
+    
+    @staticmethod
+    def get_routes_by_processor(processor_name: str) -> Tuple[ApiRoute, ...]:
+        """Get all routes for a specific processor"""
+        return _BY_PROCESSOR.get(processor_name, ())
+    
+    @staticmethod
+    def get_route_by_method_and_path(method: str, path: str) -> Optional[ApiRoute]:
+        """Get a specific route by HTTP method and path"""
+        return _BY_METHOD_PATH.get((method, path))
+    
+    @staticmethod
+    def resolve(method: str, path: str) -> Optional[Tuple[ApiRoute, Dict[str, str]]]:
+        """Match a concrete request path (e.g. users/123) to a route and its path parameters"""
+        return _ROUTE_TRIE.resolve(method, path)
@@ -14,20 +14,33 @@ DEFAULT_FIELDS = BookDefaultFields.DEFAULT_FIELDS
 # Mandatory fields that will always be included in responses
 MANDATORY_FIELDS = BookDefaultFields.MANDATORY_FIELDS
 
-# Field mappings between Google Books API response and our standardized format
+# Field mappings between Google Books API response and our standardized format,
+# resolved to plain str -> str once at import so lookups never touch the enum
 FIELD_MAPPINGS = {
-    BookField.ISBN.value: "industryIdentifiers",  # Special handling required for ISBN
-    BookField.TITLE.value: "title",
-    BookField.AUTHORS.value: "authors",
-    BookField.PUBLISHER.value: "publisher",
-    BookField.PUBLISHED_DATE.value: "publishedDate",
-    BookField.DESCRIPTION.value: "description",
-    BookField.PAGE_COUNT.value: "pageCount",
-    BookField.CATEGORIES.value: "categories",
-    BookField.IMAGE_LINKS.value: "imageLinks",
-    BookField.LANGUAGE.value: "language",
-    BookField.ID.value: "id",
-    BookField.MATURITY_RATING.value: "maturityRating",
-    BookField.AVERAGE_RATING.value: "averageRating",
-    BookField.RATINGS_COUNT.value: "ratingsCount"
+    field.value: api_field
+    for field, api_field in (
+        (BookField.ISBN, "industryIdentifiers"),  # Special handling required for ISBN
+        (BookField.TITLE, "title"),
+        (BookField.AUTHORS, "authors"),
+        (BookField.PUBLISHER, "publisher"),
+        (BookField.PUBLISHED_DATE, "publishedDate"),
+        (BookField.DESCRIPTION, "description"),
+        (BookField.PAGE_COUNT, "pageCount"),
+        (BookField.CATEGORIES, "categories"),
+        (BookField.IMAGE_LINKS, "imageLinks"),
+        (BookField.LANGUAGE, "language"),
+        (BookField.ID, "id"),
+        (BookField.MATURITY_RATING, "maturityRating"),
+        (BookField.AVERAGE_RATING, "averageRating"),
+        (BookField.RATINGS_COUNT, "ratingsCount"),
+    )
 }
+
+# Google Books API field -> standardized field
+REVERSE_FIELD_MAPPINGS = {api_field: field for field, api_field in FIELD_MAPPINGS.items()}
+
+# Concurrent Google Books requests made for one multi-ISBN lookup
+MAX_CONCURRENT_LOOKUPS = 20
+
+# Most ISBNs accepted by a single multi-ISBN lookup
+MAX_ISBNS_PER_LOOKUP = 100
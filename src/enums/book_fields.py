@@ -4,6 +4,7 @@ Provides standardized, type-safe constants for book attributes.
 """
 
 from enum import Enum
+from typing import Final, Tuple
 
 
 class BookField(Enum):
@@ -29,12 +30,12 @@ class BookField(Enum):
     @classmethod
     def get_all_fields(cls) -> list:
         """Get a list of all field names as strings"""
-        return [field.value for field in cls]
+        return list(_BOOK_FIELD_VALUES)
 
     @classmethod
     def is_valid(cls, field: str) -> bool:
         """Check if a string value is a valid book field"""
-        return field in cls.get_all_fields()
+        return isinstance(field, str) and field in _BOOK_FIELD_VALUE_SET
 
 
 class BookImageLink(Enum):
@@ -52,7 +53,12 @@ class BookImageLink(Enum):
     @classmethod
     def get_all_types(cls) -> list:
         """Get a list of all image link types as strings"""
-        return [link_type.value for link_type in cls]
+        return list(_BOOK_IMAGE_LINK_VALUES)
+
+
+_BOOK_FIELD_VALUES = tuple(field.value for field in BookField)
+_BOOK_FIELD_VALUE_SET = frozenset(_BOOK_FIELD_VALUES)
+_BOOK_IMAGE_LINK_VALUES = tuple(link_type.value for link_type in BookImageLink)
 
 
 class BookDataSource(Enum):
@@ -69,18 +75,21 @@ class BookDataSource(Enum):
 class BookDefaultFields:
     """
     Class holding default field selections for book APIs.
-    Used for consistent default field selection across the application.
+    Used for consistent field selection across the application; tuples so the
+    shared defaults can't be mutated by callers.
     """
-    DEFAULT_FIELDS = [
+    __slots__ = ()
+
+    DEFAULT_FIELDS: Final[Tuple[str, ...]] = (
         BookField.TITLE.value,
-        BookField.AUTHORS.value, 
+        BookField.AUTHORS.value,
         BookField.ISBN.value,
         BookField.PUBLISHER.value,
-        BookField.PUBLISHED_DATE.value
-    ]
-    
-    MANDATORY_FIELDS = [
+        BookField.PUBLISHED_DATE.value,
+    )
+
+    MANDATORY_FIELDS: Final[Tuple[str, ...]] = (
         BookField.TITLE.value,
         BookField.AUTHORS.value,
-        BookField.ISBN.value
-    ]
+        BookField.ISBN.value,
+    )
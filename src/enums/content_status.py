@@ -18,12 +18,12 @@ class ContentStatus(Enum):
     @classmethod
     def get_valid_statuses(cls) -> list:
         """Get a list of all valid status values as strings"""
-        return [status.value for status in cls]
+        return list(_CONTENT_STATUS_VALUES)
 
     @classmethod
     def is_valid(cls, status: str) -> bool:
         """Check if a string value is a valid content status"""
-        return status in cls.get_valid_statuses()
+        return isinstance(status, str) and status in _CONTENT_STATUS_VALUE_SET
 
 
 class WorkflowStatus(Enum):
@@ -37,9 +37,16 @@ class WorkflowStatus(Enum):
     @classmethod
     def get_valid_statuses(cls) -> list:
         """Get a list of all valid workflow status values as strings"""
-        return [status.value for status in cls]
+        return list(_WORKFLOW_STATUS_VALUES)
 
     @classmethod
     def is_valid(cls, status: str) -> bool:
         """Check if a string value is a valid workflow status"""
-        return status in cls.get_valid_statuses()
+        return isinstance(status, str) and status in _WORKFLOW_STATUS_VALUE_SET
+
+
+# Member values, computed once (an enum body can't hold them as plain attributes)
+_CONTENT_STATUS_VALUES = tuple(status.value for status in ContentStatus)
+_CONTENT_STATUS_VALUE_SET = frozenset(_CONTENT_STATUS_VALUES)
+_WORKFLOW_STATUS_VALUES = tuple(status.value for status in WorkflowStatus)
+_WORKFLOW_STATUS_VALUE_SET = frozenset(_WORKFLOW_STATUS_VALUES)
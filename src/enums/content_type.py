@@ -20,9 +20,13 @@ class ContentType(Enum):
     @classmethod
     def get_valid_types(cls) -> list:
         """Get a list of all valid content types as strings"""
-        return [content_type.value for content_type in cls]
+        return list(_CONTENT_TYPE_VALUES)
 
     @classmethod
     def is_valid(cls, content_type: str) -> bool:
         """Check if a string value is a valid content type"""
-        return content_type in cls.get_valid_types()
+        return isinstance(content_type, str) and content_type in _CONTENT_TYPE_VALUE_SET
+
+
+_CONTENT_TYPE_VALUES = tuple(content_type.value for content_type in ContentType)
+_CONTENT_TYPE_VALUE_SET = frozenset(_CONTENT_TYPE_VALUES)
@@ -3,9 +3,10 @@ API Gateway Lambda handler for Knowlio REST API.
 Transforms API Gateway events into processor events and handles HTTP responses.
 """
 
-import json
-import traceback
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import orjson
 
 from exceptions.processor_exceptions.exceptions import ProcessorNotFoundError, InvalidInputError, \
     ProcessorExecutionError
@@ -16,18 +17,25 @@ from sync_processor_registry.processor_registry import ProcessorRegistry
 
 logger = LoggerHelper(__name__).get_logger()
 
+# Import and register all processors (and the AWS clients their helpers create)
+# once during Lambda init, so that work is done before the first request and
+# captured by provisioned concurrency
+_PROCESSORS_LOADED = load_all_processors()
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Main Lambda handler for API Gateway events.
     Transforms REST API calls into processor events.
     """
-    logger.info("Received API Gateway event: %s", json.dumps(event, default=str))
+    global _PROCESSORS_LOADED
+    logger.debug("api_gateway_event_received", extra={"event": event})
+
+    # Only retries modules that failed to import during init
+    if not _PROCESSORS_LOADED:
+        _PROCESSORS_LOADED = load_all_processors()
 
     try:
-        # Load all processors
-        load_all_processors()
-        
         # Check if this is an API Gateway event
         if _is_api_gateway_event(event):
             return _handle_api_gateway_event(event, context)
@@ -67,12 +75,13 @@ def _handle_api_gateway_event(event: Dict[str, Any], context: Any) -> Dict[str,
     logger.info("Processing API Gateway request: %s %s", http_method, path)
     
     # Find matching route
-    route = _find_matching_route(http_method, path)
-    if not route:
+    match = _find_matching_route(http_method, path)
+    if not match:
         return _http_response(404, {"error": "Route not found", "message": f"No route found for {http_method} /{path}"})
+    route, path_params = match
     
     # Extract and build payload
-    payload = _build_payload_from_api_gateway_event(event, route)
+    payload = _build_payload_from_api_gateway_event(event, route, path_params)
     
     # Execute processor
     processor = _resolve_processor(route.processor_name)
@@ -96,72 +105,58 @@ def _handle_direct_processor_event(event: Dict[str, Any], context: Any) -> Dict[
     return _http_response(200, result)
 
 
-def _find_matching_route(http_method: str, path: str) -> Optional[ApiRoute]:
-    """Find a matching route configuration for the given HTTP method and path"""
+def _find_matching_route(http_method: str, path: str) -> Optional[Tuple[ApiRoute, Dict[str, str]]]:
+    """Find a matching route configuration, and its path parameters, for the given HTTP method and path"""
     
-    # First try exact match
-    for route in KnowlioApiRoutes.get_all_routes():
-        if route.method == http_method and route.path == path:
-            return route
+    # Literal paths are a single dict lookup; parametric paths go through the
+    # route trie, so neither depends on the number of routes
+    route = KnowlioApiRoutes.get_route_by_method_and_path(http_method, path)
+    if route is not None:
+        return route, {}
     
-    # Then try path parameter matching
-    for route in KnowlioApiRoutes.get_all_routes():
-        if route.method == http_method and _path_matches_with_parameters(route.path, path):
-            return route
-    
-    return None
+    return KnowlioApiRoutes.resolve(http_method, path)
 
 
-def _path_matches_with_parameters(route_path: str, request_path: str) -> bool:
-    """Check if a route path matches a request path, considering path parameters"""
-    route_segments = route_path.split('/')
-    request_segments = request_path.split('/')
-    
-    if len(route_segments) != len(request_segments):
-        return False
-    
-    for route_seg, request_seg in zip(route_segments, request_segments):
-        # If route segment is a parameter (contains {}), it matches any value
-        if not (route_seg.startswith('{') and route_seg.endswith('}')) and route_seg != request_seg:
-            return False
-    
-    return True
-
-
-def _build_payload_from_api_gateway_event(event: Dict[str, Any], route: ApiRoute) -> Dict[str, Any]:
+def _build_payload_from_api_gateway_event(event: Dict[str, Any], route: ApiRoute,
+                                          path_params: Dict[str, str]) -> Dict[str, Any]:
     """Build processor payload from API Gateway event"""
-    payload = {}
-    
-    # Add path parameters
-    if route.path_parameters:
-        path_params = event.get("pathParameters") or {}
-        payload.update(path_params)
-    
-    # Add query parameters
-    if route.query_parameters:
-        query_params = event.get("queryStringParameters") or {}
-        payload.update(query_params)
+    reads_query, reads_body = _PAYLOAD_SOURCES[route]
+    query_params = (event.get("queryStringParameters") or _EMPTY) if reads_query else _EMPTY
+    body_data = _parse_body(event) if reads_body else _EMPTY
     
-    # Add body content for POST/PUT requests
-    if event.get("httpMethod") in ["POST", "PUT", "PATCH"]:
-        body = event.get("body")
-        if body:
-            try:
-                body_data = json.loads(body)
-                if isinstance(body_data, dict):
-                    payload.update(body_data)
-            except json.JSONDecodeError:
-                logger.warning("Failed to parse request body as JSON")
+    # Path parameters come from the route match: most routes are deployed behind
+    # a greedy {proxy+} resource, where API Gateway only passes "proxy".
+    # Later sources win on key clashes, and the payload is built in one pass.
+    payload = {**path_params, **query_params, **body_data}
     
-    # Add headers if needed (can be used for authentication, etc.)
-    headers = event.get("headers") or {}
-    if headers:
-        payload["_headers"] = headers
-    
-    logger.info("Built payload for processor: %s", json.dumps(payload, default=str))
+    logger.debug("processor_payload_built", extra={"payload": payload})
     return payload
 
 
+def _parse_body(event: Dict[str, Any]) -> Mapping[str, Any]:
+    """JSON object body of the request, or an empty mapping"""
+    body = event.get("body")
+    if body:
+        try:
+            body_data = orjson.loads(body)
+            if isinstance(body_data, dict):
+                return body_data
+        except orjson.JSONDecodeError:
+            logger.warning("Failed to parse request body as JSON")
+    return _EMPTY
+
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+
+# Which request parts each route reads (query string, JSON body), resolved once
+# per route during Lambda init so requests skip the parts that can't apply
+_PAYLOAD_SOURCES: Dict[ApiRoute, Tuple[bool, bool]] = {
+    route: (bool(route.query_parameters), route.method in _BODY_METHODS)
+    for route in KnowlioApiRoutes.get_all_routes()
+}
+
+
 def _resolve_processor(processor_name: str):
     """Resolve processor class from registry"""
     try:
@@ -172,30 +167,43 @@ def _resolve_processor(processor_name: str):
         raise ProcessorNotFoundError(str(e))
 
 
+# Processors are stateless, so one instance per class is reused for the
+# container's lifetime (a Lambda instance handles one request at a time)
+_PROCESSOR_INSTANCES: Dict[type, Any] = {}
+
+
 def _execute_processor(processor_class, action: str, payload: Dict[str, Any]) -> Any:
     """Execute processor with the given action and payload"""
     try:
-        logger.info("Executing processor with action: %s, payload: %s", action, json.dumps(payload, default=str))
-        processor_instance = processor_class()
+        logger.info("Executing processor with action: %s", action)
+        logger.debug("processor_payload", extra={"action": action, "payload": payload})
+        processor_instance = _PROCESSOR_INSTANCES.get(processor_class)
+        if processor_instance is None:
+            processor_instance = _PROCESSOR_INSTANCES[processor_class] = processor_class()
         return processor_instance.process(action, payload)
     except Exception as e:
-        logger.error("Processor execution failed: %s", str(e))
-        logger.error("Traceback:\n%s", traceback.format_exc())
+        logger.exception("Processor execution failed: %s", str(e))
         raise ProcessorExecutionError("Processor execution failed due to an unexpected error.")
 
 
+# Same on every response; shared by reference since the runtime only serializes it
+_RESPONSE_HEADERS = {
+    "Content-Type": "application/json",
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
+    "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS"
+}
+
+
 def _http_response(status_code: int, body: Any) -> Dict[str, Any]:
     """Create HTTP response with CORS headers"""
     response = {
         "statusCode": status_code,
-        "headers": {
-            "Content-Type": "application/json",
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
-            "Access-Control-Allow-Methods": "GET,POST,PUT,DELETE,OPTIONS"
-        },
-        "body": json.dumps(body, default=str)
+        "headers": _RESPONSE_HEADERS,
+        # API Gateway expects the body as a str
+        "body": orjson.dumps(body, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
     }
     
-    logger.info("Returning HTTP response: %s", json.dumps(response, default=str))
+    logger.info("Returning HTTP response: %d", status_code)
+    logger.debug("http_response", extra={"response": response})
     return response
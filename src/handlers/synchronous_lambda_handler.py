@@ -1,7 +1,7 @@
-import json
-import traceback
 from typing import Any, Dict
 
+import orjson
+
 from exceptions.processor_exceptions.exceptions import ProcessorNotFoundError, InvalidInputError, \
     ProcessorExecutionError
 from helpers.common_helper.logger_helper import LoggerHelper
@@ -11,12 +11,19 @@ from sync_processor_registry.processor_registry import ProcessorRegistry
 
 logger = LoggerHelper(__name__).get_logger()
 
+# Register all processors once during Lambda init rather than per invocation
+_PROCESSORS_LOADED = load_all_processors()
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
-    logger.info("Received event: %s", json.dumps(event))
+    global _PROCESSORS_LOADED
+    logger.debug("event_received", extra={"event": event})
+
+    # Only retries modules that failed to import during init
+    if not _PROCESSORS_LOADED:
+        _PROCESSORS_LOADED = load_all_processors()
 
     try:
-        load_all_processors()
         processor_name, action, payload = _parse_event(event)
         processor = _resolve_processor(processor_name)
         result = _execute_processor(processor, action, payload)
@@ -56,18 +63,26 @@ def _resolve_processor(processor_name: str):
         raise ProcessorNotFoundError(str(e))
 
 
+# Processors are stateless, so one instance per class is reused for the
+# container's lifetime (a Lambda instance handles one request at a time)
+_PROCESSOR_INSTANCES: Dict[type, Any] = {}
+
+
 def _execute_processor(processor_class, action: str, payload: Dict[str, Any]) -> Any:
     try:
-        logger.info("Executing processor with action: %s, payload: %s", action, json.dumps(payload, default=str))
-        processor_instance = processor_class()
+        logger.info("Executing processor with action: %s", action)
+        logger.debug("processor_payload", extra={"action": action, "payload": payload})
+        processor_instance = _PROCESSOR_INSTANCES.get(processor_class)
+        if processor_instance is None:
+            processor_instance = _PROCESSOR_INSTANCES[processor_class] = processor_class()
         return processor_instance.process(action, payload)
     except Exception as e:
-        logger.error("Processor execution failed: %s", str(e))
-        logger.error("Traceback:\n%s", traceback.format_exc())
+        logger.exception("Processor execution failed: %s", str(e))
         raise ProcessorExecutionError("Processor execution failed due to an unexpected error.")
 
 
 def _response(status_code: int, body: Any) -> Dict[str, Any]:
-    response = {"statusCode": status_code, "body": json.dumps(body, default=str)}
-    logger.info("Returning response: %s", json.dumps(response, default=str))
+    response = {"statusCode": status_code, "body": orjson.dumps(body, default=str, option=orjson.OPT_NON_STR_KEYS).decode()}
+    logger.info("Returning response: %d", status_code)
+    logger.debug("response", extra={"response": response})
     return response
@@ -0,0 +1,52 @@
+"""
+Kinesis consumer that batch-writes usage logs into the usage_logs table.
+The API Lambda puts access logs on the stream instead of writing DynamoDB on the request path.
+"""
+
+import base64
+import json
+from decimal import Decimal
+from typing import Any, Dict, List
+
+from helpers.app_logic_helpers.analytics_helper import USAGE_LOGS_TABLE
+from helpers.app_logic_helpers.usage_stats_helper import UsageStatsHelper
+from helpers.aws_service_helpers.dynamodb_helper import DynamoDBHelper
+from helpers.common_helper.logger_helper import LoggerHelper
+
+logger = LoggerHelper(__name__).get_logger()
+
+_db = DynamoDBHelper(table_name=USAGE_LOGS_TABLE, use_dax=False)
+_stats = UsageStatsHelper()
+
+
+def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
+    records = event.get("Records", [])
+    logger.info("Received %d usage log records", len(records))
+
+    # DynamoDB rejects floats, so numbers in log metadata are decoded as Decimal
+    items = [
+        json.loads(base64.b64decode(record["kinesis"]["data"]), parse_float=Decimal)
+        for record in records
+    ]
+
+    # Items are keyed by (shard_pk, log_id), so a retried batch overwrites rather than duplicates
+    try:
+        _db.batch_write_items(items)
+    except Exception:
+        logger.exception("Failed to write %d usage logs", len(items))
+        return _failed_from(records, 0)
+
+    # Report counters are added once the logs are stored; logs already counted
+    # (a retried or bisected batch) are skipped
+    for position, item in enumerate(items):
+        try:
+            _stats.record_log(item)
+        except Exception:
+            logger.exception("Failed to count usage log %s", item.get("log_id"))
+            return _failed_from(records, position)
+    return {"batchItemFailures": []}
+
+
+def _failed_from(records: List[Dict[str, Any]], position: int) -> Dict[str, Any]:
+    """Partial batch response: the stream is retried from records[position] onwards"""
+    return {"batchItemFailures": [{"itemIdentifier": records[position]["kinesis"]["sequenceNumber"]}]}
@@ -1,29 +1,68 @@
-import json
+import os
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, List, Optional
 
+import botocore.exceptions
+import orjson
+from boto3.dynamodb.conditions import Attr
+
+from helpers.app_logic_helpers.usage_stats_helper import REPORT_DIMENSIONS, UsageStatsHelper
 from helpers.aws_service_helpers.dynamodb_helper import DynamoDBHelper
+from helpers.aws_service_helpers.kinesis_helper import KinesisHelper
 from helpers.aws_service_helpers.s3_helper import S3Helper
 from helpers.common_helper.logger_helper import LoggerHelper
 from models.usage_log_model import UsageLogModel
 
 logger = LoggerHelper(__name__).get_logger()
 
-USAGE_LOGS_TABLE = "usage_logs"
+USAGE_LOGS_TABLE = "usage_logs_v2"
 EXPORT_BUCKET = "knowlio-exports"
 
+# usage_logs_v2 is write-sharded: partition key is shard_pk, sort key is log_id.
+# Must match the shard count the table was deployed with (knowlio:usage_log_shards).
+USAGE_LOG_SHARDS = int(os.environ.get("USAGE_LOG_SHARDS", "10"))
+USAGE_LOG_SHARD_PREFIX = "USAGE#"
+
+# GSI keyed by (shard_pk, access_time): a date range is read with one bounded
+# query per shard instead of reading every log
+USAGE_LOG_ACCESS_TIME_INDEX = "access_time-index"
+
+# Number of most recent logs included in the usage reports
+RECENT_LOGS_COUNT = 10
+
+# When set, access logs are put on this Kinesis stream and batch-written to
+# usage_logs by the stream consumer, keeping DynamoDB off the request path
+USAGE_LOG_STREAM = os.environ.get("USAGE_LOG_STREAM")
+
+
+def usage_log_shard_key(log_id: str) -> str:
+    """Shard partition key for a log, derived from its random UUID so writes spread evenly
+    and a log can still be fetched by ID alone"""
+    return f"{USAGE_LOG_SHARD_PREFIX}{uuid.UUID(log_id).int % USAGE_LOG_SHARDS}"
+
+
 class AnalyticsHelper:
     def __init__(self):
-        self.db = DynamoDBHelper(table_name=USAGE_LOGS_TABLE)
+        # Append-only logs are rarely re-read by key, so they bypass the DAX cache
+        self.db = DynamoDBHelper(table_name=USAGE_LOGS_TABLE, use_dax=False)
         self.s3 = S3Helper(bucket_name=EXPORT_BUCKET)
+        self.stream = KinesisHelper(stream_name=USAGE_LOG_STREAM) if USAGE_LOG_STREAM else None
+        self.stats = UsageStatsHelper()
 
     def log_content_access(self, log_data: Dict) -> Dict:
         """Log content access by a consumer"""
-        usage_log = UsageLogModel(log_data)
-        log_item = usage_log.__dict__
+        log_item = UsageLogModel.to_item(log_data)
+        log_item["shard_pk"] = usage_log_shard_key(log_item["log_id"])
 
-        logger.info("Logging content access: %s", log_item)
-        self.db.put_item(log_item)
+        logger.info("Logging content access: %s", log_item["log_id"])
+        if self.stream:
+            self.stream.put_record(log_item, partition_key=log_item["log_id"])
+        else:
+            self.db.put_item(log_item)
+            self.stats.record_logs([log_item])
         return {
             "message": "Content access logged successfully", 
             "log_id": log_item["log_id"]
@@ -32,63 +71,29 @@ class AnalyticsHelper:
     def get_usage_report_by_content(self, content_id: str) -> Dict:
         """Retrieve usage report for a specific content item"""
         logger.info("Fetching usage report for content_id: %s", content_id)
-        
-        # Query all logs for this content
-        logs = self.db.query_items("content_id", content_id)
-        
-        # Aggregate statistics
-        total_accesses = len(logs)
-        unique_consumers = len(set(log.get("consumer_id", "") for log in logs))
-        access_types = {}
-        regions = {}
-        
-        for log in logs:
-            # Count access types
-            access_type = log.get("access_type", "VIEW")
-            access_types[access_type] = access_types.get(access_type, 0) + 1
-            
-            # Count regions
-            region = log.get("region", "UNKNOWN")
-            regions[region] = regions.get(region, 0) + 1
+        stats = self._get_report_stats("content_id", content_id)
 
         return {
             "content_id": content_id,
-            "total_accesses": total_accesses,
-            "unique_consumers": unique_consumers,
-            "access_types": access_types,
-            "regions": regions,
-            "recent_logs": logs[:10]  # Return 10 most recent logs
+            "total_accesses": stats["total_accesses"],
+            "unique_consumers": stats["unique_count"],
+            "access_types": stats["access_type"],
+            "regions": stats["region"],
+            "recent_logs": stats["recent_logs"]
         }
 
     def get_usage_report_by_consumer(self, consumer_id: str) -> Dict:
         """Retrieve usage report across all content for a consumer"""
         logger.info("Fetching usage report for consumer_id: %s", consumer_id)
-        
-        # Query all logs for this consumer
-        logs = self.db.query_items("consumer_id", consumer_id)
-        
-        # Aggregate statistics
-        total_accesses = len(logs)
-        unique_content = len(set(log.get("content_id", "") for log in logs))
-        access_types = {}
-        publishers = {}
-        
-        for log in logs:
-            # Count access types
-            access_type = log.get("access_type", "VIEW")
-            access_types[access_type] = access_types.get(access_type, 0) + 1
-            
-            # Count publishers
-            publisher_id = log.get("publisher_id", "UNKNOWN")
-            publishers[publisher_id] = publishers.get(publisher_id, 0) + 1
+        stats = self._get_report_stats("consumer_id", consumer_id)
 
         return {
             "consumer_id": consumer_id,
-            "total_accesses": total_accesses,
-            "unique_content": unique_content,
-            "access_types": access_types,
-            "publishers": publishers,
-            "recent_logs": logs[:10]  # Return 10 most recent logs
+            "total_accesses": stats["total_accesses"],
+            "unique_content": stats["unique_count"],
+            "access_types": stats["access_type"],
+            "publishers": stats["publisher_id"],
+            "recent_logs": stats["recent_logs"]
         }
 
     def export_usage_logs(self, export_params: Dict) -> Dict:
@@ -100,37 +105,43 @@ class AnalyticsHelper:
 
         logger.info("Exporting usage logs from %s to %s", from_date, to_date)
 
-        # Get all logs (in production, you'd want to add date filtering)
-        # For now, we'll get all logs and filter client-side
-        all_logs = self.db.scan_table()
-        
-        # Filter by date range if provided
-        filtered_logs = []
-        for log in all_logs:
-            log_time = log.get("access_time", "")
-            if from_date and to_date:
-                if from_date <= log_time <= to_date:
-                    if not region_filter or log.get("region") == region_filter:
-                        filtered_logs.append(log)
-            else:
-                if not region_filter or log.get("region") == region_filter:
-                    filtered_logs.append(log)
-
-        # Convert to JSONL format
-        jsonl_data = "\n".join(json.dumps(log) for log in filtered_logs)
-        
         # Generate S3 key
         current_time = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
         date_folder = datetime.now(timezone.utc).strftime("%Y-%m-%d")
         s3_key = self.s3.generate_export_key("usage-logs", date_folder, current_time, format_type)
-        
-        # Upload to S3
-        s3_url = self.s3.upload_data_as_json(jsonl_data, s3_key)
+
+        # Date range is applied as a key condition and region as a filter, per
+        # shard; pages are streamed to S3 as they arrive instead of being collected
+        region_condition = Attr("region").eq(region_filter) if region_filter else None
+        try:
+            with self.s3.create_multipart_writer(s3_key) as writer:
+                total_records = self._write_all_shards(
+                    writer,
+                    index_name=USAGE_LOG_ACCESS_TIME_INDEX,
+                    range_key_name="access_time",
+                    range_start=from_date or None,
+                    range_end=to_date or None,
+                    filter_expression=region_condition
+                )
+        except botocore.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ValidationException":
+                raise
+            # Index not created yet (e.g. table deployed before it was added)
+            logger.warning("Querying %s failed, filtering all logs instead: %s", USAGE_LOG_ACCESS_TIME_INDEX, e)
+            filtered_logs = [
+                log for log in self._query_all_shards()
+                if (not from_date or from_date <= log.get("access_time", ""))
+                and (not to_date or log.get("access_time", "") <= to_date)
+                and (not region_filter or log.get("region") == region_filter)
+            ]
+            with self.s3.create_multipart_writer(s3_key) as writer:
+                total_records = self._write_jsonl(writer, filtered_logs)
+        s3_url = writer.url
         
         return {
             "message": "Usage logs exported successfully",
             "export_location": s3_url,
-            "total_records": len(filtered_logs),
+            "total_records": total_records,
             "format": format_type,
             "date_range": {
                 "from": from_date,
@@ -141,4 +152,73 @@ class AnalyticsHelper:
     def get_log_by_id(self, log_id: str) -> Optional[Dict]:
         """Get a specific usage log by ID"""
         logger.info("Fetching usage log for log_id: %s", log_id)
-        return self.db.get_item({"log_id": log_id})
+        try:
+            shard_pk = usage_log_shard_key(log_id)
+        except ValueError:
+            logger.warning("Invalid usage log ID: %s", log_id)
+            return None
+        return self.db.get_item({"shard_pk": shard_pk, "log_id": log_id})
+
+    def _get_report_stats(self, subject: str, value: str) -> Dict:
+        """Usage counters (see UsageStatsHelper.get_stats) plus the most recent logs,
+        newest first, for one content_id or consumer_id"""
+        # Counters only cover earlier logs once backfill_usage_stats.py has run
+        stats = self.stats.get_stats(subject, value) if self.stats.is_backfilled() else None
+        if stats is not None:
+            stats["recent_logs"] = self.db.query_items(
+                subject, value, limit=RECENT_LOGS_COUNT, scan_index_forward=False)["items"]
+            return stats
+
+        # No counters recorded, or not yet backfilled: count the logs
+        logs = self._query_report_logs(subject, value)
+        unique_field, breakdowns = REPORT_DIMENSIONS[subject]
+        stats = {
+            "total_accesses": len(logs),
+            "unique_count": len({log[unique_field] for log in logs if unique_field in log}),
+            "recent_logs": logs[-RECENT_LOGS_COUNT:][::-1],
+        }
+        for field, default in breakdowns:
+            stats[field] = dict(Counter(log.get(field, default) for log in logs))
+        return stats
+
+    def _query_report_logs(self, key_name: str, key_value: str) -> List[Dict]:
+        """All logs for one content_id or consumer_id, oldest first. The aggregates
+        need every log anyway, so the recent logs are taken from the end of this
+        result rather than fetched by a second query."""
+        try:
+            return self.db.query_partition(key_name, key_value, index_name=f"{key_name}-index")
+        except botocore.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") != "ValidationException":
+                raise
+            # Index not created yet (e.g. table deployed before it was added)
+            logger.warning("Querying %s-index failed, scanning instead: %s", key_name, e)
+            logs = self.db.query_items(key_name, key_value)["items"]
+            return sorted(logs, key=lambda log: log.get("access_time", ""))
+
+    def _query_all_shards(self, **query_kwargs) -> List[Dict]:
+        """Read usage logs by querying all shard partitions in parallel; query_kwargs
+        (index, sort key range, filter) are passed to DynamoDBHelper.query_partition"""
+        shard_keys = [f"{USAGE_LOG_SHARD_PREFIX}{shard}" for shard in range(USAGE_LOG_SHARDS)]
+        with ThreadPoolExecutor(max_workers=USAGE_LOG_SHARDS) as executor:
+            shard_logs = executor.map(
+                lambda shard_pk: self.db.query_partition("shard_pk", shard_pk, **query_kwargs), shard_keys)
+            return [log for logs in shard_logs for log in logs]
+
+    def _write_all_shards(self, writer, **query_kwargs) -> int:
+        """Stream usage logs from all shard partitions (in parallel) to writer as JSONL;
+        query_kwargs are passed to DynamoDBHelper.iter_partition_pages. Returns the record count"""
+        def write_shard(shard_pk: str) -> int:
+            # Each shard fetches its next page while the current one is encoded and written
+            pages = self.db.iter_partition_pages("shard_pk", shard_pk, prefetch=True, **query_kwargs)
+            return sum(self._write_jsonl(writer, page) for page in pages)
+
+        shard_keys = [f"{USAGE_LOG_SHARD_PREFIX}{shard}" for shard in range(USAGE_LOG_SHARDS)]
+        with ThreadPoolExecutor(max_workers=USAGE_LOG_SHARDS) as executor:
+            return sum(executor.map(write_shard, shard_keys))
+
+    @staticmethod
+    def _write_jsonl(writer, logs: List[Dict]) -> int:
+        """Write logs as JSON lines (numbers read from DynamoDB are Decimal, hence default=str)"""
+        if logs:
+            writer.write(b"".join(orjson.dumps(log, default=str, option=orjson.OPT_APPEND_NEWLINE) for log in logs))
+        return len(logs)
@@ -1,19 +1,28 @@
 import uuid
-import json
-import base64
+import bisect
+import functools
+import operator
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Union
 
 import botocore.exceptions
-from helpers.aws_service_helpers.dynamodb_helper import DynamoDBHelper
+from boto3.dynamodb.conditions import Attr
+from helpers.aws_service_helpers.dynamodb_helper import ConditionFailedError, DynamoDBHelper
 from helpers.common_helper.logger_helper import LoggerHelper
-from helpers.common_helper.common_helper import Retry
+from helpers.common_helper.common_helper import Retry, decode_pagination_token, encode_pagination_token
 from models.content_model import ContentModel
 from enums.content_status import ContentStatus, WorkflowStatus
 
 logger = LoggerHelper(__name__).get_logger()
 
 CONTENT_TABLE = "content"
+CONTENT_TAGS_TABLE = "content_tags"
+
+# Enum-valued fields: validated against their enums, so matched exactly
+EXACT_MATCH_FIELDS = ("type", "status", *ContentModel.WORKFLOW_STATUS_FIELDS)
+
+# Fields stored alongside a lowercased copy (see ContentModel), used for partial matching
+LOWERCASED_FIELDS = {"title": "title_lc", "tags": "tags_lc"}
 
 class ContentValidationError(Exception):
     """Exception raised for content data validation failures."""
@@ -21,7 +30,9 @@ class ContentValidationError(Exception):
 
 class ContentHelper:
     def __init__(self):
-        self.db = DynamoDBHelper(table_name=CONTENT_TABLE)
+        self.db = DynamoDBHelper(table_name=CONTENT_TABLE, keys_only_indexes=("publisher_id-index", "type-index"))
+        # Inverted tag index: one (lowercased tag, content_id) row per tag on each content item
+        self.tags_db = DynamoDBHelper(table_name=CONTENT_TAGS_TABLE)
 
     @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
     def upload_content_metadata(self, content_data: Dict) -> Dict:
@@ -43,7 +54,10 @@ class ContentHelper:
             content_item = content_model.__dict__
             content_id = content_item["content_id"]
 
-            logger.info("Uploading content metadata: %s", content_item)
+            logger.info("Uploading content metadata: %s", content_id)
+            # Index rows go first: rows for content that failed to save are
+            # dropped when tag search results are hydrated
+            self._add_tag_rows(content_id, content_item["tags"])
             self.db.put_item(content_item)
             return {"message": "Content metadata uploaded", "content_id": content_id}
         except ValueError as e:
@@ -106,11 +120,6 @@ class ContentHelper:
         """
         logger.info("Updating content metadata for content_id: %s with: %s", content_id, updates)
         
-        # Get current content to validate changes
-        content = self.get_content_details(content_id)
-        if not content:
-            raise ContentValidationError(f"Content not found with ID: {content_id}")
-        
         # Validate type if changing
         if "type" in updates:
             try:
@@ -124,15 +133,41 @@ class ContentHelper:
             raise ContentValidationError(f"Invalid status: {updates['status']}. Valid statuses: {valid_statuses}")
             
         # Validate workflow statuses if changing
-        for status_field in ["rag_status", "training_status", "licensing_status"]:
+        for status_field in ContentModel.WORKFLOW_STATUS_FIELDS:
             if status_field in updates and not ContentModel.validate_workflow_status(updates[status_field]):
                 valid_statuses = ", ".join(ContentModel.VALID_WORKFLOW_STATUSES)
                 raise ContentValidationError(f"Invalid {status_field}: {updates[status_field]}. Valid values: {valid_statuses}")
         
+        # Keep the lowercased search copies in step with title and tags
+        if "title" in updates:
+            updates["title_lc"] = str(updates["title"]).lower()
+        if "tags" in updates:
+            updates["tags_lc"] = [str(tag).lower() for tag in updates["tags"]]
+        
         # Add updated_at timestamp
         updates["updated_at"] = datetime.utcnow().isoformat()
         
-        return self.db.update_item("content_id", content_id, updates)
+        # A single conditional update: the condition replaces reading the item
+        # first to check that it exists
+        if "tags" not in updates:
+            try:
+                return self.db.update_item("content_id", content_id, updates,
+                                           condition_expression=Attr("content_id").exists())
+            except ConditionFailedError:
+                raise ContentValidationError(f"Content not found with ID: {content_id}")
+        
+        # Add rows for the new tags before the update (puts are idempotent) and
+        # drop rows for removed tags after it, so a failure part way never hides
+        # content from search
+        self._add_tag_rows(content_id, updates["tags"])
+        try:
+            old_content = self.db.update_item("content_id", content_id, updates,
+                                              condition_expression=Attr("content_id").exists(),
+                                              return_values="ALL_OLD")
+        except ConditionFailedError:
+            raise ContentValidationError(f"Content not found with ID: {content_id}")
+        self._remove_tag_rows(content_id, self._indexable_tags(old_content.get("tags", [])) - self._indexable_tags(updates["tags"]))
+        return {**old_content, **updates}
 
     @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
     def update_content_attribute(self, content_id: str, attribute: str, value: Any) -> Dict:
@@ -158,11 +193,6 @@ class ContentHelper:
         if "." not in attribute:
             return self.update_content_metadata(content_id, {attribute: value})
             
-        # For nested attributes, we need to get the current content first
-        content = self.get_content_details(content_id)
-        if not content:
-            raise ContentValidationError(f"Content not found with ID: {content_id}")
-            
         # Parse the attribute path
         parts = attribute.split(".")
         top_level = parts[0]
@@ -171,18 +201,27 @@ class ContentHelper:
         if top_level != "metadata" or len(parts) != 2:
             raise ContentValidationError(f"Invalid attribute path: {attribute}. Only metadata.field notation is supported.")
             
-        # Get the current metadata
-        metadata = dict(content.get("metadata", {}))
+        # Set just this field of the metadata map in one call, rather than
+        # reading the item and writing back the whole map
+        updates = {("metadata", parts[1]): value, "updated_at": datetime.utcnow().isoformat()}
+        try:
+            return self.db.update_item("content_id", content_id, updates,
+                                       condition_expression=Attr("content_id").exists() & Attr("metadata").attribute_type("M"))
+        except ConditionFailedError:
+            pass
         
-        # Update the specific field
+        # Missing content, or an item without a metadata map to set the field in
+        content = self.get_content_details(content_id)
+        if not content:
+            raise ContentValidationError(f"Content not found with ID: {content_id}")
+        metadata = dict(content.get("metadata") or {})
         metadata[parts[1]] = value
-        
-        # Update the entire metadata
         return self.update_content_metadata(content_id, {"metadata": metadata})
 
     @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
     def list_content_by_publisher(self, publisher_id: str, limit: int = None, 
-                                 pagination_token: str = None) -> Dict:
+                                 pagination_token: str = None, created_after: str = None,
+                                 created_before: str = None) -> Dict:
         """
         List content by publisher with pagination support
         
@@ -190,6 +229,8 @@ class ContentHelper:
             publisher_id: The publisher ID to filter by
             limit: Optional maximum number of items to return
             pagination_token: Optional pagination token from previous query
+            created_after: Optional inclusive ISO-8601 lower bound on created_at
+            created_before: Optional inclusive ISO-8601 upper bound on created_at
             
         Returns:
             Dict containing items and pagination details
@@ -204,7 +245,10 @@ class ContentHelper:
             key_name="publisher_id", 
             key_value=publisher_id,
             limit=limit,
-            last_evaluated_key=last_evaluated_key
+            last_evaluated_key=last_evaluated_key,
+            range_key_name="created_at",
+            range_start=created_after,
+            range_end=created_before
         )
         
         # Apply standard pagination encoding
@@ -258,10 +302,8 @@ class ContentHelper:
         base_result = self._get_base_query_result(search_params, limit, last_evaluated_key)
         
         # Apply filters based on provided search parameters
-        filtered_items = []
-        for item in base_result.get("items", []):
-            if self._matches_search_criteria(item, search_params):
-                filtered_items.append(item)
+        matches_search = self._compile_predicate(search_params)
+        filtered_items = [item for item in base_result.get("items", []) if matches_search(item)]
         
         # Prepare result with pagination
         result = {
@@ -317,8 +359,20 @@ class ContentHelper:
         Returns:
             Query result with items and pagination info
         """
+        # Tags are looked up in the content_tags inverted index
+        tags = search_params.get("tags")
+        if self._is_text_search(tags) and all(tags if isinstance(tags, list) else [tags]):
+            try:
+                result = self._query_tag_index(search_params["tags"], limit, last_evaluated_key)
+                # Remove tags from search_params to avoid double filtering
+                del search_params["tags"]
+                return result
+            except Exception as e:
+                logger.warning("Failed to use tag index: %s", e)
+                # Fall back to the GSIs or scan
+        
         # Try to use GSIs for efficiency when possible
-        indexable_fields = ["publisher_id", "type", "status"]
+        indexable_fields = ["publisher_id", "type"]
         
         for field in indexable_fields:
             if field in search_params:
@@ -337,90 +391,239 @@ class ContentHelper:
                     logger.warning("Failed to use index for %s: %s", field, e)
                     # Continue to the next field or fall back to scan
         
-        # If no indexed field is available, fall back to scan
+        # If no indexed field is available, fall back to scan, letting DynamoDB
+        # drop non-matching items for the criteria it can evaluate exactly
         return self.db.scan_items(
+            filter_expression=self._pop_filter_expression(search_params),
             limit=limit,
             last_evaluated_key=last_evaluated_key
         )
     
-    def _matches_search_criteria(self, item: Dict, search_params: Dict) -> bool:
+    def _query_tag_index(self, tags: Union[str, List[str]], limit: int = None,
+                         last_evaluated_key: Dict = None) -> Dict:
         """
-        Check if an item matches all search criteria.
+        Get content carrying any of the given tags from the content_tags table.
+        
+        Matching content IDs are paged in sorted order, resuming after the
+        content_id in last_evaluated_key, and hydrated from the content table.
+        
+        Args:
+            tags: Tag or list of tags (any-match, case-insensitive)
+            limit: Optional maximum number of items to return
+            last_evaluated_key: Optional key to start from for pagination
+            
+        Returns:
+            Query result with items and pagination info
+        """
+        content_ids = sorted({
+            row["content_id"]
+            for tag in self._indexable_tags(tags)
+            for row in self.tags_db.query_partition("tag", tag)
+        })
+        
+        if last_evaluated_key:
+            content_ids = content_ids[bisect.bisect_right(content_ids, last_evaluated_key["content_id"]):]
+        
+        page_ids = content_ids[:limit] if limit is not None else content_ids
+        items = self.db.batch_get_items([{"content_id": content_id} for content_id in page_ids])
+        
+        result = {
+            "items": items,
+            "count": len(items),
+            "scanned_count": len(page_ids),
+            "has_more": len(page_ids) < len(content_ids)
+        }
+        if result["has_more"]:
+            result["last_evaluated_key"] = {"content_id": page_ids[-1]}
+        return result
+    
+    def _add_tag_rows(self, content_id: str, tags: Any) -> None:
+        """Write content_tags rows for a content item's tags"""
+        rows = [{"tag": tag, "content_id": content_id} for tag in self._indexable_tags(tags)]
+        if rows:
+            self.tags_db.batch_write_items(rows)
+    
+    def _remove_tag_rows(self, content_id: str, tags: Any) -> None:
+        """Delete content_tags rows for tags removed from a content item"""
+        keys = [{"tag": tag, "content_id": content_id} for tag in self._indexable_tags(tags)]
+        if keys:
+            self.tags_db.batch_delete_items(keys)
+    
+    @staticmethod
+    def _indexable_tags(tags: Any) -> set:
+        """
+        Distinct content_tags keys for tags (non-empty strings), lowercased as in
+        tags_lc so the index matches tags case-insensitively
+        """
+        tags = tags if isinstance(tags, (list, set, frozenset)) else [tags]
+        return {tag.lower() for tag in tags if isinstance(tag, str) and tag}
+    
+    def _pop_filter_expression(self, search_params: Dict):
+        """
+        Move exact-match criteria (enum-valued fields) out of search_params into
+        a DynamoDB FilterExpression. Other criteria (title, tags, metadata) stay
+        in search_params for _compile_predicate, but are also added to the
+        filter as looser conditions so items that can't match are dropped by
+        DynamoDB rather than returned and rejected here.
+        
+        Only used for scans: the content GSIs are keys-only, so a filter on
+        a GSI query couldn't see these attributes.
+        
+        Returns:
+            The filter expression, or None if there are no such criteria
+        """
+        conditions = [Attr(field).eq(search_params.pop(field))
+                      for field in EXACT_MATCH_FIELDS if field in search_params]
+        
+        for key, value in search_params.items():
+            if key == "title" and isinstance(value, str):
+                # Exact on title_lc; items written before it existed are left to the predicate
+                conditions.append(Attr("title_lc").contains(value.lower()) | Attr("title_lc").not_exists())
+            elif key == "tags" and self._is_text_search(value) and value:
+                # Any-match of whole tags on tags_lc, as in the predicate; items
+                # written before it existed are left to the predicate
+                tag_conditions = [Attr("tags_lc").contains(tag.lower()) for tag in (value if isinstance(value, list) else [value])]
+                conditions.append(functools.reduce(operator.or_, tag_conditions) | Attr("tags_lc").not_exists())
+            elif "." not in key or (key.count(".") == 1 and key.startswith("metadata.")):
+                # The predicate rejects items without the field (or metadata field)
+                conditions.append(Attr(key).exists())
+        
+        return functools.reduce(operator.and_, conditions) if conditions else None
+    
+    def _compile_predicate(self, search_params: Dict) -> Callable[[Dict], bool]:
+        """
+        Build a predicate that checks if an item matches all search criteria.
+        
+        Search values are lowercased and type-checked once here rather than for
+        every item the predicate is applied to.
         
         Args:
-            item: Content item to check
             search_params: Search parameters to match against
             
         Returns:
-            True if the item matches all criteria, False otherwise
+            Function taking a content item and returning True if it matches
         """
+        checks = []
+        metadata_checks = []
         for key, value in search_params.items():
-            # Handle nested attribute paths (e.g., metadata.field)
+            matches = self._compile_value_matcher(value)
+            
+            # Handle nested attribute paths (e.g., metadata.field); these are
+            # checked together below so metadata is looked up once per item
             if "." in key:
                 parts = key.split(".")
-                if len(parts) != 2 or parts[0] != "metadata":
+                if len(parts) == 2 and parts[0] == "metadata":
                     # Currently only support metadata.field notation
-                    continue
-                    
-                metadata = item.get("metadata", {})
-                metadata_key = parts[1]
+                    metadata_checks.append((parts[1], matches))
+                continue
                 
-                # Skip if the metadata key doesn't exist
-                if metadata_key not in metadata:
-                    return False
-                    
-                # Compare the metadata value
-                metadata_value = metadata[metadata_key]
-                if not self._values_match(metadata_value, value):
-                    return False
-                    
-            # Handle standard fields
-            elif key in item:
-                if not self._values_match(item[key], value):
-                    return False
-                    
-            # Handle workflow status fields
-            elif key in ["rag_status", "training_status", "licensing_status"] and key in item:
-                if item[key] != value:
-                    return False
-                    
-            # If the field isn't found, it's not a match
+            # Tags match whole tags (case-insensitively), as in the content_tags
+            # index and the scan filter, so this is a set intersection
+            elif key == "tags" and self._is_text_search(value):
+                search_tags = frozenset(tag.lower() for tag in (value if isinstance(value, list) else [value]))
+                
+                def check(item, search_tags=search_tags):
+                    if "tags_lc" in item:
+                        return not search_tags.isdisjoint(item["tags_lc"])
+                    tags = item.get("tags")
+                    return isinstance(tags, list) and not search_tags.isdisjoint(str(tag).lower() for tag in tags)
+                
+            # Match strings against the stored lowercased copy; items written
+            # before it existed fall back to lowercasing the field itself
+            elif key in LOWERCASED_FIELDS and self._is_text_search(value):
+                matches_lowercased = self._compile_value_matcher(value, item_lowercased=True)
+                
+                def check(item, key=key, lc_key=LOWERCASED_FIELDS[key], matches=matches,
+                          matches_lowercased=matches_lowercased):
+                    if lc_key in item:
+                        return matches_lowercased(item[lc_key])
+                    return key in item and matches(item[key])
+                
+            # Handle standard fields; if the field isn't found, it's not a match
             else:
-                return False
+                def check(item, key=key, matches=matches):
+                    return key in item and matches(item[key])
                 
-        # All criteria matched
-        return True
+            checks.append(check)
+        
+        if metadata_checks:
+            def check(item, metadata_checks=tuple(metadata_checks)):
+                metadata = item.get("metadata", {})
+                for metadata_key, matches in metadata_checks:
+                    # Not a match if the metadata key doesn't exist
+                    if metadata_key not in metadata or not matches(metadata[metadata_key]):
+                        return False
+                return True
+            
+            checks.append(check)
+        
+        # A single check is the predicate itself, saving a call per item
+        if len(checks) == 1:
+            return checks[0]
+        
+        def predicate(item: Dict, checks=tuple(checks)) -> bool:
+            for check in checks:
+                if not check(item):
+                    return False
+            return True
+        
+        return predicate
     
-    def _values_match(self, item_value: Any, search_value: Any) -> bool:
+    @staticmethod
+    def _is_text_search(search_value: Any) -> bool:
+        """Check if a search value is a string or a list of strings"""
+        if isinstance(search_value, list):
+            return all(isinstance(sv, str) for sv in search_value)
+        return isinstance(search_value, str)
+    
+    def _compile_value_matcher(self, search_value: Any, item_lowercased: bool = False) -> Callable[[Any], bool]:
         """
-        Check if a value matches the search criteria.
+        Build a function that checks if an item value matches a search value.
+        
+        Strings match case-insensitively on partial values, lists (e.g. tags) with
+        any-match semantics, and everything else exactly.
         
         Args:
-            item_value: Value from the item
             search_value: Value from the search criteria
+            item_lowercased: Whether item values are already lowercased
             
         Returns:
-            True if values match, False otherwise
+            Function taking a value from an item and returning True if it matches
         """
-        # Handle strings with case-insensitive partial matching
-        if isinstance(item_value, str) and isinstance(search_value, str):
-            return search_value.lower() in item_value.lower()
+        if isinstance(search_value, str):
+            search_lower = search_value.lower()
             
-        # Handle lists (e.g., tags) with any-match semantics
-        elif isinstance(item_value, list):
-            if isinstance(search_value, list):
-                # If search value is also a list, check if any value matches
-                return any(self._values_match(item_value, sv) for sv in search_value)
+            if item_lowercased:
+                def matches(item_value):
+                    if isinstance(item_value, str):
+                        return search_lower in item_value
+                    if isinstance(item_value, list):
+                        return any(search_lower in v for v in item_value)
+                    return item_value == search_value
             else:
-                # If search value is a scalar, check if it matches any item in the list
-                if isinstance(search_value, str):
-                    return any(search_value.lower() in str(v).lower() for v in item_value)
-                else:
-                    return search_value in item_value
-                
-        # Exact match for other types
+                def matches(item_value):
+                    if isinstance(item_value, str):
+                        return search_lower in item_value.lower()
+                    if isinstance(item_value, list):
+                        return any(search_lower in str(v).lower() for v in item_value)
+                    return item_value == search_value
+            
+        elif isinstance(search_value, list):
+            # If search value is also a list, check if any value matches
+            value_matchers = [self._compile_value_matcher(sv, item_lowercased) for sv in search_value]
+            
+            def matches(item_value):
+                if isinstance(item_value, list):
+                    return any(value_matches(item_value) for value_matches in value_matchers)
+                return item_value == search_value
+            
         else:
-            return item_value == search_value
+            def matches(item_value):
+                if isinstance(item_value, list):
+                    return search_value in item_value
+                return item_value == search_value
+            
+        return matches
     
     def _decode_pagination_token(self, pagination_token: Optional[str]) -> Optional[Dict]:
         """
@@ -439,8 +642,7 @@ class ContentHelper:
             return None
             
         try:
-            decoded_token = base64.b64decode(pagination_token)
-            return json.loads(decoded_token)
+            return decode_pagination_token(pagination_token)
         except Exception as e:
             logger.error("Failed to decode pagination token: %s", e)
             raise ValueError(f"Invalid pagination token format: {pagination_token}")
@@ -460,8 +662,7 @@ class ContentHelper:
         
         # Encode last_evaluated_key as pagination token if present
         if "last_evaluated_key" in result_copy:
-            token_bytes = json.dumps(result_copy["last_evaluated_key"]).encode("utf-8")
-            result_copy["pagination_token"] = base64.b64encode(token_bytes).decode("utf-8")
+            result_copy["pagination_token"] = encode_pagination_token(result_copy["last_evaluated_key"])
             del result_copy["last_evaluated_key"]  # Remove raw key from response
             
         return result_copy
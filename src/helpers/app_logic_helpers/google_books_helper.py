@@ -8,6 +8,7 @@ import urllib.error
 import urllib.parse
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 
 from helpers.common_helper.logger_helper import LoggerHelper
@@ -17,7 +18,8 @@ from config.google_books_api_config import (
     GOOGLE_BOOKS_API_BASE_URL,
     DEFAULT_FIELDS,
     MANDATORY_FIELDS,
-    FIELD_MAPPINGS
+    FIELD_MAPPINGS,
+    MAX_CONCURRENT_LOOKUPS
 )
 
 logger = LoggerHelper(__name__).get_logger()
@@ -76,6 +78,27 @@ class GoogleBooksHelper:
             logger.error(f"Unexpected error: {str(e)}")
             return {"error": f"An unexpected error occurred: {str(e)}"}
 
+    def get_book_details_many(self, isbns: List[str], max_workers: int = MAX_CONCURRENT_LOOKUPS) -> List[Dict[str, Any]]:
+        """
+        Fetch book details for several ISBNs, with up to max_workers requests in flight
+        so the lookups overlap instead of paying one round trip each.
+        
+        Args:
+            isbns: The ISBNs to look up (duplicates are only fetched once)
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            List of book details (or error dicts, as get_book_details returns) in input order
+        """
+        unique_isbns = list(dict.fromkeys(isbns))
+        if not unique_isbns:
+            return []
+        logger.info(f"Fetching book details for {len(unique_isbns)} ISBNs")
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_isbns))) as executor:
+            details = dict(zip(unique_isbns, executor.map(self.get_book_details, unique_isbns)))
+        return [details[isbn] for isbn in isbns]
+
     @Retry(max_attempts=3, initial_wait=1.0, exceptions=[urllib.error.URLError, json.JSONDecodeError])
     def get_book_details_filtered(self, isbn: str, fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
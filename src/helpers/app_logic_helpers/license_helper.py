@@ -17,7 +17,7 @@ class LicenseHelper:
     def create_license(self, license_data: Dict) -> Dict:
         license_item = LicenseModel(license_data).__dict__
 
-        logger.info("Creating license: %s", license_item)
+        logger.info("Creating license: %s", license_item["license_id"])
         self.db.put_item(license_item)
         return {"message": "License created successfully", "license_id": license_item["license_id"]}
 
@@ -25,13 +25,17 @@ class LicenseHelper:
         logger.info("Fetching license for license_id: %s", license_id)
         return self.db.get_item({"license_id": license_id})
 
-    def list_licenses_by_consumer(self, consumer_id: str) -> List[Dict]:
+    def list_licenses_by_consumer(self, consumer_id: str, created_after: str = None,
+                                  created_before: str = None) -> List[Dict]:
         logger.info("Listing licenses for consumer_id: %s", consumer_id)
-        return self.db.query_items("consumer_id", consumer_id)
+        return self.db.query_items("consumer_id", consumer_id, range_key_name="created_at",
+                                   range_start=created_after, range_end=created_before)
 
-    def list_licenses_by_content(self, content_id: str) -> List[Dict]:
+    def list_licenses_by_content(self, content_id: str, created_after: str = None,
+                                 created_before: str = None) -> List[Dict]:
         logger.info("Listing licenses for content_id: %s", content_id)
-        return self.db.query_items("content_id", content_id)
+        return self.db.query_items("content_id", content_id, range_key_name="created_at",
+                                   range_start=created_after, range_end=created_before)
 
     def revoke_license(self, license_id: str) -> Dict:
         logger.info("Revoking license for license_id: %s", license_id)
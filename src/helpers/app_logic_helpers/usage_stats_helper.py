@@ -0,0 +1,114 @@
+from typing import Dict, List, Optional
+
+from helpers.aws_service_helpers.dynamodb_helper import DynamoDBHelper, TransactionConditionFailedError
+from helpers.common_helper.logger_helper import LoggerHelper
+
+logger = LoggerHelper(__name__).get_logger()
+
+USAGE_STATS_TABLE = "usage_stats"
+
+# Sort key of the counters item; the other items under a stats_key are
+# "MEMBER#<id>" markers recording which IDs were already counted as unique
+TOTALS_SK = "TOTALS"
+
+# "LOG#<log_id>" items mark logs already counted. Like the logs, they never
+# expire, so recounting logs at any time (e.g. a backfill) skips counted ones
+LOG_MARKER_SK = "COUNTED"
+
+# Written by backfill_usage_stats.py once logs from before the counters existed
+# have been counted; until then the counters are incomplete
+BACKFILL_MARKER_KEY = {"stats_key": "BACKFILL", "stats_sk": "COMPLETED"}
+
+# Report subject -> (field counted for uniques, (breakdown field, default) pairs).
+# Defaults match those the usage reports have always counted missing values under.
+REPORT_DIMENSIONS = {
+    "content_id": ("consumer_id", (("access_type", "VIEW"), ("region", "UNKNOWN"))),
+    "consumer_id": ("content_id", (("access_type", "VIEW"), ("publisher_id", "UNKNOWN"))),
+}
+
+
+class UsageStatsHelper:
+    """
+    Usage report counters per content item and per consumer, added to as logs are
+    written (UpdateItem ADD) so a report reads one item instead of every log.
+
+    Each log is counted exactly once: its counters are added in the same
+    transaction that creates its LOG# marker (and the MEMBER# markers of IDs it
+    counts as unique), so a log redelivered after it was counted is skipped.
+    """
+
+    def __init__(self):
+        # Counters are read right after being added to, so they bypass the DAX cache
+        self.db = DynamoDBHelper(table_name=USAGE_STATS_TABLE, use_dax=False)
+        self._backfilled = False
+
+    def record_logs(self, logs: List[Dict]) -> None:
+        """Add a batch of usage logs to the counters of their content items and consumers"""
+        counted = sum(self.record_log(log) for log in logs)
+        logger.info("Recorded %d of %d usage logs (the rest were already counted)", counted, len(logs))
+
+    def record_log(self, log: Dict) -> bool:
+        """Add one usage log to the counters; returns False if it was already counted"""
+        log_marker = {"stats_key": f"LOG#{log['log_id']}", "stats_sk": LOG_MARKER_SK}
+        increments = {}
+        member_markers = {}
+        for subject, (unique_field, breakdowns) in REPORT_DIMENSIONS.items():
+            stats_key = f"{subject}#{log[subject]}"
+            counters = {"total_accesses": 1}
+            for field, default in breakdowns:
+                counters[f"{field}#{log.get(field, default)}"] = 1
+            increments[stats_key] = counters
+            if unique_field in log:
+                member_markers[stats_key] = {"stats_key": stats_key, "stats_sk": f"MEMBER#{log[unique_field]}"}
+
+        # IDs whose MEMBER# marker already exists were counted as unique by an
+        # earlier log, so the transaction is retried without them
+        while True:
+            for stats_key, counters in increments.items():
+                if stats_key in member_markers:
+                    counters["unique_count"] = 1
+                else:
+                    counters.pop("unique_count", None)
+            try:
+                self.db.transact_write_items(
+                    [log_marker, *member_markers.values()],
+                    [({"stats_key": stats_key, "stats_sk": TOTALS_SK}, counters)
+                     for stats_key, counters in increments.items()]
+                )
+                return True
+            except TransactionConditionFailedError as e:
+                if log_marker in e.existing_items:
+                    return False
+                for marker in e.existing_items:
+                    del member_markers[marker["stats_key"]]
+
+    def is_backfilled(self) -> bool:
+        """Whether logs written before the counters existed have been counted (cached once they have)"""
+        if not self._backfilled:
+            self._backfilled = self.db.get_item(BACKFILL_MARKER_KEY) is not None
+        return self._backfilled
+
+    def mark_backfilled(self) -> None:
+        """Record that every log written before the counters existed has been counted"""
+        self.db.put_item(BACKFILL_MARKER_KEY)
+
+    def get_stats(self, subject: str, value: str) -> Optional[Dict]:
+        """
+        Counters for one content_id or consumer_id
+
+        Returns:
+            Dict with total_accesses, unique_count and one dict of counts per
+            breakdown field, or None if no counters were recorded
+        """
+        item = self.db.get_item({"stats_key": f"{subject}#{value}", "stats_sk": TOTALS_SK})
+        if not item:
+            return None
+
+        stats = {
+            "total_accesses": int(item.get("total_accesses", 0)),
+            "unique_count": int(item.get("unique_count", 0)),
+        }
+        for field, _ in REPORT_DIMENSIONS[subject][1]:
+            prefix = f"{field}#"
+            stats[field] = {name[len(prefix):]: int(count) for name, count in item.items() if name.startswith(prefix)}
+        return stats
@@ -4,7 +4,7 @@ from typing import Optional, Dict, List, Any, Union
 
 from helpers.aws_service_helpers.dynamodb_helper import DynamoDBHelper
 from helpers.common_helper.logger_helper import LoggerHelper
-from helpers.common_helper.common_helper import Retry
+from helpers.common_helper.common_helper import Retry, decode_pagination_token
 from helpers.common_helper.auth_helper import RoleBasedAuth, AuthorizationError
 from models.user_model import UserModel
 import botocore.exceptions
@@ -19,7 +19,7 @@ class UserValidationError(Exception):
 
 class UserHelper:
     def __init__(self):
-        self.db = DynamoDBHelper(table_name=USERS_TABLE)
+        self.db = DynamoDBHelper(table_name=USERS_TABLE, keys_only_indexes=("role-index", "email-index"))
 
     @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
     def register_user(self, user_data: Dict) -> Dict:
@@ -62,7 +62,7 @@ class UserHelper:
         user_id = str(uuid.uuid4())
         user_item = UserModel(user_data).__dict__
 
-        logger.info("Registering user: %s", user_item)
+        logger.info("Registering user: %s", user_item["user_id"])
         self.db.put_item(user_item)
         return {"message": "User registered successfully", "user_id": user_id}
 
@@ -326,10 +326,7 @@ class UserHelper:
             return None
             
         try:
-            import json
-            import base64
-            decoded_token = base64.b64decode(pagination_token)
-            return json.loads(decoded_token)
+            return decode_pagination_token(pagination_token)
         except Exception as e:
             logger.error(f"Failed to decode pagination token: {e}")
             raise ValueError(f"Invalid pagination token: {pagination_token}")
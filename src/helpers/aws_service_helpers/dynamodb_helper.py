@@ -1,7 +1,13 @@
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import boto3
 from boto3.dynamodb.conditions import Key, Attr
-from typing import Dict, List
+from boto3.dynamodb.types import TypeSerializer
+from typing import Dict, Iterable, Iterator, List, Tuple
 import botocore.exceptions
+from botocore.config import Config
 
 from helpers.common_helper.logger_helper import LoggerHelper
 from helpers.common_helper.common_helper import Retry
@@ -9,17 +15,106 @@ from helpers.common_helper.common_helper import Retry
 logger = LoggerHelper(__name__).get_logger()
 
 
+# BatchGetItem accepts at most 100 keys per request
+BATCH_GET_MAX_KEYS = 100
+
+# Connections are pooled and kept alive between calls (and invocations of a
+# warm container). The pool covers the parallel per-shard usage log queries,
+# each of which may also prefetch its next page.
+_DYNAMODB_CONFIG = Config(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={"mode": "standard", "max_attempts": 3},
+)
+
+# Created once per container during Lambda init and shared by every helper
+_DYNAMODB = boto3.resource("dynamodb", config=_DYNAMODB_CONFIG)
+
+# Serializes values for the low-level client calls the Table resource has no method for
+_SERIALIZER = TypeSerializer()
+
+# Cluster discovery endpoint of the optional DAX read cache (set by KnowlioStack)
+DAX_ENDPOINT = os.environ.get("DAX_ENDPOINT")
+
+
+class ConditionFailedError(Exception):
+    """Raised when a conditional write's ConditionExpression is not met"""
+    pass
+
+
+class TransactionConditionFailedError(ConditionFailedError):
+    """Raised when a transaction is canceled because items it puts if absent already exist"""
+    def __init__(self, message: str, existing_items: List[Dict]):
+        super().__init__(message)
+        self.existing_items = existing_items
+
+
+@functools.lru_cache(maxsize=1)
+def _dax_resource():
+    """DAX resource shared by all helpers in this container; None if DAX is unavailable"""
+    try:
+        from amazondax import AmazonDaxClient
+    except ImportError:
+        logger.warning("DAX_ENDPOINT is set but amazondax is not installed; using DynamoDB directly")
+        return None
+    return AmazonDaxClient.resource(endpoint_url=DAX_ENDPOINT)
+
+
+@functools.lru_cache(maxsize=None)
+def _table_key_names(table_name: str) -> Tuple[str, ...]:
+    """Primary key attribute names, described once per table per container (DAX has no DescribeTable)"""
+    key_schema = _DYNAMODB.Table(table_name).key_schema
+    return tuple(key["AttributeName"] for key in key_schema)
+
+
+def _range_condition(condition_type, name: str, start: str = None, end: str = None):
+    """Build an inclusive range condition on `name` (Key or Attr), or None if unbounded"""
+    if not name or (start is None and end is None):
+        return None
+    if start is not None and end is not None:
+        return condition_type(name).between(start, end)
+    if start is not None:
+        return condition_type(name).gte(start)
+    return condition_type(name).lte(end)
+
+
 class DynamoDBHelper:
-    def __init__(self, table_name: str):
+    def __init__(self, table_name: str, keys_only_indexes: Iterable[str] = (), use_dax: bool = True):
+        """
+        Args:
+            table_name: Name of the DynamoDB table
+            keys_only_indexes: GSIs that project only keys; query results from
+                these are resolved to full items from the base table
+            use_dax: Route reads and writes through DAX when DAX_ENDPOINT is set
+        """
         self.table_name = table_name
-        self.dynamodb = boto3.resource("dynamodb")
+        self.keys_only_indexes = frozenset(keys_only_indexes)
+        self.dynamodb = (_dax_resource() if use_dax and DAX_ENDPOINT else None) or _DYNAMODB
         self.table = self.dynamodb.Table(table_name)
 
     @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
     def put_item(self, item: Dict) -> None:
-        logger.info("Putting item into DynamoDB: %s", item)
+        # Full items only at DEBUG: they can be large and hold user details
+        logger.info("Putting item into DynamoDB table: %s", self.table_name)
+        logger.debug("dynamodb_item_put", extra={"table": self.table_name, "item": item})
         self.table.put_item(Item=item)
 
+    @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
+    def batch_write_items(self, items: List[Dict]) -> None:
+        """Put many items using BatchWriteItem (25-item pages, unprocessed items resent)"""
+        logger.info("Batch writing %d items into DynamoDB table: %s", len(items), self.table_name)
+        with self.table.batch_writer() as batch:
+            for item in items:
+                batch.put_item(Item=item)
+
+    @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
+    def batch_delete_items(self, keys: List[Dict]) -> None:
+        """Delete many items by key using BatchWriteItem (25-item pages, unprocessed items resent)"""
+        logger.info("Batch deleting %d items from DynamoDB table: %s", len(keys), self.table_name)
+        with self.table.batch_writer() as batch:
+            for key in keys:
+                batch.delete_item(Key=key)
+
     @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
     def get_item(self, key: Dict) -> Dict:
         logger.info("Getting item with key: %s", key)
@@ -27,24 +122,110 @@ class DynamoDBHelper:
         return response.get("Item")
 
     @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
-    def update_item(self, key_name: str, key_value: str, updates: Dict) -> Dict:
-        update_expression = "SET " + ", ".join(f"#{k}=:{k}" for k in updates)
-        expression_attr_names = {f"#{k}": k for k in updates}
-        expression_attr_values = {f":{k}": v for k, v in updates.items()}
+    def update_item(self, key_name: str, key_value: str, updates: Dict,
+                    condition_expression=None, return_values: str = "ALL_NEW") -> Dict:
+        """
+        SET attributes of an item in a single UpdateItem call
+        
+        Args:
+            key_name: The name of the partition key
+            key_value: The partition key value
+            updates: Attribute name -> value; a tuple key such as ("metadata", "isbn")
+                sets a nested map field without rewriting the whole map
+            condition_expression: Optional condition the item must meet (e.g. Attr(key).exists())
+            return_values: ReturnValues for the call (ALL_NEW, ALL_OLD, ...)
+            
+        Returns:
+            The item's attributes as selected by return_values
+            
+        Raises:
+            ConditionFailedError: If condition_expression is not met
+        """
+        # Placeholders are numbered: attribute names may not be valid placeholder tokens
+        assignments = []
+        expression_attr_names = {}
+        expression_attr_values = {}
+        for i, (name, value) in enumerate(updates.items()):
+            path = name if isinstance(name, tuple) else (name,)
+            placeholders = [f"#u{i}_{j}" for j in range(len(path))]
+            expression_attr_names.update(zip(placeholders, path))
+            expression_attr_values[f":u{i}"] = value
+            assignments.append(f"{'.'.join(placeholders)} = :u{i}")
+        
+        update_kwargs = {
+            "Key": {key_name: key_value},
+            "UpdateExpression": "SET " + ", ".join(assignments),
+            "ExpressionAttributeNames": expression_attr_names,
+            "ExpressionAttributeValues": expression_attr_values,
+            "ReturnValues": return_values
+        }
+        if condition_expression is not None:
+            update_kwargs["ConditionExpression"] = condition_expression
 
         logger.info("Updating item in DynamoDB")
-        response = self.table.update_item(
-            Key={key_name: key_value},
-            UpdateExpression=update_expression,
-            ExpressionAttributeNames=expression_attr_names,
-            ExpressionAttributeValues=expression_attr_values,
-            ReturnValues="ALL_NEW"
-        )
+        try:
+            response = self.table.update_item(**update_kwargs)
+        except botocore.exceptions.ClientError as e:
+            # Raised as a non-ClientError so the Retry decorator doesn't retry it
+            if e.response.get("Error", {}).get("Code") == "ConditionalCheckFailedException":
+                raise ConditionFailedError(f"Condition not met updating {key_name}={key_value} in {self.table_name}") from e
+            raise
         return response.get("Attributes")
 
+    @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
+    def transact_write_items(self, absent_items: List[Dict], increments: List[Tuple[Dict, Dict[str, int]]]) -> None:
+        """
+        Put items that must not exist yet and add to numeric attributes of other
+        items (created if missing) in one TransactWriteItems call: all of the
+        writes are applied, or none are
+        
+        Args:
+            absent_items: Items to put, each only if no item with its key exists
+            increments: (key, attribute name -> amount) pairs applied with ADD updates
+            
+        Raises:
+            TransactionConditionFailedError: If any of absent_items already exists;
+                nothing is written and existing_items lists the ones that did
+        """
+        logger.info("Writing a transaction of %d items into DynamoDB table: %s",
+                    len(absent_items) + len(increments), self.table_name)
+        key_name = self._get_key_names()[0]
+        transact_items = [
+            {"Put": {
+                "TableName": self.table_name,
+                "Item": {name: _SERIALIZER.serialize(value) for name, value in item.items()},
+                "ConditionExpression": "attribute_not_exists(#k)",
+                "ExpressionAttributeNames": {"#k": key_name},
+            }}
+            for item in absent_items
+        ]
+        for key, amounts in increments:
+            # Attribute names are data (e.g. region values), so placeholders are numbered
+            names = list(amounts)
+            transact_items.append({"Update": {
+                "TableName": self.table_name,
+                "Key": {name: _SERIALIZER.serialize(value) for name, value in key.items()},
+                "UpdateExpression": "ADD " + ", ".join(f"#a{i} :a{i}" for i in range(len(names))),
+                "ExpressionAttributeNames": {f"#a{i}": name for i, name in enumerate(names)},
+                "ExpressionAttributeValues": {f":a{i}": _SERIALIZER.serialize(amounts[name]) for i, name in enumerate(names)},
+            }})
+        
+        try:
+            _DYNAMODB.meta.client.transact_write_items(TransactItems=transact_items)
+        except botocore.exceptions.ClientError as e:
+            # Cancellations for other reasons (conflicts, throttling) are left to the Retry decorator
+            codes = [reason.get("Code", "None") for reason in e.response.get("CancellationReasons", [])]
+            if set(codes) - {"None"} != {"ConditionalCheckFailed"}:
+                raise
+            existing_items = [item for item, code in zip(absent_items, codes) if code == "ConditionalCheckFailed"]
+            raise TransactionConditionFailedError(
+                f"{len(existing_items)} items already exist in {self.table_name}", existing_items) from e
+
     @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
     def query_items(self, key_name: str, key_value: str, limit: int = None, 
-                   last_evaluated_key: Dict = None) -> Dict:
+                   last_evaluated_key: Dict = None, range_key_name: str = None,
+                   range_start: str = None, range_end: str = None,
+                   scan_index_forward: bool = True) -> Dict:
         """
         Query items with pagination support
         
@@ -53,14 +234,24 @@ class DynamoDBHelper:
             key_value: The value of the key to match
             limit: Optional maximum number of items to return
             last_evaluated_key: Optional key to start from for pagination
+            range_key_name: Optional GSI sort key to bound with range_start/range_end
+            range_start: Optional inclusive lower bound on the sort key
+            range_end: Optional inclusive upper bound on the sort key
+            scan_index_forward: Set False to return items in descending sort key order
             
         Returns:
             Dict containing items and optional last_evaluated_key for pagination
         """
         logger.info("Querying items where %s = %s (limit: %s)", key_name, key_value, limit)
+        index_name = f"{key_name}-index"  # assumes GSI is defined as `${key_name}-index`
+        key_condition = Key(key_name).eq(key_value)
+        range_condition = _range_condition(Key, range_key_name, range_start, range_end)
+        if range_condition is not None:
+            key_condition = key_condition & range_condition
         query_kwargs = {
-            "IndexName": f"{key_name}-index",  # assumes GSI is defined as `${key_name}-index`
-            "KeyConditionExpression": Key(key_name).eq(key_value)
+            "IndexName": index_name,
+            "KeyConditionExpression": key_condition,
+            "ScanIndexForward": scan_index_forward
         }
         
         if limit is not None:
@@ -72,8 +263,11 @@ class DynamoDBHelper:
         try:
             response = self.table.query(**query_kwargs)
             logger.info("Query succeeded using GSI")
+            items = response.get("Items", [])
+            if index_name in self.keys_only_indexes:
+                items = self.batch_get_items(items)
             result = {
-                "items": response.get("Items", []),
+                "items": items,
                 "count": response.get("Count", 0),
                 "scanned_count": response.get("ScannedCount", 0),
             }
@@ -90,12 +284,106 @@ class DynamoDBHelper:
         except Exception as e:
             logger.warning("GSI not found for %s. Falling back to scan. Error: %s", key_name, e)
             # fallback: full table scan with pagination
+            filter_expression = Attr(key_name).eq(key_value)
+            range_filter = _range_condition(Attr, range_key_name, range_start, range_end)
+            if range_filter is not None:
+                filter_expression = filter_expression & range_filter
             return self.scan_items(
-                filter_expression=Attr(key_name).eq(key_value),
+                filter_expression=filter_expression,
                 limit=limit,
                 last_evaluated_key=last_evaluated_key
             )
 
+    @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
+    def batch_get_items(self, index_items: List[Dict]) -> List[Dict]:
+        """Fetch the full base-table items for index hits, preserving their order"""
+        key_names = self._get_key_names()
+        keys = [{name: item[name] for name in key_names} for item in index_items]
+        if not keys:
+            return []
+        
+        fetched = {}
+        for start in range(0, len(keys), BATCH_GET_MAX_KEYS):
+            request_items = {self.table_name: {"Keys": keys[start:start + BATCH_GET_MAX_KEYS]}}
+            while request_items:
+                response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                for item in response.get("Responses", {}).get(self.table_name, []):
+                    fetched[tuple(item[name] for name in key_names)] = item
+                request_items = response.get("UnprocessedKeys")
+        
+        # Items deleted since the index was read are dropped
+        ordered_keys = (tuple(key[name] for name in key_names) for key in keys)
+        return [fetched[key] for key in ordered_keys if key in fetched]
+
+    def _get_key_names(self) -> Tuple[str, ...]:
+        """Primary key attribute names, shared by every helper on this table"""
+        return _table_key_names(self.table_name)
+
+    def query_partition(self, key_name: str, key_value: str, index_name: str = None,
+                        range_key_name: str = None, range_start: str = None, range_end: str = None,
+                        filter_expression=None) -> List[Dict]:
+        """
+        Query all items under one partition key (follows pagination)
+        
+        Args:
+            key_name: The partition key name (of the table, or of index_name)
+            key_value: The partition key value
+            index_name: Optional GSI to query instead of the base table
+            range_key_name: Optional sort key to bound with range_start/range_end
+            range_start: Optional inclusive lower bound on the sort key
+            range_end: Optional inclusive upper bound on the sort key
+            filter_expression: Optional filter applied to the matched items
+            
+        Returns:
+            List of all matching items
+        """
+        pages = self.iter_partition_pages(key_name, key_value, index_name, range_key_name,
+                                          range_start, range_end, filter_expression)
+        return [item for page in pages for item in page]
+
+    def iter_partition_pages(self, key_name: str, key_value: str, index_name: str = None,
+                             range_key_name: str = None, range_start: str = None, range_end: str = None,
+                             filter_expression=None, prefetch: bool = False) -> Iterator[List[Dict]]:
+        """
+        Like query_partition, but yields one page of items at a time so callers can stream them.
+        With prefetch, the next page is requested in the background while the caller
+        handles the current one, hiding a round trip per page.
+        """
+        logger.info("Querying partition %s = %s in table: %s (index: %s)", key_name, key_value, self.table_name, index_name)
+        key_condition = Key(key_name).eq(key_value)
+        range_condition = _range_condition(Key, range_key_name, range_start, range_end)
+        if range_condition is not None:
+            key_condition = key_condition & range_condition
+        query_kwargs = {"KeyConditionExpression": key_condition}
+        if index_name:
+            query_kwargs["IndexName"] = index_name
+        if filter_expression is not None:
+            query_kwargs["FilterExpression"] = filter_expression
+        
+        response = self._query_page(query_kwargs)
+        if not prefetch:
+            yield response.get("Items", [])
+            while "LastEvaluatedKey" in response:
+                response = self._query_page(query_kwargs, response["LastEvaluatedKey"])
+                yield response.get("Items", [])
+            return
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                next_response = None
+                if "LastEvaluatedKey" in response:
+                    next_response = executor.submit(self._query_page, query_kwargs, response["LastEvaluatedKey"])
+                yield response.get("Items", [])
+                if next_response is None:
+                    return
+                response = next_response.result()
+
+    @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
+    def _query_page(self, query_kwargs: Dict, exclusive_start_key: Dict = None) -> Dict:
+        if exclusive_start_key:
+            return self.table.query(**query_kwargs, ExclusiveStartKey=exclusive_start_key)
+        return self.table.query(**query_kwargs)
+
     @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
     def scan_items(self, filter_expression=None, limit: int = None, 
                   last_evaluated_key: Dict = None) -> Dict:
@@ -0,0 +1,28 @@
+from typing import Dict
+
+import boto3
+import botocore.exceptions
+import orjson
+
+from helpers.common_helper.logger_helper import LoggerHelper
+from helpers.common_helper.common_helper import Retry
+
+logger = LoggerHelper(__name__).get_logger()
+
+_KINESIS_CLIENT = boto3.client("kinesis")
+
+
+class KinesisHelper:
+    def __init__(self, stream_name: str):
+        self.stream_name = stream_name
+        self.kinesis = _KINESIS_CLIENT
+
+    @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
+    def put_record(self, record: Dict, partition_key: str) -> None:
+        """Put a single JSON record onto the stream"""
+        logger.info("Putting record onto Kinesis stream %s (partition key: %s)", self.stream_name, partition_key)
+        self.kinesis.put_record(
+            StreamName=self.stream_name,
+            Data=orjson.dumps(record, default=str),
+            PartitionKey=partition_key
+        )
@@ -1,6 +1,9 @@
 import boto3
 import json
+import threading
 import botocore.exceptions
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any
 
 from helpers.common_helper.logger_helper import LoggerHelper
@@ -8,9 +11,15 @@ from helpers.common_helper.common_helper import Retry
 
 logger = LoggerHelper(__name__).get_logger()
 
+_S3_CLIENT = boto3.client("s3")
+
+# Streaming uploads: every part but the last must be at least 5 MB
+MULTIPART_PART_SIZE = 8 * 1024 * 1024
+MULTIPART_UPLOAD_WORKERS = 4
+
 class S3Helper:
     def __init__(self, bucket_name: str = None):
-        self.s3 = boto3.client("s3")
+        self.s3 = _S3_CLIENT
         self.bucket_name = bucket_name or self._get_default_bucket()
 
     def _get_default_bucket(self) -> str:
@@ -73,6 +82,36 @@ class S3Helper:
         )
         return f"s3://{self.bucket_name}/{key}"
 
+    def create_multipart_writer(self, key: str, content_type: str = "application/json",
+                                part_size: int = MULTIPART_PART_SIZE) -> "S3MultipartWriter":
+        """Writer that streams data to s3://bucket/key in parts as it is written (use as a context manager)"""
+        return S3MultipartWriter(self, key, content_type, part_size)
+
+    @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
+    def upload_part(self, key: str, upload_id: str, part_number: int, data: bytes) -> Dict[str, Any]:
+        """Upload one part of a multipart upload"""
+        logger.info(f"Uploading part {part_number} ({len(data)} bytes) of upload_id={upload_id}, key={key}")
+        response = self.s3.upload_part(
+            Bucket=self.bucket_name,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    @Retry(max_attempts=3, initial_wait=1.0, exceptions=[botocore.exceptions.ClientError, botocore.exceptions.BotoCoreError])
+    def put_data(self, data: bytes, key: str, content_type: str = "application/octet-stream") -> str:
+        """Upload bytes to S3 in a single request"""
+        logger.info(f"Uploading data to s3://{self.bucket_name}/{key}")
+        self.s3.put_object(
+            Bucket=self.bucket_name,
+            Key=key,
+            Body=data,
+            ContentType=content_type
+        )
+        return f"s3://{self.bucket_name}/{key}"
+
     def generate_export_key(self, prefix: str, date_str: str, timestamp: str, format_type: str = "jsonl") -> str:
         """Generate standardized S3 key for exports"""
         return f"{prefix}/{date_str}/{prefix}_{timestamp}.{format_type}"
@@ -251,3 +290,75 @@ class S3Helper:
             "upload_id": upload_id,
             "part_count": len(parts)
         }
+
+
+class S3MultipartWriter:
+    """
+    Buffers written bytes and uploads them as multipart parts of part_size,
+    a few in parallel, so memory stays bounded by the parts in flight rather
+    than the whole object. Thread-safe. Aborts the upload if the `with`
+    block raises; output smaller than one part is sent as a single put.
+    """
+
+    def __init__(self, s3_helper: S3Helper, key: str, content_type: str, part_size: int):
+        self.s3_helper = s3_helper
+        self.key = key
+        self.content_type = content_type
+        self.part_size = part_size
+        self.url = f"s3://{s3_helper.bucket_name}/{key}"
+        self._buffer = bytearray()
+        self._lock = threading.Lock()
+        self._upload_id = None
+        self._part_number = 0
+        self._pending = deque()
+        self._parts = []
+        self._executor = None
+
+    def __enter__(self) -> "S3MultipartWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, data: bytes) -> None:
+        with self._lock:
+            self._buffer += data
+            while len(self._buffer) >= self.part_size:
+                part = bytes(self._buffer[:self.part_size])
+                del self._buffer[:self.part_size]
+                self._submit_part(part)
+
+    def close(self) -> str:
+        """Upload what's left and complete the object; returns its s3:// URL"""
+        with self._lock:
+            if self._upload_id is None:
+                return self.s3_helper.put_data(bytes(self._buffer), self.key, self.content_type)
+            if self._buffer:
+                self._submit_part(bytes(self._buffer))
+                self._buffer.clear()
+            while self._pending:
+                self._parts.append(self._pending.popleft().result())
+            self._executor.shutdown()
+            self.s3_helper.complete_multipart_upload(self.key, self._upload_id, self._parts)
+            return self.url
+
+    def abort(self) -> None:
+        """Discard any uploaded parts"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+        if self._upload_id is not None:
+            self.s3_helper.abort_multipart_upload(self.key, self._upload_id)
+
+    def _submit_part(self, part: bytes) -> None:
+        if self._upload_id is None:
+            self._upload_id = self.s3_helper.initiate_multipart_upload(self.key, self.content_type)["upload_id"]
+            self._executor = ThreadPoolExecutor(max_workers=MULTIPART_UPLOAD_WORKERS)
+        # Wait for the oldest part before queueing more than the workers can take
+        if len(self._pending) >= MULTIPART_UPLOAD_WORKERS:
+            self._parts.append(self._pending.popleft().result())
+        self._part_number += 1
+        self._pending.append(self._executor.submit(
+            self.s3_helper.upload_part, self.key, self._upload_id, self._part_number, part))
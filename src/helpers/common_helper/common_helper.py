@@ -1,13 +1,25 @@
+import base64
 import functools
 import time
 import logging
 from typing import Dict, Callable, Any, Type, List, Union, Optional
 
+import orjson
+
 def require_keys(payload: Dict, keys: list):
     missing = [k for k in keys if k not in payload]
     if missing:
         raise ValueError(f"Missing required keys: {', '.join(missing)}")
 
+def encode_pagination_token(last_evaluated_key: Dict) -> str:
+    """Encode a DynamoDB last_evaluated_key as a URL-safe pagination token (unpadded)"""
+    return base64.urlsafe_b64encode(orjson.dumps(last_evaluated_key)).rstrip(b"=").decode("ascii")
+
+def decode_pagination_token(pagination_token: str) -> Dict:
+    """Decode a pagination token; also accepts padded tokens and the standard base64 alphabet"""
+    padded = pagination_token + "=" * (-len(pagination_token) % 4)
+    return orjson.loads(base64.b64decode(padded, altchars=b"-_"))
+
 class Retry:
     """
     A decorator for retrying functions that may fail due to transient errors.
@@ -1,6 +1,51 @@
 import logging
 import os
 import sys
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+import orjson
+
+# Attributes every LogRecord has; anything else on a record came from `extra=`
+_RECORD_ATTRIBUTES = frozenset(logging.LogRecord("", 0, "", 0, "", None, None).__dict__) | {"message", "asctime"}
+
+
+def _extra_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    return {key: value for key, value in record.__dict__.items() if key not in _RECORD_ATTRIBUTES}
+
+
+def _dumps(value: Any) -> str:
+    return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class JsonFormatter(logging.Formatter):
+    """
+    One JSON object per record, encoded once with orjson. Fields passed with
+    `extra=` are included as structured values rather than formatted into the
+    message, e.g. logger.debug("event_received", extra={"event": event}).
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "location": f"{record.filename}:{record.lineno}",
+            "message": record.getMessage(),
+            **_extra_fields(record),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return _dumps(entry)
+
+
+class TextFormatter(logging.Formatter):
+    """The plain text format, with any `extra=` fields appended as one JSON object"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = _extra_fields(record)
+        return f"{line} {_dumps(fields)}" if fields else line
 
 
 class LoggerHelper:
@@ -15,10 +60,14 @@ class LoggerHelper:
         # Avoid duplicate handlers in AWS Lambda cold starts
         if not self.logger.handlers:
             handler = logging.StreamHandler(sys.stdout)
-            formatter = logging.Formatter(
-                fmt="%(asctime)s - %(levelname)s - %(name)s - [%(filename)s:%(lineno)d] - %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
+            # LOG_FORMAT=json emits structured records CloudWatch can query by field
+            if os.getenv("LOG_FORMAT", "text").lower() == "json":
+                formatter = JsonFormatter()
+            else:
+                formatter = TextFormatter(
+                    fmt="%(asctime)s - %(levelname)s - %(name)s - [%(filename)s:%(lineno)d] - %(message)s",
+                    datefmt="%Y-%m-%d %H:%M:%S",
+                )
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
 
@@ -26,3 +75,4 @@ class LoggerHelper:
 
     def get_logger(self) -> logging.Logger:
         return self.logger
+
@@ -2,7 +2,7 @@
 Model for representing a book retrieved from Google Books API.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Any
 from datetime import datetime
 
 from enums.book_fields import BookField, BookDefaultFields, BookDataSource
@@ -12,6 +12,13 @@ class BookModel:
     """
     Model representing a book from Google Books API with all its details.
     """
+    # Author searches build one model per result, so skip the per-instance __dict__
+    __slots__ = (
+        "title", "authors", "publisher", "published_date", "description", "page_count",
+        "categories", "language", "image_links", "id", "isbn", "maturity_rating",
+        "average_rating", "ratings_count", "source",
+    )
+
     def __init__(self, book_data: Dict[str, Any], source: str = BookDataSource.GOOGLE_BOOKS.value):
         """
         Initialize a book model from book data.
@@ -102,7 +109,7 @@ class BookModel:
             "source": self.source  # Not part of BookField as it's metadata about the record
         }
         
-    def filter_fields(self, fields: List[str], mandatory_fields: List[str] = BookDefaultFields.MANDATORY_FIELDS) -> Dict[str, Any]:
+    def filter_fields(self, fields: Iterable[str], mandatory_fields: Iterable[str] = BookDefaultFields.MANDATORY_FIELDS) -> Dict[str, Any]:
         """
         Filter the book data to include only specified fields.
         
@@ -25,6 +25,9 @@ class ContentModel:
     # Valid workflow status values - Use enum values
     VALID_WORKFLOW_STATUSES = WorkflowStatus.get_valid_statuses()
     
+    # Fields holding a workflow status
+    WORKFLOW_STATUS_FIELDS = ("rag_status", "training_status", "licensing_status")
+    
     def __init__(self, content_data: Dict):
         # Core properties
         self.content_id: str = content_data.get("content_id", str(uuid.uuid4()))
@@ -34,6 +37,10 @@ class ContentModel:
         self.tags: List[str] = content_data.get("tags", [])
         self.description: str = content_data.get("description", "")
         
+        # Lowercased copies for case-insensitive search, computed once on write
+        self.title_lc: str = str(self.title).lower()
+        self.tags_lc: List[str] = [str(tag).lower() for tag in self.tags]
+        
         # Flexible metadata for type-specific attributes
         self.metadata: Dict = content_data.get("metadata", {})
         
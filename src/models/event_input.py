@@ -3,6 +3,8 @@ from typing import Any, Dict
 
 
 class ProcessorEventInput:
+    __slots__ = ("processor_name", "action", "payload")
+
     def __init__(self, data: Dict[str, Any]):
         self.processor_name = data.get("processor_name")
         self.action = data.get("action")
@@ -5,13 +5,20 @@ import uuid
 
 class UsageLogModel:
     def __init__(self, log_data: Dict):
-        self.log_id: str = str(uuid.uuid4())
-        self.content_id: str = log_data["content_id"]
-        self.consumer_id: str = log_data["consumer_id"]
-        self.access_time: str = datetime.utcnow().isoformat()
-        self.ip_address: str = log_data.get("ip_address", "")
-        self.user_agent: str = log_data.get("user_agent", "")
-        self.publisher_id: str = log_data["publisher_id"]
-        self.access_type: str = log_data.get("access_type", "VIEW")
-        self.region: str = log_data.get("region", "")
-        self.metadata: Dict = log_data.get("metadata", {})
+        self.__dict__.update(self.to_item(log_data))
+
+    @staticmethod
+    def to_item(log_data: Dict) -> Dict:
+        """Build the usage log item directly, for the logging path that only needs the dict"""
+        return {
+            "log_id": str(uuid.uuid4()),
+            "content_id": log_data["content_id"],
+            "consumer_id": log_data["consumer_id"],
+            "access_time": datetime.utcnow().isoformat(),
+            "ip_address": log_data.get("ip_address", ""),
+            "user_agent": log_data.get("user_agent", ""),
+            "publisher_id": log_data["publisher_id"],
+            "access_type": log_data.get("access_type", "VIEW"),
+            "region": log_data.get("region", ""),
+            "metadata": log_data.get("metadata", {}),
+        }
@@ -6,7 +6,6 @@ Includes full exception traceback for easier debugging.
 
 import importlib
 import pkgutil
-import traceback
 
 import sync_processors as processors_pkg
 from helpers.common_helper.logger_helper import LoggerHelper
@@ -14,14 +13,34 @@ from helpers.common_helper.logger_helper import LoggerHelper
 logger = LoggerHelper(__name__).get_logger()
 
 
-def load_all_processors():
+# Processor modules not imported yet; None until the package has been scanned
+_pending_modules = None
+
+
+def load_all_processors() -> bool:
+    """
+    Import every processor module so it registers itself. Safe to call again:
+    only modules that failed to import on an earlier call are retried.
+    Returns True once all processor modules are loaded.
+    """
+    global _pending_modules
+    if _pending_modules is None:
+        _pending_modules = [
+            f"{processors_pkg.__name__}.{module_name}"
+            for _, module_name, _ in pkgutil.iter_modules(processors_pkg.__path__)
+        ]
+    if not _pending_modules:
+        return True
+
     logger.info("Starting to load all processor modules")
-    for _, module_name, _ in pkgutil.iter_modules(processors_pkg.__path__):
-        full_module_name = f"{processors_pkg.__name__}.{module_name}"
+    failed_modules = []
+    for full_module_name in _pending_modules:
         try:
             logger.info(f"Importing processor module: {full_module_name}")
             importlib.import_module(full_module_name)
             logger.info(f"Successfully imported processor module: {full_module_name}")
         except Exception as e:
-            logger.error(f"Failed to import processor module: {full_module_name} | Error: {str(e)}")
-            logger.error("Traceback:\n%s", traceback.format_exc())
+            logger.exception(f"Failed to import processor module: {full_module_name} | Error: {str(e)}")
+            failed_modules.append(full_module_name)
+    _pending_modules = failed_modules
+    return not failed_modules
@@ -3,7 +3,6 @@ Base class for all sync_processors.
 Handles dispatching actions to appropriate processor methods using an action map.
 """
 
-import traceback
 from typing import Callable, Dict
 
 from helpers.common_helper.logger_helper import LoggerHelper
@@ -17,7 +16,8 @@ class BaseProcessor:
         logger.debug("Initialized BaseProcessor with actions: %s", list(action_map.keys()))
 
     def process(self, action: str, payload: Dict) -> Dict:
-        logger.info("Processing action: %s, payload: %s", action, payload)
+        logger.info("Processing action: %s", action)
+        logger.debug("action_payload", extra={"action": action, "payload": payload})
 
         try:
             if action not in self.action_map:
@@ -28,6 +28,5 @@ class BaseProcessor:
             return self.action_map[action](payload)
 
         except Exception as e:
-            logger.error("Error while processing action: %s", str(e))
-            logger.error("Traceback:\n%s", traceback.format_exc())
+            logger.exception("Error while processing action: %s", str(e))
             raise
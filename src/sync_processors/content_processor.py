@@ -9,6 +9,7 @@ from sync_processor_registry.processor_registry import ProcessorRegistry
 from sync_processors.base_processor import BaseProcessor
 from enums.content_status import ContentStatus, WorkflowStatus
 from enums.content_type import ContentType
+from models.content_model import ContentModel
 
 logger = LoggerHelper(__name__).get_logger()
 
@@ -100,21 +101,7 @@ class ContentProcessor(BaseProcessor):
         try:
             require_keys(payload, ["content_id", "updates"])
             
-            # Convert status string values to enum values if present
-            if "status" in payload["updates"]:
-                status = payload["updates"]["status"]
-                if isinstance(status, str) and ContentStatus.is_valid(status):
-                    # Keep as string but validate against enum values
-                    pass
-                    
-            # Convert workflow status string values to enum values if present
-            for field in ["rag_status", "training_status", "licensing_status"]:
-                if field in payload["updates"]:
-                    status = payload["updates"][field]
-                    if isinstance(status, str) and WorkflowStatus.is_valid(status):
-                        # Keep as string but validate against enum values
-                        pass
-                        
+            # Status values are validated by ContentHelper.update_content_metadata
             return self.helper.update_content_metadata(payload["content_id"], payload["updates"])
         except ContentValidationError as e:
             logger.warning(f"Content validation error: {str(e)}")
@@ -144,7 +131,7 @@ class ContentProcessor(BaseProcessor):
             value = payload["value"]
             
             # Validate workflow status attributes against enum values
-            if attribute in ["rag_status", "training_status", "licensing_status"]:
+            if attribute in ContentModel.WORKFLOW_STATUS_FIELDS:
                 if not WorkflowStatus.is_valid(value):
                     valid_values = ", ".join(WorkflowStatus.get_valid_statuses())
                     return {"error": f"Invalid {attribute} value: {value}. Valid values: {valid_values}"}
@@ -177,6 +164,8 @@ class ContentProcessor(BaseProcessor):
         Optional payload keys:
         - limit: Maximum number of items to return
         - pagination_token: Token for retrieving the next page of results
+        - created_after: Only content created at or after this ISO-8601 time
+        - created_before: Only content created at or before this ISO-8601 time
         """
         try:
             require_keys(payload, ["publisher_id"])
@@ -188,7 +177,9 @@ class ContentProcessor(BaseProcessor):
             result = self.helper.list_content_by_publisher(
                 publisher_id=payload["publisher_id"],
                 limit=limit,
-                pagination_token=pagination_token
+                pagination_token=pagination_token,
+                created_after=payload.get("created_after"),
+                created_before=payload.get("created_before")
             )
             
             # Handle error case
@@ -258,7 +249,7 @@ class ContentProcessor(BaseProcessor):
                 return {"error": f"Invalid status: {search_params['status']}. Valid statuses: {valid_statuses}"}
                 
             # Validate workflow status parameters if provided
-            for status_field in ["rag_status", "training_status", "licensing_status"]:
+            for status_field in ContentModel.WORKFLOW_STATUS_FIELDS:
                 if status_field in search_params and not WorkflowStatus.is_valid(search_params[status_field]):
                     valid_statuses = ", ".join(WorkflowStatus.get_valid_statuses())
                     return {"error": f"Invalid {status_field}: {search_params[status_field]}. Valid values: {valid_statuses}"}
@@ -329,7 +320,7 @@ class ContentProcessor(BaseProcessor):
                 return {"error": f"Invalid status value: {value}. Valid statuses: {valid_statuses}"}
                 
             # Validate workflow status values if applicable
-            if attribute in ["rag_status", "training_status", "licensing_status"] and not WorkflowStatus.is_valid(value):
+            if attribute in ContentModel.WORKFLOW_STATUS_FIELDS and not WorkflowStatus.is_valid(value):
                 valid_statuses = ", ".join(WorkflowStatus.get_valid_statuses())
                 return {"error": f"Invalid {attribute} value: {value}. Valid values: {valid_statuses}"}
                 
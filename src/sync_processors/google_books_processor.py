@@ -11,6 +11,7 @@ from helpers.app_logic_helpers.google_books_helper import GoogleBooksHelper
 from sync_processor_registry.processor_registry import ProcessorRegistry
 from sync_processors.base_processor import BaseProcessor
 from enums.book_fields import BookField, BookDefaultFields
+from config.google_books_api_config import MAX_ISBNS_PER_LOOKUP
 
 logger = LoggerHelper(__name__).get_logger()
 
@@ -22,6 +23,7 @@ class GoogleBooksProcessor(BaseProcessor):
         super().__init__({
             "get_book_details": self._get_book_details,
             "get_book_details_filtered": self._get_book_details_filtered,
+            "get_book_details_many": self._get_book_details_many,
             "get_books_by_author": self._get_books_by_author,
             "get_books_by_author_filtered": self._get_books_by_author_filtered,
         })
@@ -39,6 +41,31 @@ class GoogleBooksProcessor(BaseProcessor):
         require_keys(payload, ["isbn"])
         return self.helper.get_book_details(payload["isbn"])
 
+    def _get_book_details_many(self, payload: Dict) -> Dict:
+        """
+        Get complete book details for several ISBNs, looked up concurrently.
+        
+        Args:
+            payload: Dict containing 'isbns' key, a list or comma-separated string of ISBNs
+            
+        Returns:
+            Dict containing the book details (or per-ISBN errors) in request order
+        """
+        require_keys(payload, ["isbns"])
+        isbns = payload["isbns"]
+        
+        # Query string parameters arrive as a single comma-separated string
+        if isinstance(isbns, str):
+            isbns = [isbn.strip() for isbn in isbns.split(",") if isbn.strip()]
+        if not isinstance(isbns, list) or not all(isinstance(isbn, str) for isbn in isbns):
+            logger.error("Invalid 'isbns' parameter: must be a list of ISBNs")
+            return {"error": "Invalid 'isbns' parameter: must be a list of ISBNs"}
+        if len(isbns) > MAX_ISBNS_PER_LOOKUP:
+            logger.error(f"Too many ISBNs requested: {len(isbns)}")
+            return {"error": f"Invalid 'isbns' parameter: at most {MAX_ISBNS_PER_LOOKUP} ISBNs per request"}
+        
+        return {"books": self.helper.get_book_details_many(isbns), "total_requested": len(isbns)}
+
     def _get_book_details_filtered(self, payload: Dict) -> Dict:
         """
         Get filtered book details from Google Books API by ISBN.
@@ -52,8 +79,8 @@ class GoogleBooksProcessor(BaseProcessor):
         require_keys(payload, ["isbn"])
         fields = payload.get("fields", BookDefaultFields.DEFAULT_FIELDS)
         
-        # If fields is provided, ensure it's a list
-        if not isinstance(fields, list):
+        # If fields is provided, ensure it's a list (the default is a tuple)
+        if not isinstance(fields, (list, tuple)):
             logger.error("Invalid 'fields' parameter: must be a list")
             return {"error": "Invalid 'fields' parameter: must be a list of field names"}
         
@@ -109,8 +136,8 @@ class GoogleBooksProcessor(BaseProcessor):
         fields = payload.get("fields", BookDefaultFields.DEFAULT_FIELDS)
         max_results = payload.get("max_results", 100)
         
-        # If fields is provided, ensure it's a list
-        if not isinstance(fields, list):
+        # If fields is provided, ensure it's a list (the default is a tuple)
+        if not isinstance(fields, (list, tuple)):
             logger.error("Invalid 'fields' parameter: must be a list")
             return {"error": "Invalid 'fields' parameter: must be a list of field names"}
         
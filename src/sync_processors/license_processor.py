@@ -31,11 +31,13 @@ class LicenseProcessor(BaseProcessor):
 
     def _list_licenses_by_consumer(self, payload: Dict) -> Dict:
         require_keys(payload, ["consumer_id"])
-        return {"licenses": self.helper.list_licenses_by_consumer(payload["consumer_id"])}
+        return {"licenses": self.helper.list_licenses_by_consumer(
+            payload["consumer_id"], payload.get("created_after"), payload.get("created_before"))}
 
     def _list_licenses_by_content(self, payload: Dict) -> Dict:
         require_keys(payload, ["content_id"])
-        return {"licenses": self.helper.list_licenses_by_content(payload["content_id"])}
+        return {"licenses": self.helper.list_licenses_by_content(
+            payload["content_id"], payload.get("created_after"), payload.get("created_before"))}
 
     def _revoke_license(self, payload: Dict) -> Dict:
         require_keys(payload, ["license_id"])
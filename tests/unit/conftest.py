@@ -0,0 +1,62 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Lambda code imports its modules relative to src/ (the asset root)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+# boto3 clients are created at import time; no AWS calls are made by these tests
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-west-2")
+
+from helpers.app_logic_helpers.analytics_helper import AnalyticsHelper  # noqa: E402
+from helpers.app_logic_helpers.content_helper import ContentHelper  # noqa: E402
+from helpers.app_logic_helpers.usage_stats_helper import UsageStatsHelper  # noqa: E402
+from helpers.aws_service_helpers.dynamodb_helper import TransactionConditionFailedError  # noqa: E402
+
+
+class InMemoryStatsTable:
+    """Stands in for DynamoDBHelper on the usage_stats table, with its transaction semantics"""
+
+    def __init__(self):
+        self.items = {}
+        self.fail_next_transaction = False
+
+    def transact_write_items(self, absent_items, increments):
+        existing = [item for item in absent_items if (item["stats_key"], item["stats_sk"]) in self.items]
+        if existing:
+            raise TransactionConditionFailedError("items exist", existing)
+        if self.fail_next_transaction:
+            self.fail_next_transaction = False
+            raise RuntimeError("transaction failed")
+        for item in absent_items:
+            self.items[(item["stats_key"], item["stats_sk"])] = dict(item)
+        for key, amounts in increments:
+            item = self.items.setdefault((key["stats_key"], key["stats_sk"]), dict(key))
+            for name, amount in amounts.items():
+                item[name] = item.get(name, 0) + amount
+
+    def put_item(self, item):
+        self.items[(item["stats_key"], item["stats_sk"])] = dict(item)
+
+    def get_item(self, key):
+        return self.items.get((key["stats_key"], key["stats_sk"]))
+
+
+@pytest.fixture
+def usage_stats_helper():
+    helper = UsageStatsHelper()
+    helper.db = InMemoryStatsTable()
+    return helper
+
+
+@pytest.fixture
+def analytics_helper():
+    return AnalyticsHelper()
+
+
+@pytest.fixture
+def content_helper():
+    # Creating the table resources makes no AWS calls
+    return ContentHelper()
@@ -0,0 +1,34 @@
+from config.api_routes import ApiRoute, KnowlioApiRouteTrie, KnowlioApiRoutes
+
+
+def test_resolve_extracts_path_parameters():
+    route, params = KnowlioApiRoutes.resolve("PATCH", "content/c-1/attribute/title")
+    assert route.action == "update_content_attribute"
+    assert params == {"content_id": "c-1", "attribute": "title"}
+
+
+def test_literal_segments_take_precedence_over_parameters():
+    route, params = KnowlioApiRoutes.resolve("POST", "users/search")
+    assert route.action == "search_users"
+    assert params == {}
+
+    route, params = KnowlioApiRoutes.resolve("GET", "books/author/Martin")
+    assert route.action == "get_books_by_author"
+    assert params == {"author_name": "Martin"}
+
+
+def test_falls_back_to_parameter_when_literal_branch_has_no_method():
+    trie = KnowlioApiRouteTrie((
+        ApiRoute(method="POST", path="items/search", processor_name="p", action="search", description=""),
+        ApiRoute(method="GET", path="items/{item_id}", processor_name="p", action="get", description="",
+                 path_parameters=("item_id",)),
+    ))
+    route, params = trie.resolve("GET", "items/search")
+    assert route.action == "get"
+    assert params == {"item_id": "search"}
+
+
+def test_unknown_paths_and_methods_do_not_resolve():
+    assert KnowlioApiRoutes.resolve("GET", "nope") is None
+    assert KnowlioApiRoutes.resolve("DELETE", "users/u-1") is None
+    assert KnowlioApiRoutes.resolve("GET", "users/u-1/extra/segments") is None
@@ -0,0 +1,59 @@
+from boto3.dynamodb.conditions import ConditionExpressionBuilder
+
+
+def _build(expression):
+    built = ConditionExpressionBuilder().build_expression(expression)
+    return (built.condition_expression, set(built.attribute_name_placeholders.values()),
+            set(built.attribute_value_placeholders.values()))
+
+
+def test_tags_match_case_insensitively(content_helper):
+    predicate = content_helper._compile_predicate({"tags": ["ML"]})
+    assert predicate({"tags": ["ml", "ai"], "tags_lc": ["ml", "ai"]})
+    assert predicate({"tags": ["Ml"]})  # written before tags_lc existed
+    assert not predicate({"tags": ["mlops"], "tags_lc": ["mlops"]})
+    assert not predicate({"title": "no tags"})
+
+
+def test_tags_any_match(content_helper):
+    predicate = content_helper._compile_predicate({"tags": ["python", "rust"]})
+    assert predicate({"tags_lc": ["rust"]})
+    assert not predicate({"tags_lc": ["go"]})
+
+
+def test_title_matches_partially_on_lowercased_copy(content_helper):
+    predicate = content_helper._compile_predicate({"title": "Clean"})
+    assert predicate({"title": "Clean Code", "title_lc": "clean code"})
+    assert predicate({"title": "Unclean Code"})
+    assert not predicate({"title": "Refactoring", "title_lc": "refactoring"})
+
+
+def test_metadata_fields_all_must_match(content_helper):
+    predicate = content_helper._compile_predicate({"metadata.author": "martin", "metadata.year": 2008})
+    assert predicate({"metadata": {"author": "Robert C. Martin", "year": 2008}})
+    assert not predicate({"metadata": {"author": "Robert C. Martin", "year": 2009}})
+    assert not predicate({"metadata": {"year": 2008}})
+    assert not predicate({})
+
+
+def test_filter_expression_moves_exact_fields_out_of_search_params(content_helper):
+    search_params = {"type": "BOOK", "status": "ACTIVE", "title": "Clean"}
+    expression, names, values = _build(content_helper._pop_filter_expression(search_params))
+    assert search_params == {"title": "Clean"}
+    assert {"type", "status", "title_lc"} <= names
+    assert {"BOOK", "ACTIVE", "clean"} <= values
+
+
+def test_filter_expression_matches_tags_on_lowercased_copy(content_helper):
+    search_params = {"tags": ["ML", "AI"]}
+    expression, names, values = _build(content_helper._pop_filter_expression(search_params))
+    # Tags stay for the predicate, which also covers items without tags_lc
+    assert search_params == {"tags": ["ML", "AI"]}
+    assert names == {"tags_lc"}
+    assert values == {"ml", "ai"}
+    assert "attribute_not_exists" in expression
+
+
+def test_filter_expression_is_none_without_criteria(content_helper):
+    assert content_helper._pop_filter_expression({}) is None
+
@@ -0,0 +1,71 @@
+import pytest
+
+from helpers.app_logic_helpers.content_helper import ContentHelper, ContentValidationError
+from helpers.aws_service_helpers.dynamodb_helper import ConditionFailedError
+
+
+class RecordingTable:
+    """Stands in for DynamoDBHelper, appending each call to a log shared by both tables"""
+
+    def __init__(self, name, calls, old_item=None):
+        self.name = name
+        self.calls = calls
+        self.old_item = old_item
+
+    def batch_write_items(self, items):
+        self.calls.append((self.name, "put", {item["tag"] for item in items}))
+
+    def batch_delete_items(self, keys):
+        self.calls.append((self.name, "delete", {key["tag"] for key in keys}))
+
+    def update_item(self, key_name, key_value, updates, condition_expression=None, return_values="ALL_NEW"):
+        self.calls.append((self.name, "update", return_values))
+        if self.old_item is None:
+            raise ConditionFailedError("content_id does not exist")
+        return dict(self.old_item)
+
+
+@pytest.fixture
+def calls():
+    return []
+
+
+def _with_tables(content_helper, calls, old_item):
+    content_helper.db = RecordingTable("content", calls, old_item)
+    content_helper.tags_db = RecordingTable("content_tags", calls)
+    return content_helper
+
+
+def test_indexable_tags_are_lowercased_non_empty_strings():
+    assert ContentHelper._indexable_tags(["ML", "ml", "", 3, "AI"]) == {"ml", "ai"}
+    assert ContentHelper._indexable_tags("Python") == {"python"}
+    assert ContentHelper._indexable_tags({"ml", "ai"}) == {"ml", "ai"}
+
+
+def test_new_tag_rows_are_added_before_the_update_and_removed_ones_after(content_helper, calls):
+    helper = _with_tables(content_helper, calls, {"content_id": "c-1", "tags": ["ML", "Python"]})
+    updated = helper.update_content_metadata("c-1", {"tags": ["ml", "Rust"]})
+
+    assert calls == [
+        ("content_tags", "put", {"ml", "rust"}),
+        ("content", "update", "ALL_OLD"),
+        ("content_tags", "delete", {"python"}),
+    ]
+    assert updated["tags"] == ["ml", "Rust"]
+    assert updated["tags_lc"] == ["ml", "rust"]
+
+
+def test_missing_content_keeps_tag_rows(content_helper, calls):
+    helper = _with_tables(content_helper, calls, None)
+    with pytest.raises(ContentValidationError):
+        helper.update_content_metadata("c-1", {"tags": ["ML"]})
+
+    # The added rows point at no item, which search skips; nothing is deleted
+    assert [call[1] for call in calls] == ["put", "update"]
+
+
+def test_updates_without_tags_leave_tag_rows_alone(content_helper, calls):
+    helper = _with_tables(content_helper, calls, {"content_id": "c-1"})
+    helper.update_content_metadata("c-1", {"title": "Clean Code"})
+
+    assert calls == [("content", "update", "ALL_NEW")]
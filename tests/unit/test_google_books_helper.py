@@ -0,0 +1,45 @@
+import threading
+import time
+
+from helpers.app_logic_helpers.google_books_helper import GoogleBooksHelper
+
+
+def _recording_lookup(calls, delays):
+    lock = threading.Lock()
+
+    def get_book_details(isbn):
+        with lock:
+            calls.append(isbn)
+        time.sleep(delays.get(isbn, 0))
+        return {"isbn": isbn}
+
+    return get_book_details
+
+
+def test_results_are_in_input_order(monkeypatch):
+    helper = GoogleBooksHelper()
+    calls = []
+    # Earlier ISBNs finish last
+    monkeypatch.setattr(helper, "get_book_details", _recording_lookup(calls, {"1": 0.05, "2": 0.02}))
+
+    assert helper.get_book_details_many(["1", "2", "3"]) == [{"isbn": "1"}, {"isbn": "2"}, {"isbn": "3"}]
+    assert sorted(calls) == ["1", "2", "3"]
+
+
+def test_duplicates_are_fetched_once(monkeypatch):
+    helper = GoogleBooksHelper()
+    calls = []
+    monkeypatch.setattr(helper, "get_book_details", _recording_lookup(calls, {}))
+
+    results = helper.get_book_details_many(["1", "2", "1", "1"], max_workers=2)
+    assert results == [{"isbn": "1"}, {"isbn": "2"}, {"isbn": "1"}, {"isbn": "1"}]
+    assert sorted(calls) == ["1", "2"]
+
+
+def test_no_isbns_makes_no_requests(monkeypatch):
+    helper = GoogleBooksHelper()
+    calls = []
+    monkeypatch.setattr(helper, "get_book_details", _recording_lookup(calls, {}))
+
+    assert helper.get_book_details_many([]) == []
+    assert calls == []
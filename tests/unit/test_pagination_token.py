@@ -0,0 +1,24 @@
+import base64
+import json
+
+from helpers.common_helper.common_helper import decode_pagination_token, encode_pagination_token
+
+
+def test_round_trip():
+    key = {"content_id": "c-1", "created_at": "2024-01-01T00:00:00"}
+    assert decode_pagination_token(encode_pagination_token(key)) == key
+
+
+def test_tokens_are_url_safe_and_unpadded():
+    # Encodes to "...Pj4+PyJ9" in the standard alphabet
+    token = encode_pagination_token({"k": ">>>?"})
+    assert "-" in token
+    assert not set(token) & {"+", "/", "="}
+
+
+def test_decodes_padded_standard_alphabet_tokens():
+    # Tokens issued before they were made URL-safe: "...ImE+Pj8ifQ=="
+    key = {"user_id": "a>>?"}
+    legacy_token = base64.b64encode(json.dumps(key).encode()).decode()
+    assert legacy_token.endswith("==") and "+" in legacy_token
+    assert decode_pagination_token(legacy_token) == key
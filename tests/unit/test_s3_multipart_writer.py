@@ -0,0 +1,67 @@
+import pytest
+
+from helpers.aws_service_helpers.s3_helper import S3MultipartWriter
+
+
+class RecordingS3Helper:
+    """Stands in for S3Helper, recording the uploads S3MultipartWriter makes"""
+
+    bucket_name = "test-bucket"
+
+    def __init__(self):
+        self.put = None
+        self.parts = {}
+        self.completed = None
+        self.aborted = False
+
+    def put_data(self, data, key, content_type="application/octet-stream"):
+        self.put = data
+        return f"s3://{self.bucket_name}/{key}"
+
+    def initiate_multipart_upload(self, key, content_type="application/octet-stream"):
+        return {"upload_id": "upload-1"}
+
+    def upload_part(self, key, upload_id, part_number, data):
+        self.parts[part_number] = data
+        return {"PartNumber": part_number, "ETag": f"etag-{part_number}"}
+
+    def complete_multipart_upload(self, key, upload_id, parts):
+        self.completed = parts
+
+    def abort_multipart_upload(self, key, upload_id):
+        self.aborted = True
+
+
+def test_small_output_is_a_single_put():
+    s3 = RecordingS3Helper()
+    with S3MultipartWriter(s3, "export.jsonl", "application/jsonl", part_size=10) as writer:
+        writer.write(b"abc")
+        writer.write(b"def")
+
+    assert s3.put == b"abcdef"
+    assert s3.parts == {}
+    assert writer.url == "s3://test-bucket/export.jsonl"
+
+
+def test_output_is_split_into_ordered_parts():
+    s3 = RecordingS3Helper()
+    data = bytes(range(256)) * 3
+    with S3MultipartWriter(s3, "export.jsonl", "application/jsonl", part_size=100) as writer:
+        for start in range(0, len(data), 37):
+            writer.write(data[start:start + 37])
+
+    assert s3.put is None
+    assert [part["PartNumber"] for part in s3.completed] == list(range(1, 9))
+    assert b"".join(s3.parts[number] for number in sorted(s3.parts)) == data
+    assert all(len(s3.parts[number]) == 100 for number in range(1, 8))
+
+
+def test_error_in_block_aborts_upload():
+    s3 = RecordingS3Helper()
+    with pytest.raises(ValueError):
+        with S3MultipartWriter(s3, "export.jsonl", "application/jsonl", part_size=4) as writer:
+            writer.write(b"12345678")
+            raise ValueError("export failed")
+
+    assert s3.aborted
+    assert s3.completed is None
@@ -0,0 +1,127 @@
+import threading
+import uuid
+
+import orjson
+import pytest
+from boto3.dynamodb.conditions import Attr
+
+from helpers.app_logic_helpers.analytics_helper import (
+    EXPORT_BUCKET,
+    USAGE_LOG_ACCESS_TIME_INDEX,
+    USAGE_LOG_SHARD_PREFIX,
+    USAGE_LOG_SHARDS,
+    usage_log_shard_key,
+)
+from helpers.aws_service_helpers.s3_helper import S3Helper
+
+
+class ShardedLogTable:
+    """Stands in for DynamoDBHelper on usage_logs_v2, holding logs under their shard_pk"""
+
+    def __init__(self, logs=()):
+        self.items = {}
+        self.queried = []
+        self._lock = threading.Lock()
+        for log in logs:
+            self.put_item(log)
+
+    def put_item(self, item):
+        self.items[(item["shard_pk"], item["log_id"])] = dict(item)
+
+    def get_item(self, key):
+        return self.items.get((key["shard_pk"], key["log_id"]))
+
+    def iter_partition_pages(self, key_name, key_value, index_name=None, range_key_name=None,
+                             range_start=None, range_end=None, filter_expression=None, prefetch=False):
+        assert key_name == "shard_pk"
+        with self._lock:
+            self.queried.append((key_value, index_name, range_key_name, range_start, range_end, filter_expression))
+        logs = sorted((log for (shard_pk, _), log in self.items.items() if shard_pk == key_value),
+                      key=lambda log: log["access_time"])
+        if range_key_name:
+            logs = [log for log in logs
+                    if (range_start is None or range_start <= log[range_key_name])
+                    and (range_end is None or log[range_key_name] <= range_end)]
+        # Two logs per page, so shards span several pages
+        for start in range(0, len(logs), 2):
+            yield logs[start:start + 2]
+
+    def query_partition(self, key_name, key_value, **query_kwargs):
+        return [log for page in self.iter_partition_pages(key_name, key_value, **query_kwargs) for log in page]
+
+
+class RecordingExportBucket(S3Helper):
+    """S3Helper that keeps single-request uploads in memory instead of calling S3"""
+
+    def __init__(self):
+        super().__init__(bucket_name=EXPORT_BUCKET)
+        self.uploads = {}
+
+    def put_data(self, data, key, content_type="application/octet-stream"):
+        self.uploads[key] = data
+        return f"s3://{self.bucket_name}/{key}"
+
+
+def _log(access_time, **fields):
+    log_id = str(uuid.uuid4())
+    return {"log_id": log_id, "shard_pk": usage_log_shard_key(log_id), "access_time": access_time, **fields}
+
+
+def test_shard_key_is_stable_and_in_range():
+    log_id = str(uuid.uuid4())
+    shard_pk = usage_log_shard_key(log_id)
+    assert shard_pk == usage_log_shard_key(log_id)
+    assert shard_pk.startswith(USAGE_LOG_SHARD_PREFIX)
+    assert 0 <= int(shard_pk[len(USAGE_LOG_SHARD_PREFIX):]) < USAGE_LOG_SHARDS
+
+
+def test_random_log_ids_spread_over_every_shard():
+    shard_keys = {usage_log_shard_key(str(uuid.uuid4())) for _ in range(50 * USAGE_LOG_SHARDS)}
+    assert shard_keys == {f"{USAGE_LOG_SHARD_PREFIX}{shard}" for shard in range(USAGE_LOG_SHARDS)}
+
+
+def test_shard_key_rejects_non_uuid_log_ids():
+    with pytest.raises(ValueError):
+        usage_log_shard_key("not-a-uuid")
+
+
+def test_log_is_fetched_from_its_shard_by_id_alone(analytics_helper):
+    log = _log("2024-01-01T00:00:00")
+    analytics_helper.db = ShardedLogTable([log])
+
+    assert analytics_helper.get_log_by_id(log["log_id"]) == log
+    assert analytics_helper.get_log_by_id("not-a-uuid") is None
+
+
+def test_reads_query_every_shard_once(analytics_helper):
+    logs = [_log(f"2024-01-{day:02d}T00:00:00") for day in range(1, 29)]
+    analytics_helper.db = ShardedLogTable(logs)
+
+    read = analytics_helper._query_all_shards()
+    assert sorted(log["log_id"] for log in read) == sorted(log["log_id"] for log in logs)
+    assert sorted(query[0] for query in analytics_helper.db.queried) == sorted(
+        f"{USAGE_LOG_SHARD_PREFIX}{shard}" for shard in range(USAGE_LOG_SHARDS))
+
+
+def test_export_queries_each_shard_for_the_date_range(analytics_helper):
+    logs = [_log(f"2024-01-{day:02d}T00:00:00", region="eu" if day % 2 else "us") for day in range(1, 29)]
+    analytics_helper.db = ShardedLogTable(logs)
+    analytics_helper.s3 = RecordingExportBucket()
+
+    result = analytics_helper.export_usage_logs({
+        "from_date": "2024-01-10T00:00:00", "to_date": "2024-01-19T23:59:59", "region": "eu",
+    })
+
+    expected_shards = sorted(f"{USAGE_LOG_SHARD_PREFIX}{shard}" for shard in range(USAGE_LOG_SHARDS))
+    assert sorted(query[0] for query in analytics_helper.db.queried) == expected_shards
+    expected_query = (USAGE_LOG_ACCESS_TIME_INDEX, "access_time", "2024-01-10T00:00:00", "2024-01-19T23:59:59",
+                      Attr("region").eq("eu"))
+    assert all(query[1:] == expected_query for query in analytics_helper.db.queried)
+
+    # The region filter is applied by DynamoDB; the fake table only bounds the range
+    (export,) = analytics_helper.s3.uploads.values()
+    exported = [orjson.loads(line) for line in export.splitlines()]
+    assert sorted(log["access_time"] for log in exported) == [
+        f"2024-01-{day:02d}T00:00:00" for day in range(10, 20)]
+    assert result["total_records"] == len(exported)
+    assert result["export_location"].startswith(f"s3://{EXPORT_BUCKET}/usage-logs/")
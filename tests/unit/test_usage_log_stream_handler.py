@@ -0,0 +1,84 @@
+import base64
+import json
+from decimal import Decimal
+
+import pytest
+
+from handlers import usage_log_stream_handler
+
+
+class RecordingLogTable:
+    """Stands in for DynamoDBHelper on usage_logs_v2"""
+
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.written = []
+
+    def batch_write_items(self, items):
+        if self.fail:
+            raise RuntimeError("batch write failed")
+        self.written.extend(items)
+
+
+class FailingStats:
+    """Stands in for UsageStatsHelper, failing on one log"""
+
+    def __init__(self, failing_log_id):
+        self.failing_log_id = failing_log_id
+        self.counted = []
+
+    def record_log(self, log):
+        if log["log_id"] == self.failing_log_id:
+            raise RuntimeError("transaction failed")
+        self.counted.append(log["log_id"])
+        return True
+
+
+def _event(*logs):
+    return {"Records": [
+        {"kinesis": {"data": base64.b64encode(json.dumps(log).encode()).decode(), "sequenceNumber": f"seq-{position}"}}
+        for position, log in enumerate(logs)
+    ]}
+
+
+def _logs(count):
+    return [{"log_id": str(position), "content_id": "c-1", "consumer_id": "u-1"} for position in range(count)]
+
+
+@pytest.fixture
+def table(monkeypatch):
+    table = RecordingLogTable()
+    monkeypatch.setattr(usage_log_stream_handler, "_db", table)
+    return table
+
+
+def test_batch_is_written_and_counted(monkeypatch, table, usage_stats_helper):
+    monkeypatch.setattr(usage_log_stream_handler, "_stats", usage_stats_helper)
+    logs = _logs(3)
+    logs[0]["metadata"] = {"score": 0.5}
+
+    assert usage_log_stream_handler.lambda_handler(_event(*logs), None) == {"batchItemFailures": []}
+    assert [item["log_id"] for item in table.written] == ["0", "1", "2"]
+    assert table.written[0]["metadata"]["score"] == Decimal("0.5")
+    assert usage_stats_helper.get_stats("content_id", "c-1")["total_accesses"] == 3
+
+
+def test_write_failure_retries_the_whole_batch(monkeypatch, table):
+    table.fail = True
+    stats = FailingStats(failing_log_id=None)
+    monkeypatch.setattr(usage_log_stream_handler, "_stats", stats)
+
+    result = usage_log_stream_handler.lambda_handler(_event(*_logs(3)), None)
+    assert result == {"batchItemFailures": [{"itemIdentifier": "seq-0"}]}
+    assert stats.counted == []
+
+
+@pytest.mark.parametrize("failing_position", [0, 1, 3])
+def test_counting_failure_retries_from_that_record(monkeypatch, table, failing_position):
+    stats = FailingStats(failing_log_id=str(failing_position))
+    monkeypatch.setattr(usage_log_stream_handler, "_stats", stats)
+
+    result = usage_log_stream_handler.lambda_handler(_event(*_logs(4)), None)
+    assert result == {"batchItemFailures": [{"itemIdentifier": f"seq-{failing_position}"}]}
+    assert stats.counted == [str(position) for position in range(failing_position)]
+    assert len(table.written) == 4
@@ -0,0 +1,75 @@
+from helpers.app_logic_helpers.usage_stats_helper import TOTALS_SK
+
+
+def _log(log_id, content_id="c-1", consumer_id="u-1", **fields):
+    return {"log_id": log_id, "content_id": content_id, "consumer_id": consumer_id, **fields}
+
+
+def test_counts_totals_uniques_and_breakdowns(usage_stats_helper):
+    helper = usage_stats_helper
+    helper.record_logs([
+        _log("1", consumer_id="u-1", access_type="DOWNLOAD", region="eu"),
+        _log("2", consumer_id="u-2", region="eu"),
+        _log("3", consumer_id="u-1"),
+    ])
+
+    assert helper.get_stats("content_id", "c-1") == {
+        "total_accesses": 3,
+        "unique_count": 2,
+        "access_type": {"DOWNLOAD": 1, "VIEW": 2},
+        "region": {"eu": 2, "UNKNOWN": 1},
+    }
+    assert helper.get_stats("consumer_id", "u-1")["total_accesses"] == 2
+    assert helper.get_stats("consumer_id", "u-1")["unique_count"] == 1
+    assert helper.get_stats("content_id", "c-2") is None
+
+
+def test_redelivered_logs_are_counted_once(usage_stats_helper):
+    helper = usage_stats_helper
+    logs = [_log("1"), _log("2", consumer_id="u-2")]
+    helper.record_logs(logs)
+    helper.record_logs(logs)
+    helper.record_logs(logs[:1])
+
+    stats = helper.get_stats("content_id", "c-1")
+    assert stats["total_accesses"] == 2
+    assert stats["unique_count"] == 2
+
+
+def test_failed_transaction_leaves_log_to_be_counted_on_retry(usage_stats_helper):
+    helper = usage_stats_helper
+    helper.db.fail_next_transaction = True
+    try:
+        helper.record_log(_log("1"))
+    except RuntimeError:
+        pass
+    assert helper.get_stats("content_id", "c-1") is None
+
+    assert helper.record_log(_log("1"))
+    stats = helper.get_stats("content_id", "c-1")
+    assert stats["total_accesses"] == 1
+    assert stats["unique_count"] == 1
+
+
+def test_repeat_member_is_not_counted_as_unique_again(usage_stats_helper):
+    helper = usage_stats_helper
+    helper.record_log(_log("1", content_id="c-1"))
+    helper.record_log(_log("2", content_id="c-2"))
+
+    consumer_totals = helper.db.items[("consumer_id#u-1", TOTALS_SK)]
+    assert consumer_totals["total_accesses"] == 2
+    assert consumer_totals["unique_count"] == 2
+    # c-1 and c-2 each have u-1 as their only unique consumer
+    assert helper.get_stats("content_id", "c-2")["unique_count"] == 1
+
+    helper.record_log(_log("3", content_id="c-2"))
+    assert helper.get_stats("content_id", "c-2") == {
+        "total_accesses": 2, "unique_count": 1, "access_type": {"VIEW": 2}, "region": {"UNKNOWN": 2},
+    }
+
+
+def test_backfill_marker(usage_stats_helper):
+    helper = usage_stats_helper
+    assert not helper.is_backfilled()
+    helper.mark_backfilled()
+    assert helper.is_backfilled()